@@ -0,0 +1,189 @@
+import asyncio
+import json
+import math
+import time
+from collections import deque
+from typing import Dict, Optional, Tuple
+from app.config import settings
+
+# First matching prefix wins; unmatched paths are not limited.
+ROUTE_GROUPS: Tuple[Tuple[str, str], ...] = (
+    ("/reservations", "writes"),
+    ("/movies", "reads"),
+    ("/showtimes", "reads"),
+    ("/batch", "reads"),
+    ("/admin", "admin"),
+)
+
+# Served regardless of load: health checks must answer while everything else
+# is shed, and SSE streams hold their connection for minutes but a worker
+# thread only for the initial snapshot.
+EXEMPT_PATHS = frozenset({"/health"})
+EXEMPT_SUFFIXES = ("/seat-events",)
+
+
+class AdmissionGroup:
+    """Concurrency limit with a bounded FIFO wait queue.
+
+    Runs on the event loop, before a request reaches the threadpool: at most
+    ``limit`` requests of the group are in flight, ``queue_size`` more wait up
+    to ``queue_timeout`` seconds for a slot, and the rest are rejected at once.
+    """
+
+    def __init__(self, name: str, limit: int, queue_size: int, queue_timeout: float):
+        self.name = name
+        self.limit = limit
+        self.queue_size = queue_size
+        self.queue_timeout = queue_timeout
+        self.active = 0
+        self._waiters: deque = deque()
+        self.admitted = 0
+        self.queued = 0
+        self.rejected_queue_full = 0
+        self.rejected_timeout = 0
+        self.max_wait = 0.0
+
+    async def acquire(self) -> bool:
+        if self.active < self.limit and not self._waiters:
+            self.active += 1
+            self.admitted += 1
+            return True
+        if len(self._waiters) >= self.queue_size:
+            self.rejected_queue_full += 1
+            return False
+
+        waiter = asyncio.get_running_loop().create_future()
+        self._waiters.append(waiter)
+        self.queued += 1
+        started = time.monotonic()
+        try:
+            await asyncio.wait_for(waiter, self.queue_timeout)
+        except asyncio.TimeoutError:
+            self.rejected_timeout += 1
+            return False
+        except asyncio.CancelledError:
+            # Client went away; a slot handed over meanwhile must go on.
+            if waiter.done() and not waiter.cancelled():
+                self.release()
+            raise
+        finally:
+            if waiter in self._waiters:
+                self._waiters.remove(waiter)
+            self.max_wait = max(self.max_wait, time.monotonic() - started)
+
+        self.admitted += 1
+        return True
+
+    def release(self) -> None:
+        # The slot passes straight to the oldest live waiter, so ``active``
+        # only drops when nobody is queued.
+        while self._waiters:
+            waiter = self._waiters.popleft()
+            if not waiter.done():
+                waiter.set_result(None)
+                return
+        self.active -= 1
+
+    def stats(self) -> dict:
+        return {
+            "limit": self.limit,
+            "queue_size": self.queue_size,
+            "active": self.active,
+            "waiting": len(self._waiters),
+            "admitted": self.admitted,
+            "queued": self.queued,
+            "rejected_queue_full": self.rejected_queue_full,
+            "rejected_timeout": self.rejected_timeout,
+            "max_wait_ms": round(self.max_wait * 1000, 3),
+        }
+
+
+class AdmissionController:
+    def __init__(self, groups: Dict[str, AdmissionGroup], retry_after: float):
+        self.groups = groups
+        self.retry_after = retry_after
+
+    @classmethod
+    def from_settings(cls) -> "AdmissionController":
+        timeout = settings.ADMISSION_QUEUE_TIMEOUT_SECONDS
+        return cls(
+            {
+                "writes": AdmissionGroup(
+                    "writes",
+                    settings.ADMISSION_WRITE_LIMIT,
+                    settings.ADMISSION_WRITE_QUEUE,
+                    timeout,
+                ),
+                "reads": AdmissionGroup(
+                    "reads",
+                    settings.ADMISSION_READ_LIMIT,
+                    settings.ADMISSION_READ_QUEUE,
+                    timeout,
+                ),
+                "admin": AdmissionGroup(
+                    "admin",
+                    settings.ADMISSION_ADMIN_LIMIT,
+                    settings.ADMISSION_ADMIN_QUEUE,
+                    timeout,
+                ),
+            },
+            retry_after=settings.ADMISSION_RETRY_AFTER_SECONDS,
+        )
+
+    def group_for(self, path: str) -> Optional[AdmissionGroup]:
+        if path in EXEMPT_PATHS or path.endswith(EXEMPT_SUFFIXES):
+            return None
+        for prefix, name in ROUTE_GROUPS:
+            if path == prefix or path.startswith(prefix + "/"):
+                return self.groups.get(name)
+        return None
+
+    def stats(self) -> dict:
+        return {name: group.stats() for name, group in self.groups.items()}
+
+
+admission_controller = AdmissionController.from_settings()
+
+
+class AdmissionMiddleware:
+    def __init__(self, app, controller: AdmissionController = admission_controller):
+        self.app = app
+        self.controller = controller
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        group = self.controller.group_for(scope["path"])
+        if group is None:
+            await self.app(scope, receive, send)
+            return
+
+        if not await group.acquire():
+            await self._reject(send, group)
+            return
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            group.release()
+
+    async def _reject(self, send, group: AdmissionGroup) -> None:
+        body = json.dumps(
+            {"detail": f"Server is overloaded ({group.name}), retry later"}
+        ).encode()
+        await send(
+            {
+                "type": "http.response.start",
+                "status": 503,
+                "headers": [
+                    (b"content-type", b"application/json"),
+                    (b"content-length", str(len(body)).encode()),
+                    (
+                        b"retry-after",
+                        str(math.ceil(self.controller.retry_after)).encode(),
+                    ),
+                ],
+            }
+        )
+        await send({"type": "http.response.body", "body": body})
@@ -0,0 +1,409 @@
+import pickle
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Iterable, Optional
+from app.config import settings
+from app.invalidation import RESET_TOPIC, InvalidationEvent, invalidation_bus
+
+
+class CacheMetrics:
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.sets = 0
+        self.evictions = 0
+        self.invalidations = 0
+        self.discarded_sets = 0
+
+    def record(self, **counts: int) -> None:
+        with self._lock:
+            for name, value in counts.items():
+                setattr(self, name, getattr(self, name) + value)
+
+    def snapshot(self) -> dict:
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_ratio": round(self.hits / lookups, 4) if lookups else None,
+            "sets": self.sets,
+            "evictions": self.evictions,
+            "invalidations": self.invalidations,
+            "discarded_sets": self.discarded_sets,
+        }
+
+
+class CacheBackend(ABC):
+    """Key/value cache with TTLs and tag-based invalidation.
+
+    ``None`` is not cacheable: it is what get() returns on a miss. Cached
+    values are shared between callers and must be treated as immutable.
+
+    Every tag has a generation that invalidate_tags() bumps (clear() bumps
+    them all). A loader that read the database before an invalidation can
+    finish after it; passing the generations taken before loading to set()
+    makes it drop such a value instead of caching it for the whole TTL.
+    """
+
+    name = "base"
+    # Shared backends are visible to every worker, so one worker's
+    # invalidation is enough; in-process ones need every worker to act.
+    shared = False
+
+    def __init__(self, default_ttl: Optional[float] = None):
+        self.default_ttl = default_ttl
+        self.metrics = CacheMetrics()
+
+    @abstractmethod
+    def get(self, key: str) -> Any: ...
+
+    @abstractmethod
+    def get_many(self, keys: Iterable[str]) -> Dict[str, Any]: ...
+
+    @abstractmethod
+    def set(
+        self,
+        key: str,
+        value: Any,
+        ttl: Optional[float] = None,
+        tags: Iterable[str] = (),
+        generations: Optional[tuple] = None,
+    ) -> None: ...
+
+    @abstractmethod
+    def generations(self, tags: Iterable[str]) -> tuple: ...
+
+    @abstractmethod
+    def delete(self, key: str) -> None: ...
+
+    @abstractmethod
+    def invalidate_tags(self, *tags: str) -> int: ...
+
+    @abstractmethod
+    def clear(self) -> None: ...
+
+    def size(self) -> Optional[int]:
+        return None
+
+    def get_or_load(
+        self,
+        key: str,
+        loader: Callable[[], Any],
+        ttl: Optional[float] = None,
+        tags: Iterable[str] = (),
+    ) -> Any:
+        value = self.get(key)
+        if value is None:
+            generations = self.generations(tags)
+            value = loader()
+            if value is not None:
+                self.set(key, value, ttl, tags, generations)
+        return value
+
+    def stats(self) -> dict:
+        return {"backend": self.name, "size": self.size(), **self.metrics.snapshot()}
+
+
+class NullCache(CacheBackend):
+    name = "none"
+
+    def get(self, key):
+        self.metrics.record(misses=1)
+        return None
+
+    def get_many(self, keys):
+        self.metrics.record(misses=len(list(keys)))
+        return {}
+
+    def set(self, key, value, ttl=None, tags=(), generations=None):
+        pass
+
+    def generations(self, tags):
+        return ()
+
+    def delete(self, key):
+        pass
+
+    def invalidate_tags(self, *tags):
+        return 0
+
+    def clear(self):
+        pass
+
+
+class MemoryCache(CacheBackend):
+    """Bounded in-process LRU; expired entries are dropped lazily on access.
+
+    Tag generations live in a fixed array of counters indexed by tag hash,
+    so they take constant memory however many tags are seen; two tags
+    sharing a counter only cost an occasional discarded set.
+    """
+
+    name = "memory"
+
+    def __init__(
+        self,
+        max_entries: int = 1024,
+        default_ttl: Optional[float] = None,
+        generation_slots: int = 4096,
+    ):
+        super().__init__(default_ttl)
+        self.max_entries = max_entries
+        self._lock = threading.Lock()
+        self._entries: "OrderedDict[str, tuple]" = OrderedDict()
+        self._tags: Dict[str, set] = {}
+        self._epoch = 0
+        self._generations = [0] * generation_slots
+
+    def _generations_of(self, tags: Iterable[str]) -> tuple:
+        slots = len(self._generations)
+        return (self._epoch, *(self._generations[hash(tag) % slots] for tag in tags))
+
+    def _lookup(self, key: str, now: float) -> Any:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        expires_at, value, _ = entry
+        if expires_at is not None and expires_at <= now:
+            self._remove(key)
+            return None
+        self._entries.move_to_end(key)
+        return value
+
+    def _remove(self, key: str) -> None:
+        _, _, tags = self._entries.pop(key)
+        for tag in tags:
+            keys = self._tags.get(tag)
+            if keys is not None:
+                keys.discard(key)
+                if not keys:
+                    del self._tags[tag]
+
+    def get(self, key):
+        with self._lock:
+            value = self._lookup(key, time.monotonic())
+        self.metrics.record(**{"hits" if value is not None else "misses": 1})
+        return value
+
+    def get_many(self, keys):
+        now = time.monotonic()
+        found = {}
+        keys = list(keys)
+        with self._lock:
+            for key in keys:
+                value = self._lookup(key, now)
+                if value is not None:
+                    found[key] = value
+        self.metrics.record(hits=len(found), misses=len(keys) - len(found))
+        return found
+
+    def generations(self, tags):
+        with self._lock:
+            return self._generations_of(tags)
+
+    def set(self, key, value, ttl=None, tags=(), generations=None):
+        ttl = self.default_ttl if ttl is None else ttl
+        expires_at = None if ttl is None else time.monotonic() + ttl
+        tags = tuple(tags)
+        evicted = 0
+        with self._lock:
+            if generations is not None and generations != self._generations_of(tags):
+                self.metrics.record(discarded_sets=1)
+                return
+            tags = frozenset(tags)
+            if key in self._entries:
+                self._remove(key)
+            self._entries[key] = (expires_at, value, tags)
+            for tag in tags:
+                self._tags.setdefault(tag, set()).add(key)
+            while len(self._entries) > self.max_entries:
+                self._remove(next(iter(self._entries)))
+                evicted += 1
+        self.metrics.record(sets=1, evictions=evicted)
+
+    def delete(self, key):
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+
+    def invalidate_tags(self, *tags):
+        removed = 0
+        slots = len(self._generations)
+        with self._lock:
+            for tag in tags:
+                self._generations[hash(tag) % slots] += 1
+                for key in list(self._tags.get(tag, ())):
+                    self._remove(key)
+                    removed += 1
+        self.metrics.record(invalidations=removed)
+        return removed
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._tags.clear()
+            self._epoch += 1
+
+    def size(self):
+        return len(self._entries)
+
+
+class RedisCache(CacheBackend):
+    """Shared backend over any Redis-protocol client.
+
+    Values are pickled, so the server must be trusted. Each tag is a set of
+    the keys carrying it; its TTL is kept at least as long as its members'.
+    Tag generations are counters next to the tag sets, and a conditional
+    set() WATCHes them so an invalidation from any worker discards it.
+    """
+
+    name = "redis"
+    shared = True
+
+    def __init__(
+        self, client, prefix: str = "cache:", default_ttl: Optional[float] = None
+    ):
+        super().__init__(default_ttl)
+        self.client = client
+        self.prefix = prefix
+
+    def _key(self, key: str) -> str:
+        return f"{self.prefix}{key}"
+
+    def _tag(self, tag: str) -> str:
+        return f"{self.prefix}tag:{tag}"
+
+    def _generation_keys(self, tags: Iterable[str]) -> list:
+        return [f"{self.prefix}epoch", *(f"{self.prefix}gen:{tag}" for tag in tags)]
+
+    def generations(self, tags):
+        return tuple(
+            int(raw or 0) for raw in self.client.mget(self._generation_keys(tags))
+        )
+
+    def get(self, key):
+        raw = self.client.get(self._key(key))
+        self.metrics.record(**{"hits" if raw is not None else "misses": 1})
+        return None if raw is None else pickle.loads(raw)
+
+    def get_many(self, keys):
+        keys = list(keys)
+        if not keys:
+            return {}
+        raws = self.client.mget([self._key(key) for key in keys])
+        found = {key: pickle.loads(raw) for key, raw in zip(keys, raws) if raw}
+        self.metrics.record(hits=len(found), misses=len(keys) - len(found))
+        return found
+
+    def set(self, key, value, ttl=None, tags=(), generations=None):
+        from redis.exceptions import WatchError
+
+        ttl = self.default_ttl if ttl is None else ttl
+        expire = None if ttl is None else max(1, int(ttl + 0.999))
+        tags = tuple(tags)
+        pipe = self.client.pipeline()
+        if generations is not None:
+            keys = self._generation_keys(tags)
+            pipe.watch(*keys)
+            if tuple(int(raw or 0) for raw in pipe.mget(keys)) != generations:
+                pipe.reset()
+                self.metrics.record(discarded_sets=1)
+                return
+            pipe.multi()
+        pipe.set(self._key(key), pickle.dumps(value), ex=expire)
+        for tag in tags:
+            pipe.sadd(self._tag(tag), key)
+            if expire is not None:
+                pipe.expire(self._tag(tag), expire, nx=True)
+                pipe.expire(self._tag(tag), expire, gt=True)
+        try:
+            pipe.execute()
+        except WatchError:
+            self.metrics.record(discarded_sets=1)
+            return
+        self.metrics.record(sets=1)
+
+    def delete(self, key):
+        self.client.delete(self._key(key))
+
+    def invalidate_tags(self, *tags):
+        if not tags:
+            return 0
+        # Generations are bumped in the same transaction that reads the tag
+        # sets: a conditional set() landing after it is discarded, one
+        # landing before it is in the sets and deleted below.
+        pipe = self.client.pipeline()
+        for tag in tags:
+            pipe.incr(f"{self.prefix}gen:{tag}")
+            # Far longer than any load; lets counters of idle tags go away.
+            pipe.expire(f"{self.prefix}gen:{tag}", 86400)
+            pipe.smembers(self._tag(tag))
+        members = set()
+        for keys in pipe.execute()[2::3]:
+            members.update(k.decode() if isinstance(k, bytes) else k for k in keys)
+
+        pipe = self.client.pipeline()
+        if members:
+            pipe.delete(*(self._key(key) for key in members))
+        pipe.delete(*(self._tag(tag) for tag in tags))
+        removed = pipe.execute()[0] if members else 0
+        self.metrics.record(invalidations=removed)
+        return removed
+
+    def clear(self):
+        # The epoch survives so that loads started before the clear are
+        # still discarded.
+        epoch = f"{self.prefix}epoch".encode()
+        keys = [
+            key
+            for key in self.client.scan_iter(match=f"{self.prefix}*")
+            if key != epoch
+        ]
+        if keys:
+            self.client.delete(*keys)
+        self.client.incr(epoch)
+
+    def size(self):
+        return None
+
+
+def build_cache() -> CacheBackend:
+    if settings.CACHE_BACKEND == "none":
+        return NullCache()
+    if settings.CACHE_BACKEND == "redis":
+        import redis
+
+        return RedisCache(
+            redis.Redis.from_url(settings.CACHE_REDIS_URL),
+            prefix=settings.CACHE_KEY_PREFIX,
+            default_ttl=settings.CACHE_DEFAULT_TTL_SECONDS,
+        )
+    return MemoryCache(
+        max_entries=settings.CACHE_MAX_ENTRIES,
+        default_ttl=settings.CACHE_DEFAULT_TTL_SECONDS,
+    )
+
+
+cache = build_cache()
+
+
+def _invalidate(event: InvalidationEvent) -> None:
+    # Entries are tagged with a topic ("movies") and/or a topic and key
+    # ("seats:12"); every change event clears both.
+    local = event.origin == invalidation_bus.origin
+    if cache.shared and not local:
+        return
+    if event.topic == RESET_TOPIC:
+        cache.clear()
+        return
+    tags = [event.topic]
+    if event.key is not None:
+        tags.append(f"{event.topic}:{event.key}")
+    cache.invalidate_tags(*tags)
+
+
+for topic in ("movies", "showtimes", "seats", "users"):
+    invalidation_bus.subscribe(topic, _invalidate)
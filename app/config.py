@@ -1,15 +1,98 @@
 from pydantic_settings import BaseSettings
 from pathlib import Path
+from typing import Literal, Optional
 
 BASE_DIR = Path(__file__).resolve().parent.parent
 
 
 class Settings(BaseSettings):
+    DEBUG: bool = False
+    N_PLUS_ONE_THRESHOLD: int = 5
+    SLOW_QUERY_THRESHOLD_MS: Optional[float] = 200.0
+    SLOW_QUERY_EXPLAIN: bool = True
+
     DATABASE_URL: str = "sqlite:///./movie_reservation.db"
+    DATABASE_ASYNC: bool = False
+    ASYNC_DATABASE_URL: Optional[str] = None
+    READ_DATABASE_URL: Optional[str] = None
+    SCHEMA_CHECK_ON_STARTUP: bool = True
+
+    DB_POOL_SIZE: int = 5
+    DB_MAX_OVERFLOW: int = 10
+    DB_POOL_TIMEOUT: float = 30.0
+    DB_POOL_RECYCLE: int = -1
+    DB_POOL_PRE_PING: bool = False
+
+    SQLITE_PRAGMAS_ENABLED: bool = True
+    SQLITE_JOURNAL_MODE: Literal[
+        "DELETE", "TRUNCATE", "PERSIST", "MEMORY", "WAL", "OFF"
+    ] = "WAL"
+    SQLITE_SYNCHRONOUS: Literal["OFF", "NORMAL", "FULL", "EXTRA"] = "NORMAL"
+    SQLITE_CACHE_SIZE: int = -65536
+    SQLITE_MMAP_SIZE: int = 268_435_456
+    SQLITE_BUSY_TIMEOUT_MS: int = 5000
+    SQLITE_TEMP_STORE: Literal["DEFAULT", "FILE", "MEMORY"] = "MEMORY"
 
     SECRET_KEY: str
     ALGORITHM: str = "HS256"
     ACCESS_TOKEN_EXPIRE_MINUTES: int = 30
+    REFRESH_TOKEN_EXPIRE_DAYS: int = 14
+
+    REVOCATION_BLOOM_CAPACITY: int = 100_000
+    REVOCATION_BLOOM_ERROR_RATE: float = 0.01
+    REVOCATION_SYNC_SECONDS: float = 5.0
+    REVOCATION_RELOAD_SECONDS: float = 300.0
+
+    SEAT_PUSH_INTERVAL_SECONDS: float = 0.5
+    SEAT_PUSH_QUEUE_SIZE: int = 32
+    SEAT_PUSH_HEARTBEAT_SECONDS: float = 15.0
+
+    INVALIDATION_BUS_ENABLED: bool = True
+    INVALIDATION_POLL_SECONDS: float = 0.2
+    INVALIDATION_RETENTION_SECONDS: float = 300.0
+
+    # Keep the summed limits under the threadpool size (40) so sync routes
+    # never queue invisibly inside it.
+    ADMISSION_CONTROL_ENABLED: bool = True
+    ADMISSION_WRITE_LIMIT: int = 8
+    ADMISSION_WRITE_QUEUE: int = 32
+    ADMISSION_READ_LIMIT: int = 24
+    ADMISSION_READ_QUEUE: int = 128
+    ADMISSION_ADMIN_LIMIT: int = 2
+    ADMISSION_ADMIN_QUEUE: int = 4
+    ADMISSION_QUEUE_TIMEOUT_SECONDS: float = 2.0
+    ADMISSION_RETRY_AFTER_SECONDS: float = 1.0
+
+    # Public movie reads: served as is for SWR_FRESH_SECONDS, then stale while
+    # one background refresh runs, or while the database is unavailable.
+    SWR_FRESH_SECONDS: float = 10.0
+    SWR_MAX_STALE_SECONDS: float = 300.0
+    SWR_REFRESH_WORKERS: int = 2
+
+    BATCH_MAX_REQUESTS: int = 20
+
+    ANALYTICS_CACHE_TTL_SECONDS: float = 60.0
+    ANALYTICS_MAX_PAGE_SIZE: int = 500
+    # Rows fetched per cursor round trip, and per CSV chunk / Parquet row group.
+    EXPORT_CHUNK_ROWS: int = 10_000
+
+    # Heavy admin reports run as background jobs in their own pool. In-flight
+    # jobs send a heartbeat every REPORT_JOB_HEARTBEAT_SECONDS; ones silent
+    # for REPORT_JOB_STALE_SECONDS are treated as abandoned.
+    REPORT_JOB_WORKERS: int = 2
+    REPORT_JOB_MAX_PENDING: int = 16
+    REPORT_JOB_RETRY_AFTER_SECONDS: float = 5.0
+    REPORT_JOB_HEARTBEAT_SECONDS: float = 10.0
+    REPORT_JOB_STALE_SECONDS: float = 60.0
+    REPORT_JOB_RETENTION_SECONDS: float = 86400.0
+    # Job results are written here; every worker must see the same directory.
+    REPORT_JOB_RESULTS_DIR: str = "report_results"
+
+    CACHE_BACKEND: Literal["memory", "redis", "none"] = "memory"
+    CACHE_MAX_ENTRIES: int = 10_000
+    CACHE_DEFAULT_TTL_SECONDS: Optional[float] = 30.0
+    CACHE_REDIS_URL: str = "redis://localhost:6379/0"
+    CACHE_KEY_PREFIX: str = "mr:cache:"
 
     class Config:
         env_file = str(BASE_DIR / ".env")
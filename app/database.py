@@ -1,17 +1,258 @@
-from sqlalchemy import create_engine
+import time
+from typing import Optional
+from fastapi import HTTPException, Request, status
+from sqlalchemy import create_engine, event
+from sqlalchemy.engine import Engine, make_url
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker
 from app.config import settings
+from app.pool_metrics import pool_metrics, route_label
+from app import slow_query  # noqa: F401  registers the slow-query engine hooks
 
-engine = create_engine(settings.DATABASE_URL)
+
+def is_sqlite_file(url: str) -> bool:
+    parsed = make_url(url)
+    return parsed.get_backend_name() == "sqlite" and parsed.database not in (
+        None,
+        "",
+        ":memory:",
+    )
+
+
+def get_pool_options(url: str) -> dict:
+    options = {
+        "pool_recycle": settings.DB_POOL_RECYCLE,
+        "pool_pre_ping": settings.DB_POOL_PRE_PING,
+    }
+
+    if make_url(url).get_backend_name() != "sqlite" or is_sqlite_file(url):
+        options.update(
+            pool_size=settings.DB_POOL_SIZE,
+            max_overflow=settings.DB_MAX_OVERFLOW,
+            pool_timeout=settings.DB_POOL_TIMEOUT,
+        )
+
+    return options
+
+
+def get_sqlite_pragmas() -> dict:
+    return {
+        "journal_mode": settings.SQLITE_JOURNAL_MODE,
+        "synchronous": settings.SQLITE_SYNCHRONOUS,
+        "cache_size": settings.SQLITE_CACHE_SIZE,
+        "mmap_size": settings.SQLITE_MMAP_SIZE,
+        "busy_timeout": settings.SQLITE_BUSY_TIMEOUT_MS,
+        "temp_store": settings.SQLITE_TEMP_STORE,
+    }
+
+
+def apply_sqlite_pragmas(dbapi_connection, connection_record):
+    cursor = dbapi_connection.cursor()
+    for name, value in get_sqlite_pragmas().items():
+        cursor.execute(f"PRAGMA {name}={value}")
+    cursor.close()
+
+
+def apply_sqlite_read_pragmas(dbapi_connection, connection_record):
+    cursor = dbapi_connection.cursor()
+    for name, value in get_sqlite_pragmas().items():
+        if name != "journal_mode":
+            cursor.execute(f"PRAGMA {name}={value}")
+    cursor.close()
+
+
+def configure_engine(engine: Engine, readonly: bool = False) -> Engine:
+    if engine.dialect.name == "sqlite" and settings.SQLITE_PRAGMAS_ENABLED:
+        event.listen(
+            engine,
+            "connect",
+            apply_sqlite_read_pragmas if readonly else apply_sqlite_pragmas,
+        )
+    return engine
+
+
+def get_read_database_url(url: str) -> Optional[str]:
+    if not is_sqlite_file(url):
+        return None
+
+    parsed = make_url(url)
+    database = parsed.database
+    if not database.startswith("file:"):
+        database = f"file:{database}"
+
+    return (
+        parsed.set(database=database)
+        .update_query_dict({"mode": "ro", "uri": "true"})
+        .render_as_string(hide_password=False)
+    )
+
+
+engine = configure_engine(
+    create_engine(settings.DATABASE_URL, **get_pool_options(settings.DATABASE_URL))
+)
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
+read_database_url = settings.READ_DATABASE_URL or get_read_database_url(
+    settings.DATABASE_URL
+)
+if read_database_url:
+    read_engine = configure_engine(
+        create_engine(read_database_url, **get_pool_options(read_database_url)),
+        readonly=True,
+    )
+else:
+    read_engine = engine
+ReadSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=read_engine)
+
 Base = declarative_base()
 
 
-def get_db():
-    db = SessionLocal()
+def get_async_database_url(url: str) -> str:
+    if url.startswith("sqlite:"):
+        return url.replace("sqlite:", "sqlite+aiosqlite:", 1)
+    return url
+
+
+async_engine = None
+AsyncSessionLocal = None
+
+if settings.DATABASE_ASYNC:
+    from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+    async_database_url = settings.ASYNC_DATABASE_URL or get_async_database_url(
+        settings.DATABASE_URL
+    )
+    async_engine = create_async_engine(
+        async_database_url, **get_pool_options(async_database_url)
+    )
+    configure_engine(async_engine.sync_engine)
+    AsyncSessionLocal = async_sessionmaker(
+        bind=async_engine, autoflush=False, expire_on_commit=False
+    )
+
+
+def pool_exhausted() -> HTTPException:
+    return HTTPException(
+        status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+        detail="Database connection pool exhausted",
+        headers={"Retry-After": "1"},
+    )
+
+
+def open_session(session_factory, request: Request):
+    db = session_factory()
+    route = route_label(request)
+    started = time.perf_counter()
+    try:
+        db.connection()
+    except PoolTimeoutError:
+        db.close()
+        pool_metrics.record_timeout(route)
+        raise pool_exhausted()
+    pool_metrics.record_wait(route, time.perf_counter() - started)
+    return db
+
+
+def get_db(request: Request):
+    db = open_session(SessionLocal, request)
+    try:
+        yield db
+    finally:
+        db.close()
+
+
+def get_read_db(request: Request):
+    db = open_session(ReadSessionLocal, request)
     try:
         yield db
     finally:
         db.close()
+
+
+def begin_snapshot(db) -> None:
+    """Makes the rest of the session's transaction read one snapshot.
+
+    pysqlite only opens a transaction before writes, so plain reads each see
+    the latest commit; an explicit BEGIN pins the snapshot taken by the
+    first read that follows. Other backends need REPEATABLE READ configured
+    on the engine for the same guarantee.
+    """
+    connection = db.connection()
+    if connection.dialect.name == "sqlite":
+        connection.exec_driver_sql("BEGIN")
+
+
+class LazySession:
+    """Checks a session out of the pool on first use.
+
+    Lets handlers that can answer from cache skip the pool entirely, and lets
+    them fall back to cached data when checkout fails.
+    """
+
+    def __init__(self, factory, request: Request):
+        self.factory = factory
+        self.request = request
+        self._db = None
+
+    def get(self):
+        if self._db is None:
+            self._db = open_session(self.factory, self.request)
+        return self._db
+
+    def close(self) -> None:
+        if self._db is not None:
+            self._db.close()
+            self._db = None
+
+
+class AsyncLazySession(LazySession):
+    async def get(self):
+        if self._db is None:
+            db = self.factory()
+            route = route_label(self.request)
+            started = time.perf_counter()
+            try:
+                await db.connection()
+            except PoolTimeoutError:
+                await db.close()
+                pool_metrics.record_timeout(route)
+                raise pool_exhausted()
+            pool_metrics.record_wait(route, time.perf_counter() - started)
+            self._db = db
+        return self._db
+
+    async def close(self) -> None:
+        if self._db is not None:
+            await self._db.close()
+            self._db = None
+
+
+def get_lazy_read_db(request: Request):
+    lazy = LazySession(ReadSessionLocal, request)
+    try:
+        yield lazy
+    finally:
+        lazy.close()
+
+
+async def get_lazy_async_db(request: Request):
+    lazy = AsyncLazySession(AsyncSessionLocal, request)
+    try:
+        yield lazy
+    finally:
+        await lazy.close()
+
+
+async def get_async_db(request: Request):
+    async with AsyncSessionLocal() as db:
+        route = route_label(request)
+        started = time.perf_counter()
+        try:
+            await db.connection()
+        except PoolTimeoutError:
+            pool_metrics.record_timeout(route)
+            raise pool_exhausted()
+        pool_metrics.record_wait(route, time.perf_counter() - started)
+
+        yield db
@@ -1,18 +1,30 @@
 from fastapi import Depends, HTTPException, status
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
+from sqlalchemy import bindparam, select
 from sqlalchemy.orm import Session
-from app.database import get_db
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.database import get_db, get_async_db, get_read_db
 from app.models.user import User, UserRole
+from app.read_models import CurrentUserRecord
 from app.utils import decode_access_token
+from app.revocation import revocation_store
 
 security = HTTPBearer()
 
+users_table = User.__table__
 
-def get_current_user(
-    credentials: HTTPAuthorizationCredentials = Depends(security),
-    db: Session = Depends(get_db),
-) -> User:
-    token = credentials.credentials
+# Every authenticated request runs this lookup, so the statement is built once
+# and returns a lightweight record rather than an identity-mapped User.
+CURRENT_USER_STMT = select(
+    users_table.c.id,
+    users_table.c.username,
+    users_table.c.email,
+    users_table.c.role,
+    users_table.c.is_active,
+).where(users_table.c.username == bindparam("username"))
+
+
+def authenticate_token(db: Session, token: str) -> CurrentUserRecord:
     payload = decode_access_token(token)
 
     if payload is None:
@@ -28,18 +40,63 @@ def get_current_user(
             detail="Invalid authentication credentials",
         )
 
-    user = db.query(User).filter(User.username == username).first()
+    if revocation_store.is_revoked(
+        db, payload.get("jti"), username, payload.get("iat")
+    ):
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Token has been revoked",
+        )
+
+    user = db.execute(CURRENT_USER_STMT, {"username": username}).first()
     if user is None:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED, detail="User not found"
         )
 
-    return user
+    return CurrentUserRecord._make(user)
+
+
+def get_current_user(
+    credentials: HTTPAuthorizationCredentials = Depends(security),
+    db: Session = Depends(get_db),
+) -> CurrentUserRecord:
+    return authenticate_token(db, credentials.credentials)
+
+
+def get_current_user_read(
+    credentials: HTTPAuthorizationCredentials = Depends(security),
+    db: Session = Depends(get_read_db),
+) -> CurrentUserRecord:
+    # For GET routes: shares the route's read session instead of checking
+    # out a second connection from the write pool.
+    return authenticate_token(db, credentials.credentials)
+
+
+async def get_current_user_async(
+    credentials: HTTPAuthorizationCredentials = Depends(security),
+    db: AsyncSession = Depends(get_async_db),
+) -> CurrentUserRecord:
+    return await db.run_sync(authenticate_token, credentials.credentials)
 
 
-def require_admin(current_user: User = Depends(get_current_user)) -> User:
+def require_admin(
+    current_user: CurrentUserRecord = Depends(get_current_user),
+) -> CurrentUserRecord:
     if current_user.role != UserRole.ADMIN:
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN, detail="Admin access required"
         )
     return current_user
+
+
+def require_admin_read(
+    current_user: CurrentUserRecord = Depends(get_current_user_read),
+) -> CurrentUserRecord:
+    return require_admin(current_user)
+
+
+def require_admin_async(
+    current_user: CurrentUserRecord = Depends(get_current_user_async),
+) -> CurrentUserRecord:
+    return require_admin(current_user)
@@ -0,0 +1,251 @@
+import json
+import logging
+import os
+import socket
+import threading
+import time
+import uuid
+from collections import defaultdict, deque
+from typing import Callable, Dict, List, NamedTuple, Optional
+from sqlalchemy import bindparam, delete, event, func, insert, select
+from sqlalchemy.engine import Engine
+from sqlalchemy.orm import Session
+from app.config import settings
+from app.models.change_log import ChangeLog
+
+logger = logging.getLogger(__name__)
+
+# Delivered to every handler when this worker missed events (they were pruned
+# before it caught up); handlers should drop everything they cache.
+RESET_TOPIC = "reset"
+
+PENDING_KEY = "pending_invalidations"
+
+change_log_table = ChangeLog.__table__
+
+APPEND_STMT = insert(change_log_table)
+
+TAIL_STMT = (
+    select(change_log_table)
+    .where(change_log_table.c.id > bindparam("last_id"))
+    .order_by(change_log_table.c.id)
+    .limit(bindparam("limit"))
+)
+
+LAST_ID_STMT = select(func.max(change_log_table.c.id))
+
+PRUNE_STMT = delete(change_log_table).where(
+    change_log_table.c.created_at < bindparam("cutoff")
+)
+
+
+class InvalidationEvent(NamedTuple):
+    topic: str
+    key: Optional[str]
+    payload: Optional[dict]
+    origin: str
+    created_at: float
+
+
+Handler = Callable[[InvalidationEvent], None]
+
+
+class InvalidationBus:
+    """Broadcasts change events to every worker through the change_log table.
+
+    publish() appends to the log inside the caller's transaction, so an event
+    exists exactly when the write it describes is committed. Handlers in the
+    publishing worker run right after commit; other workers pick the row up
+    from a background thread that tails the table by id.
+
+    Events older than ``retention`` are pruned by publish() itself, at most
+    every ``retention / 4`` seconds, so the log stays bounded whether or not
+    this worker runs the tailing thread.
+    """
+
+    def __init__(
+        self,
+        poll_interval: float,
+        retention: float,
+        batch_size: int = 500,
+        latency_samples: int = 1024,
+    ):
+        self.poll_interval = poll_interval
+        self.retention = retention
+        self.batch_size = batch_size
+        self._handlers: Dict[str, List[Handler]] = defaultdict(list)
+        self._lock = threading.Lock()
+        self._engine: Optional[Engine] = None
+        self._thread: Optional[threading.Thread] = None
+        self._stop = threading.Event()
+        self._last_id = 0
+        self._last_prune = 0.0
+        self._origin: Optional[str] = None
+        self._origin_pid: Optional[int] = None
+        self._latencies = deque(maxlen=latency_samples)
+        self.published = 0
+        self.dispatched_local = 0
+        self.delivered = 0
+        self.dropped = 0
+        self.handler_errors = 0
+
+    @property
+    def origin(self) -> str:
+        # Regenerated after fork so pre-forked workers don't share an id.
+        pid = os.getpid()
+        if self._origin_pid != pid:
+            self._origin_pid = pid
+            self._origin = f"{socket.gethostname()}:{pid}:{uuid.uuid4().hex[:8]}"
+        return self._origin
+
+    def subscribe(self, topic: str, handler: Handler) -> None:
+        with self._lock:
+            self._handlers[topic].append(handler)
+
+    def unsubscribe(self, topic: str, handler: Handler) -> None:
+        with self._lock:
+            if handler in self._handlers.get(topic, ()):
+                self._handlers[topic].remove(handler)
+
+    def publish(
+        self,
+        db: Session,
+        topic: str,
+        key=None,
+        payload: Optional[dict] = None,
+    ) -> None:
+        event = InvalidationEvent(
+            topic=topic,
+            key=None if key is None else str(key),
+            payload=payload,
+            origin=self.origin,
+            created_at=time.time(),
+        )
+        db.execute(
+            APPEND_STMT,
+            {
+                "topic": event.topic,
+                "key": event.key,
+                "payload": None if payload is None else json.dumps(payload),
+                "origin": event.origin,
+                "created_at": event.created_at,
+            },
+        )
+        if event.created_at - self._last_prune >= self.retention / 4:
+            self._last_prune = event.created_at
+            db.execute(PRUNE_STMT, {"cutoff": event.created_at - self.retention})
+        db.info.setdefault(PENDING_KEY, []).append(event)
+        self.published += 1
+
+    def dispatch(self, event: InvalidationEvent) -> None:
+        with self._lock:
+            if event.topic == RESET_TOPIC:
+                handlers = [h for hs in self._handlers.values() for h in hs]
+            else:
+                handlers = list(self._handlers.get(event.topic, ()))
+        for handler in handlers:
+            try:
+                handler(event)
+            except Exception:
+                self.handler_errors += 1
+                logger.exception("Invalidation handler failed for %s", event.topic)
+
+    def start(self, engine: Engine) -> None:
+        if self._thread is not None and self._thread.is_alive():
+            return
+        self._engine = engine
+        with engine.connect() as conn:
+            self._last_id = conn.execute(LAST_ID_STMT).scalar() or 0
+        self._stop.clear()
+        self._thread = threading.Thread(
+            target=self._run, name="invalidation-bus", daemon=True
+        )
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout=self.poll_interval * 10)
+        self._thread = None
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.poll_interval):
+            try:
+                self.poll()
+            except Exception:
+                logger.exception("Invalidation bus poll failed")
+
+    def poll(self) -> int:
+        with self._engine.connect() as conn:
+            rows = conn.execute(
+                TAIL_STMT, {"last_id": self._last_id, "limit": self.batch_size}
+            ).all()
+
+        now = time.time()
+        if rows and rows[0].id > self._last_id + 1:
+            # Ids are contiguous (AUTOINCREMENT, single writer), so a gap
+            # means rows were pruned before this worker read them.
+            self.dropped += rows[0].id - self._last_id - 1
+            self.dispatch(InvalidationEvent(RESET_TOPIC, None, None, "", now))
+
+        delivered = 0
+        for row in rows:
+            self._last_id = row.id
+            if row.origin == self.origin:
+                continue
+            self._latencies.append(now - row.created_at)
+            self.dispatch(
+                InvalidationEvent(
+                    topic=row.topic,
+                    key=row.key,
+                    payload=None if row.payload is None else json.loads(row.payload),
+                    origin=row.origin,
+                    created_at=row.created_at,
+                )
+            )
+            delivered += 1
+        self.delivered += delivered
+        return delivered
+
+    def stats(self) -> dict:
+        latencies = sorted(self._latencies)
+
+        def percentile(p: float) -> Optional[float]:
+            if not latencies:
+                return None
+            index = min(len(latencies) - 1, int(len(latencies) * p))
+            return round(latencies[index] * 1000, 3)
+
+        return {
+            "origin": self.origin,
+            "running": self._thread is not None and self._thread.is_alive(),
+            "last_id": self._last_id,
+            "published": self.published,
+            "dispatched_local": self.dispatched_local,
+            "delivered": self.delivered,
+            "dropped": self.dropped,
+            "handler_errors": self.handler_errors,
+            "latency_ms": {
+                "p50": percentile(0.5),
+                "p99": percentile(0.99),
+                "max": round(latencies[-1] * 1000, 3) if latencies else None,
+            },
+        }
+
+
+invalidation_bus = InvalidationBus(
+    poll_interval=settings.INVALIDATION_POLL_SECONDS,
+    retention=settings.INVALIDATION_RETENTION_SECONDS,
+)
+
+
+@event.listens_for(Session, "after_commit")
+def _dispatch_committed(session: Session) -> None:
+    for pending in session.info.pop(PENDING_KEY, ()):
+        invalidation_bus.dispatched_local += 1
+        invalidation_bus.dispatch(pending)
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_rolled_back(session: Session) -> None:
+    session.info.pop(PENDING_KEY, None)
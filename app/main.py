@@ -1,36 +1,86 @@
+from contextlib import asynccontextmanager
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
-from app.database import engine, Base
-from app.routes import auth, movies, showtimes, reservations, admin
+from app.config import settings
 
-Base.metadata.create_all(bind=engine)
 
-app = FastAPI(
-    title="Movie Reservation API",
-    description="Backend for movie ticket reservation system",
-    version="1.0.0",
-)
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    if settings.SCHEMA_CHECK_ON_STARTUP:
+        from app.database import engine
+        from app.migrations import check_schema
 
-app.add_middleware(
-    CORSMiddleware,
-    allow_origins=["*"],
-    allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
-)
+        check_schema(engine)
+    if settings.INVALIDATION_BUS_ENABLED:
+        from app.database import engine
+        from app.invalidation import invalidation_bus
 
-app.include_router(auth.router)
-app.include_router(movies.router)
-app.include_router(showtimes.router)
-app.include_router(reservations.router)
-app.include_router(admin.router)
+        invalidation_bus.start(engine)
+    yield
+    from app.report_jobs import report_jobs
 
+    report_jobs.shutdown()
+    if settings.INVALIDATION_BUS_ENABLED:
+        invalidation_bus.stop()
 
-@app.get("/")
-def root():
-    return {"message": "Movie Reservation API"}
 
+def create_app() -> FastAPI:
+    from app.query_stats import QueryStatsMiddleware
+    from app.routes import auth, admin, batch
 
-@app.get("/health")
-def health_check():
-    return {"status": "healthy"}
+    if settings.DATABASE_ASYNC:
+        from app.routes import async_movies as movies
+        from app.routes import async_showtimes as showtimes
+        from app.routes import async_reservations as reservations
+    else:
+        from app.routes import movies, showtimes, reservations
+
+    app = FastAPI(
+        title="Movie Reservation API",
+        description="Backend for movie ticket reservation system",
+        version="1.0.0",
+        lifespan=lifespan,
+    )
+
+    if settings.ADMISSION_CONTROL_ENABLED:
+        from app.admission import AdmissionMiddleware
+
+        app.add_middleware(AdmissionMiddleware)
+    app.add_middleware(
+        CORSMiddleware,
+        allow_origins=["*"],
+        allow_credentials=True,
+        allow_methods=["*"],
+        allow_headers=["*"],
+        # Pagination cursors and stale-read ages are only sent as headers.
+        expose_headers=["X-Next-Cursor", "X-Stale-Age"],
+    )
+    app.add_middleware(QueryStatsMiddleware)
+
+    app.include_router(auth.router)
+    app.include_router(movies.router)
+    app.include_router(showtimes.router)
+    app.include_router(reservations.router)
+    app.include_router(admin.router)
+    app.include_router(batch.router)
+
+    @app.get("/")
+    def root():
+        return {"message": "Movie Reservation API"}
+
+    # async so it never waits behind sync routes for a threadpool thread
+    @app.get("/health")
+    async def health_check():
+        return {"status": "healthy"}
+
+    return app
+
+
+def __getattr__(name: str):
+    # Keeps `uvicorn app.main:app` and `from app.main import app` working while
+    # plain `import app.main` stays cheap; prefer `uvicorn --factory
+    # app.main:create_app`.
+    if name == "app":
+        globals()["app"] = create_app()
+        return globals()["app"]
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
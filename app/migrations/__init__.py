@@ -0,0 +1,77 @@
+import importlib
+import pkgutil
+from datetime import datetime
+from sqlalchemy import Column, DateTime, Integer, MetaData, String, Table, inspect
+from sqlalchemy.engine import Connection, Engine
+from app.migrations import versions
+
+schema_metadata = MetaData()
+
+schema_migrations = Table(
+    "schema_migrations",
+    schema_metadata,
+    Column("version", Integer, primary_key=True),
+    Column("description", String, nullable=False),
+    Column("applied_at", DateTime, nullable=False),
+)
+
+
+class SchemaOutdatedError(RuntimeError):
+    pass
+
+
+def load_migrations() -> list:
+    migrations = [
+        importlib.import_module(f"{versions.__name__}.{module.name}")
+        for module in pkgutil.iter_modules(versions.__path__)
+    ]
+    return sorted(migrations, key=lambda migration: migration.version)
+
+
+MIGRATIONS = load_migrations()
+LATEST_VERSION = MIGRATIONS[-1].version if MIGRATIONS else 0
+
+
+def get_current_version(conn: Connection) -> int:
+    if not inspect(conn).has_table(schema_migrations.name):
+        return 0
+    version = conn.execute(
+        schema_migrations.select()
+        .with_only_columns(schema_migrations.c.version)
+        .order_by(schema_migrations.c.version.desc())
+        .limit(1)
+    ).scalar()
+    return version or 0
+
+
+def migrate(engine: Engine, target: int = LATEST_VERSION) -> list:
+    applied = []
+    with engine.begin() as conn:
+        schema_metadata.create_all(conn, checkfirst=True)
+        current = get_current_version(conn)
+
+    for migration in MIGRATIONS:
+        if current < migration.version <= target:
+            with engine.begin() as conn:
+                migration.upgrade(conn)
+                conn.execute(
+                    schema_migrations.insert().values(
+                        version=migration.version,
+                        description=migration.description,
+                        applied_at=datetime.utcnow(),
+                    )
+                )
+            applied.append(migration.version)
+
+    return applied
+
+
+def check_schema(engine: Engine) -> None:
+    with engine.connect() as conn:
+        current = get_current_version(conn)
+
+    if current < LATEST_VERSION:
+        raise SchemaOutdatedError(
+            f"Database schema is at version {current}, application requires "
+            f"{LATEST_VERSION}. Run `python manage.py migrate`."
+        )
@@ -0,0 +1,98 @@
+from sqlalchemy import (
+    Boolean,
+    Column,
+    DateTime,
+    Enum,
+    ForeignKey,
+    Integer,
+    MetaData,
+    Numeric,
+    String,
+    Table,
+    Text,
+    UniqueConstraint,
+)
+
+version = 1
+description = "Initial schema"
+
+metadata = MetaData()
+
+Table(
+    "users",
+    metadata,
+    Column("id", Integer, primary_key=True, index=True),
+    Column("email", String, unique=True, index=True, nullable=False),
+    Column("username", String, unique=True, index=True, nullable=False),
+    Column("hashed_password", String, nullable=False),
+    Column("role", Enum("ADMIN", "USER", name="userrole")),
+    Column("is_active", Boolean),
+)
+
+Table(
+    "movies",
+    metadata,
+    Column("id", Integer, primary_key=True, index=True),
+    Column("title", String, nullable=False, index=True),
+    Column("description", Text),
+    Column("poster_url", String),
+    Column("genre", String, index=True),
+    Column("duration_minutes", Integer),
+)
+
+Table(
+    "showtimes",
+    metadata,
+    Column("id", Integer, primary_key=True, index=True),
+    Column("movie_id", Integer, ForeignKey("movies.id"), nullable=False),
+    Column("start_time", DateTime, nullable=False, index=True),
+    Column("hall_number", Integer, nullable=False),
+    Column("price", Numeric(10, 2), nullable=False),
+    Column("total_seats", Integer),
+)
+
+Table(
+    "seats",
+    metadata,
+    Column("id", Integer, primary_key=True, index=True),
+    Column("showtime_id", Integer, ForeignKey("showtimes.id"), nullable=False),
+    Column("row", String(5), nullable=False),
+    Column("number", Integer, nullable=False),
+    Column("is_reserved", Boolean),
+    UniqueConstraint("showtime_id", "row", "number", name="unique_seat_per_showtime"),
+)
+
+Table(
+    "reservations",
+    metadata,
+    Column("id", Integer, primary_key=True, index=True),
+    Column("user_id", Integer, ForeignKey("users.id"), nullable=False),
+    Column("showtime_id", Integer, ForeignKey("showtimes.id"), nullable=False),
+    Column("seat_id", Integer, ForeignKey("seats.id"), nullable=False, unique=True),
+    Column("status", Enum("CONFIRMED", "CANCELLED", name="reservationstatus")),
+    Column("created_at", DateTime),
+)
+
+Table(
+    "refresh_tokens",
+    metadata,
+    Column("id", Integer, primary_key=True),
+    Column("token_hash", String(64), nullable=False, unique=True, index=True),
+    Column("user_id", Integer, ForeignKey("users.id"), nullable=False, index=True),
+    Column("expires_at", DateTime, nullable=False),
+    Column("revoked_at", DateTime),
+    Column("created_at", DateTime),
+)
+
+Table(
+    "revoked_tokens",
+    metadata,
+    Column("key", String(64), primary_key=True),
+    Column("expires_at", DateTime, nullable=False, index=True),
+    Column("revoked_at", DateTime, nullable=False, index=True),
+)
+
+
+def upgrade(conn):
+    # checkfirst adopts databases created by the old create_all() startup hook.
+    metadata.create_all(conn, checkfirst=True)
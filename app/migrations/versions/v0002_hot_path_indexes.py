@@ -0,0 +1,17 @@
+version = 2
+description = "Composite indexes for seat and reservation hot paths"
+
+
+def upgrade(conn):
+    conn.exec_driver_sql(
+        "CREATE INDEX IF NOT EXISTS ix_seats_showtime_id_is_reserved "
+        "ON seats (showtime_id, is_reserved)"
+    )
+    conn.exec_driver_sql(
+        "CREATE INDEX IF NOT EXISTS ix_reservations_user_id_status "
+        "ON reservations (user_id, status)"
+    )
+    conn.exec_driver_sql(
+        "CREATE INDEX IF NOT EXISTS ix_reservations_showtime_id_status "
+        "ON reservations (showtime_id, status)"
+    )
@@ -0,0 +1,12 @@
+version = 3
+description = "Covering index for paginated reservation history"
+
+
+def upgrade(conn):
+    # (user_id, status, created_at) serves everything the two-column index
+    # did, plus the keyset ordering of /reservations/my.
+    conn.exec_driver_sql(
+        "CREATE INDEX IF NOT EXISTS ix_reservations_user_id_status_created_at "
+        "ON reservations (user_id, status, created_at)"
+    )
+    conn.exec_driver_sql("DROP INDEX IF EXISTS ix_reservations_user_id_status")
@@ -0,0 +1,21 @@
+from sqlalchemy import inspect
+
+version = 4
+description = "Seat-map versions for delta polling"
+
+
+def add_version_column(conn, table: str, column: str):
+    if column in {c["name"] for c in inspect(conn).get_columns(table)}:
+        return
+    conn.exec_driver_sql(
+        f"ALTER TABLE {table} ADD COLUMN {column} INTEGER NOT NULL DEFAULT 0"
+    )
+
+
+def upgrade(conn):
+    add_version_column(conn, "showtimes", "seat_map_version")
+    add_version_column(conn, "seats", "version")
+    conn.exec_driver_sql(
+        "CREATE INDEX IF NOT EXISTS ix_seats_showtime_id_version "
+        "ON seats (showtime_id, version)"
+    )
@@ -0,0 +1,18 @@
+version = 5
+description = "Change log tailed by workers for cache invalidation"
+
+
+def upgrade(conn):
+    conn.exec_driver_sql(
+        "CREATE TABLE IF NOT EXISTS change_log ("
+        "id INTEGER NOT NULL PRIMARY KEY AUTOINCREMENT, "
+        "topic VARCHAR(64) NOT NULL, "
+        '"key" VARCHAR(128), '
+        "payload TEXT, "
+        "origin VARCHAR(64) NOT NULL, "
+        "created_at FLOAT NOT NULL)"
+    )
+    conn.exec_driver_sql(
+        "CREATE INDEX IF NOT EXISTS ix_change_log_created_at "
+        "ON change_log (created_at)"
+    )
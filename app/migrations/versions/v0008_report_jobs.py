@@ -0,0 +1,28 @@
+version = 8
+description = "Background report jobs"
+
+
+def upgrade(conn):
+    conn.exec_driver_sql(
+        "CREATE TABLE IF NOT EXISTS report_jobs ("
+        "id INTEGER NOT NULL PRIMARY KEY, "
+        "kind VARCHAR(32) NOT NULL, "
+        "params TEXT NOT NULL, "
+        "dedupe_key VARCHAR(64) NOT NULL, "
+        "status VARCHAR(9) NOT NULL, "
+        "requested_by INTEGER REFERENCES users (id), "
+        "created_at DATETIME NOT NULL, "
+        "started_at DATETIME, "
+        "finished_at DATETIME, "
+        "error TEXT, "
+        "content_type VARCHAR(64), "
+        "result BLOB)"
+    )
+    conn.exec_driver_sql(
+        "CREATE UNIQUE INDEX IF NOT EXISTS ix_report_jobs_dedupe_key_in_flight "
+        "ON report_jobs (dedupe_key) WHERE status IN ('QUEUED', 'RUNNING')"
+    )
+    conn.exec_driver_sql(
+        "CREATE INDEX IF NOT EXISTS ix_report_jobs_finished_at "
+        "ON report_jobs (finished_at)"
+    )
@@ -0,0 +1,17 @@
+from sqlalchemy import inspect
+
+version = 9
+description = "Report job results stored as files"
+
+
+def upgrade(conn):
+    columns = {c["name"] for c in inspect(conn).get_columns("report_jobs")}
+    if "result_path" not in columns:
+        conn.exec_driver_sql(
+            "ALTER TABLE report_jobs ADD COLUMN result_path VARCHAR(255)"
+        )
+    if "result" in columns:
+        # Finished jobs only live for REPORT_JOB_RETENTION_SECONDS anyway;
+        # ones whose result was stored inline are dropped with the column.
+        conn.exec_driver_sql("DELETE FROM report_jobs WHERE result IS NOT NULL")
+        conn.exec_driver_sql("ALTER TABLE report_jobs DROP COLUMN result")
@@ -0,0 +1,9 @@
+version = 10
+description = "Index refresh token expiry for pruning"
+
+
+def upgrade(conn):
+    conn.exec_driver_sql(
+        "CREATE INDEX IF NOT EXISTS ix_refresh_tokens_expires_at "
+        "ON refresh_tokens (expires_at)"
+    )
@@ -0,0 +1,13 @@
+from sqlalchemy import inspect
+
+version = 11
+description = "Report job owners and heartbeats"
+
+
+def upgrade(conn):
+    columns = {c["name"] for c in inspect(conn).get_columns("report_jobs")}
+    if "owner" not in columns:
+        conn.exec_driver_sql("ALTER TABLE report_jobs ADD COLUMN owner VARCHAR(64)")
+    if "heartbeat_at" not in columns:
+        conn.exec_driver_sql("ALTER TABLE report_jobs ADD COLUMN heartbeat_at DATETIME")
+        conn.exec_driver_sql("UPDATE report_jobs SET heartbeat_at = created_at")
@@ -3,5 +3,10 @@ from app.models.movie import Movie
 from app.models.showtime import Showtime
 from app.models.seat import Seat
 from app.models.reservation import Reservation, ReservationStatus
+from app.models.refresh_token import RefreshToken
+from app.models.revoked_token import RevokedToken
 
 from app.database import Base
+from app.models.change_log import ChangeLog
+from app.models.rollup import DailyRollup, ShowtimeRollup
+from app.models.report_job import ReportJob, ReportJobStatus
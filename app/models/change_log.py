@@ -0,0 +1,17 @@
+from sqlalchemy import Column, Float, Integer, String, Text
+from app.database import Base
+
+
+class ChangeLog(Base):
+    __tablename__ = "change_log"
+
+    id = Column(Integer, primary_key=True)
+    topic = Column(String(64), nullable=False)
+    key = Column(String(128))
+    payload = Column(Text)
+    origin = Column(String(64), nullable=False)
+    created_at = Column(Float, nullable=False, index=True)
+
+    # AUTOINCREMENT keeps ids monotonic even after pruning empties the table,
+    # which tailing workers rely on.
+    __table_args__ = {"sqlite_autoincrement": True}
@@ -0,0 +1,57 @@
+from sqlalchemy import (
+    Column,
+    DateTime,
+    ForeignKey,
+    Index,
+    Integer,
+    String,
+    Text,
+    Enum as SQLEnum,
+    text,
+)
+from app.database import Base
+from datetime import datetime
+import enum
+
+
+class ReportJobStatus(str, enum.Enum):
+    QUEUED = "queued"
+    RUNNING = "running"
+    SUCCEEDED = "succeeded"
+    FAILED = "failed"
+
+
+class ReportJob(Base):
+    __tablename__ = "report_jobs"
+
+    id = Column(Integer, primary_key=True)
+    kind = Column(String(32), nullable=False)
+    # Canonical JSON of the validated parameters; dedupe_key hashes it with
+    # the kind.
+    params = Column(Text, nullable=False)
+    dedupe_key = Column(String(64), nullable=False)
+    status = Column(
+        SQLEnum(ReportJobStatus), nullable=False, default=ReportJobStatus.QUEUED
+    )
+    requested_by = Column(Integer, ForeignKey("users.id"))
+    # The runner that queued the job refreshes heartbeat_at while it is in
+    # flight; one that stops doing so has died with its worker.
+    owner = Column(String(64))
+    heartbeat_at = Column(DateTime)
+    created_at = Column(DateTime, nullable=False, default=datetime.utcnow)
+    started_at = Column(DateTime)
+    finished_at = Column(DateTime, index=True)
+    error = Column(Text)
+    content_type = Column(String(64))
+    # Relative to REPORT_JOB_RESULTS_DIR.
+    result_path = Column(String(255))
+
+    __table_args__ = (
+        # At most one queued or running job per dedupe key, across workers.
+        Index(
+            "ix_report_jobs_dedupe_key_in_flight",
+            "dedupe_key",
+            unique=True,
+            sqlite_where=text("status IN ('QUEUED', 'RUNNING')"),
+        ),
+    )
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, ForeignKey, DateTime, Enum as SQLEnum
+from sqlalchemy import Column, Integer, ForeignKey, DateTime, Index, Enum as SQLEnum
 from sqlalchemy.orm import relationship
 from app.database import Base
 from datetime import datetime
@@ -23,3 +23,13 @@ class Reservation(Base):
     user = relationship("User", back_populates="reservations")
     showtime = relationship("Showtime", back_populates="reservations")
     seat = relationship("Seat", back_populates="reservation")
+
+    __table_args__ = (
+        Index(
+            "ix_reservations_user_id_status_created_at",
+            "user_id",
+            "status",
+            "created_at",
+        ),
+        Index("ix_reservations_showtime_id_status", "showtime_id", "status"),
+    )
@@ -0,0 +1,11 @@
+from sqlalchemy import Column, String, DateTime
+from app.database import Base
+from datetime import datetime
+
+
+class RevokedToken(Base):
+    __tablename__ = "revoked_tokens"
+
+    key = Column(String(64), primary_key=True)
+    expires_at = Column(DateTime, nullable=False, index=True)
+    revoked_at = Column(DateTime, default=datetime.utcnow, nullable=False, index=True)
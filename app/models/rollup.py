@@ -0,0 +1,22 @@
+from sqlalchemy import Column, Date, ForeignKey, Integer
+from app.database import Base
+
+
+# Maintained incrementally by reservation writes so reports read one row per
+# showtime or day instead of aggregating the reservations table. Revenue is
+# kept in integer cents so repeated increments cannot drift.
+class ShowtimeRollup(Base):
+    __tablename__ = "showtime_rollups"
+
+    showtime_id = Column(Integer, ForeignKey("showtimes.id"), primary_key=True)
+    reserved_seats = Column(Integer, nullable=False, default=0)
+    revenue_cents = Column(Integer, nullable=False, default=0)
+
+
+class DailyRollup(Base):
+    __tablename__ = "daily_rollups"
+
+    # Calendar day of the showtime, not of the booking.
+    day = Column(Date, primary_key=True)
+    reserved_seats = Column(Integer, nullable=False, default=0)
+    revenue_cents = Column(Integer, nullable=False, default=0)
@@ -1,4 +1,12 @@
-from sqlalchemy import Column, Integer, String, Boolean, ForeignKey, UniqueConstraint
+from sqlalchemy import (
+    Column,
+    Integer,
+    String,
+    Boolean,
+    ForeignKey,
+    Index,
+    UniqueConstraint,
+)
 from sqlalchemy.orm import relationship
 from app.database import Base
 
@@ -11,6 +19,7 @@ class Seat(Base):
     row = Column(String(5), nullable=False)
     number = Column(Integer, nullable=False)
     is_reserved = Column(Boolean, default=False)
+    version = Column(Integer, nullable=False, default=0, server_default="0")
 
     showtime = relationship("Showtime", back_populates="seats")
     reservation = relationship("Reservation", back_populates="seat", uselist=False)
@@ -19,4 +28,6 @@ class Seat(Base):
         UniqueConstraint(
             "showtime_id", "row", "number", name="unique_seat_per_showtime"
         ),
+        Index("ix_seats_showtime_id_is_reserved", "showtime_id", "is_reserved"),
+        Index("ix_seats_showtime_id_version", "showtime_id", "version"),
     )
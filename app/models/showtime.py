@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, DateTime, ForeignKey, Numeric
+from sqlalchemy import Column, Integer, DateTime, ForeignKey, Index, Numeric
 from sqlalchemy.orm import relationship
 from app.database import Base
 
@@ -8,13 +8,24 @@ class Showtime(Base):
 
     id = Column(Integer, primary_key=True, index=True)
     movie_id = Column(Integer, ForeignKey("movies.id"), nullable=False)
-    start_time = Column(DateTime, nullable=False, index=True)
+    start_time = Column(DateTime, nullable=False)
     hall_number = Column(Integer, nullable=False)
     price = Column(Numeric(10, 2), nullable=False)
     total_seats = Column(Integer, default=100)
+    seat_map_version = Column(Integer, nullable=False, default=0, server_default="0")
 
     movie = relationship("Movie", back_populates="showtimes")
     seats = relationship(
         "Seat", back_populates="showtime", cascade="all, delete-orphan"
     )
     reservations = relationship("Reservation", back_populates="showtime")
+
+    __table_args__ = (
+        Index(
+            "ix_showtimes_start_time_movie_id_hall_number_total_seats",
+            "start_time",
+            "movie_id",
+            "hall_number",
+            "total_seats",
+        ),
+    )
@@ -0,0 +1,59 @@
+import threading
+from collections import defaultdict
+from starlette.requests import Request
+
+
+def route_label(request: Request) -> str:
+    route = request.scope.get("route")
+    return f"{request.method} {getattr(route, 'path', request.url.path)}"
+
+
+class PoolMetrics:
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._routes = defaultdict(
+            lambda: {"checkouts": 0, "wait_total": 0.0, "wait_max": 0.0, "timeouts": 0}
+        )
+
+    def record_wait(self, route: str, seconds: float) -> None:
+        with self._lock:
+            stats = self._routes[route]
+            stats["checkouts"] += 1
+            stats["wait_total"] += seconds
+            stats["wait_max"] = max(stats["wait_max"], seconds)
+
+    def record_timeout(self, route: str) -> None:
+        with self._lock:
+            self._routes[route]["timeouts"] += 1
+
+    def reset(self) -> None:
+        with self._lock:
+            self._routes.clear()
+
+    def route_stats(self) -> dict:
+        with self._lock:
+            return {
+                route: {
+                    "checkouts": stats["checkouts"],
+                    "timeouts": stats["timeouts"],
+                    "avg_wait_ms": (
+                        round(stats["wait_total"] / stats["checkouts"] * 1000, 3)
+                        if stats["checkouts"]
+                        else 0.0
+                    ),
+                    "max_wait_ms": round(stats["wait_max"] * 1000, 3),
+                }
+                for route, stats in self._routes.items()
+            }
+
+    @staticmethod
+    def pool_status(pool) -> dict:
+        status = {"class": type(pool).__name__}
+        for name in ("size", "checkedout", "checkedin", "overflow"):
+            method = getattr(pool, name, None)
+            if callable(method):
+                status[name] = method()
+        return status
+
+
+pool_metrics = PoolMetrics()
@@ -0,0 +1,124 @@
+import logging
+import re
+import threading
+import time
+from collections import Counter
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import List, Optional, Tuple
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from starlette.datastructures import MutableHeaders
+from app.config import settings
+
+logger = logging.getLogger(__name__)
+
+_IN_LIST = re.compile(r"\((?:\?|%\(\w+\)s|:\w+)(?:,\s*(?:\?|%\(\w+\)s|:\w+))+\)")
+_WHITESPACE = re.compile(r"\s+")
+
+
+def statement_shape(statement: str) -> str:
+    return _IN_LIST.sub("(?...)", _WHITESPACE.sub(" ", statement).strip())
+
+
+class QueryStats:
+    __slots__ = ("count", "duration", "shapes", "scope")
+
+    def __init__(self, scope: Optional[dict] = None):
+        self.count = 0
+        self.duration = 0.0
+        self.shapes = Counter()
+        self.scope = scope
+
+    @property
+    def route(self) -> Optional[str]:
+        if self.scope is None:
+            return None
+        route = self.scope.get("route")
+        return f"{self.scope['method']} {getattr(route, 'path', self.scope['path'])}"
+
+    def record(self, statement: str, duration: float) -> None:
+        self.count += 1
+        self.duration += duration
+        self.shapes[statement_shape(statement)] += 1
+
+    def suspected_n_plus_one(
+        self, threshold: Optional[int] = None
+    ) -> List[Tuple[str, int]]:
+        threshold = threshold or settings.N_PLUS_ONE_THRESHOLD
+        return [
+            (shape, count)
+            for shape, count in self.shapes.most_common()
+            if count >= threshold
+        ]
+
+
+current_query_stats: ContextVar[Optional[QueryStats]] = ContextVar(
+    "current_query_stats", default=None
+)
+
+_collectors: List[QueryStats] = []
+_collectors_lock = threading.Lock()
+
+
+@event.listens_for(Engine, "before_cursor_execute")
+def _start_timer(conn, cursor, statement, parameters, context, executemany):
+    conn.info.setdefault("query_started", []).append(time.perf_counter())
+
+
+@event.listens_for(Engine, "after_cursor_execute")
+def _record_query(conn, cursor, statement, parameters, context, executemany):
+    duration = time.perf_counter() - conn.info["query_started"].pop()
+
+    stats = current_query_stats.get()
+    if stats is not None:
+        stats.record(statement, duration)
+    if _collectors:
+        with _collectors_lock:
+            for collector in _collectors:
+                collector.record(statement, duration)
+
+
+@contextmanager
+def count_queries():
+    """Count every statement executed in the process, from any thread."""
+    stats = QueryStats()
+    with _collectors_lock:
+        _collectors.append(stats)
+    try:
+        yield stats
+    finally:
+        with _collectors_lock:
+            _collectors.remove(stats)
+
+
+class QueryStatsMiddleware:
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        stats = QueryStats(scope)
+        token = current_query_stats.set(stats)
+
+        async def send_with_stats(message):
+            if message["type"] == "http.response.start" and settings.DEBUG:
+                headers = MutableHeaders(scope=message)
+                headers["X-DB-Query-Count"] = str(stats.count)
+                headers["X-DB-Time-Ms"] = f"{stats.duration * 1000:.2f}"
+                suspects = stats.suspected_n_plus_one()
+                if suspects:
+                    headers["X-DB-N-Plus-One"] = str(len(suspects))
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_stats)
+        finally:
+            current_query_stats.reset(token)
+            for shape, count in stats.suspected_n_plus_one():
+                logger.warning(
+                    "Suspected N+1 on %s: %d x %s", stats.route, count, shape
+                )
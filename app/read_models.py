@@ -0,0 +1,38 @@
+from datetime import datetime
+from typing import NamedTuple, Optional
+from app.models.user import UserRole
+
+
+class CurrentUserRecord(NamedTuple):
+    id: int
+    username: str
+    email: str
+    role: UserRole
+    is_active: bool
+
+
+class SeatRecord(NamedTuple):
+    id: int
+    row: str
+    number: int
+    is_reserved: bool
+
+
+class MovieRecord(NamedTuple):
+    id: int
+    title: str
+    description: Optional[str]
+    poster_url: Optional[str]
+    genre: str
+    duration_minutes: int
+
+
+class ReservationDetailRecord(NamedTuple):
+    id: int
+    movie_title: str
+    showtime: datetime
+    hall_number: int
+    seat_row: str
+    seat_number: int
+    status: str
+    created_at: datetime
@@ -0,0 +1,505 @@
+import hashlib
+import json
+import logging
+import math
+import os
+import secrets
+import socket
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
+from typing import Callable, Iterable, List, NamedTuple, Optional, Tuple, Type
+from fastapi import HTTPException, status
+from fastapi.encoders import jsonable_encoder
+from pydantic import BaseModel, ValidationError
+from sqlalchemy import bindparam, delete, insert, select, update
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
+from app.config import settings
+from app.database import ReadSessionLocal, SessionLocal
+from app.models.report_job import ReportJob, ReportJobStatus
+from app.schemas.report_job import (
+    AnalyticsParams,
+    DateRangeParams,
+    ExportParams,
+    ReportJobKind,
+    SeatHeatmapParams,
+)
+from app.services.analytics_service import AnalyticsService, normalize_dimensions
+from app.services.export_service import MEDIA_TYPES, ExportService
+from app.services.heatmap_service import HeatmapService
+from app.services.rollup_service import RollupService
+
+logger = logging.getLogger(__name__)
+
+jobs_table = ReportJob.__table__
+
+IN_FLIGHT = (ReportJobStatus.QUEUED, ReportJobStatus.RUNNING)
+
+JOB_STMT = select(jobs_table).where(jobs_table.c.id == bindparam("job_id"))
+
+JOB_RESULT_STMT = select(
+    jobs_table.c.kind,
+    jobs_table.c.status,
+    jobs_table.c.content_type,
+    jobs_table.c.result_path,
+).where(jobs_table.c.id == bindparam("job_id"))
+
+IN_FLIGHT_STMT = select(jobs_table.c.id).where(
+    jobs_table.c.dedupe_key == bindparam("job_dedupe_key"),
+    jobs_table.c.status.in_(IN_FLIGHT),
+)
+
+INSERT_STMT = insert(jobs_table).values(
+    kind=bindparam("job_kind"),
+    params=bindparam("job_params"),
+    dedupe_key=bindparam("job_dedupe_key"),
+    status=ReportJobStatus.QUEUED,
+    requested_by=bindparam("job_requested_by"),
+    created_at=bindparam("job_created_at"),
+    owner=bindparam("job_owner"),
+    heartbeat_at=bindparam("job_created_at"),
+)
+
+HEARTBEAT_STMT = (
+    update(jobs_table)
+    .where(
+        jobs_table.c.owner == bindparam("job_owner"),
+        jobs_table.c.status.in_(IN_FLIGHT),
+    )
+    .values(heartbeat_at=bindparam("job_heartbeat_at"))
+)
+
+START_STMT = (
+    update(jobs_table)
+    .where(
+        jobs_table.c.id == bindparam("job_id"),
+        jobs_table.c.status == ReportJobStatus.QUEUED,
+    )
+    .values(status=ReportJobStatus.RUNNING, started_at=bindparam("job_started_at"))
+)
+
+FINISH_STMT = (
+    update(jobs_table)
+    .where(jobs_table.c.id == bindparam("job_id"))
+    .values(
+        status=bindparam("job_status"),
+        finished_at=bindparam("job_finished_at"),
+        error=bindparam("job_error"),
+        content_type=bindparam("job_content_type"),
+        result_path=bindparam("job_result_path"),
+    )
+)
+
+ABANDON_VALUES = dict(
+    status=ReportJobStatus.FAILED,
+    finished_at=bindparam("job_finished_at"),
+    error="Abandoned",
+)
+
+ABANDON_STMT = (
+    update(jobs_table)
+    .where(
+        jobs_table.c.id == bindparam("job_id"),
+        jobs_table.c.status.in_(IN_FLIGHT),
+    )
+    .values(**ABANDON_VALUES)
+)
+
+ABANDON_STALE_STMT = (
+    update(jobs_table)
+    .where(
+        jobs_table.c.status.in_(IN_FLIGHT),
+        jobs_table.c.heartbeat_at < bindparam("job_stale_cutoff"),
+    )
+    .values(**ABANDON_VALUES)
+)
+
+PRUNE_STMT = (
+    delete(jobs_table)
+    .where(jobs_table.c.finished_at < bindparam("job_cutoff"))
+    .returning(jobs_table.c.result_path)
+)
+
+
+def json_result(value) -> Tuple[Iterable[bytes], str]:
+    return [json.dumps(jsonable_encoder(value)).encode()], "application/json"
+
+
+class JobKind(NamedTuple):
+    params: Type[BaseModel]
+    # Runs against a read session; returns the result body, as chunks
+    # consumed while the session is open, and its content type.
+    run: Callable[[Session, BaseModel], Tuple[Iterable[bytes], str]]
+
+
+class JobResult(NamedTuple):
+    kind: str
+    content_type: str
+    path: str
+
+
+JOB_KINDS = {
+    ReportJobKind.RESERVATIONS_REPORT: JobKind(
+        DateRangeParams,
+        lambda db, p: json_result(
+            RollupService.get_report(db, p.start_date, p.end_date)
+        ),
+    ),
+    ReportJobKind.ANALYTICS: JobKind(
+        AnalyticsParams,
+        lambda db, p: json_result(
+            AnalyticsService.load_report(
+                db,
+                normalize_dimensions(p.group_by),
+                p.start_date,
+                p.end_date,
+                p.sort,
+                p.limit,
+                p.offset,
+            )
+        ),
+    ),
+    ReportJobKind.SEAT_HEATMAP: JobKind(
+        SeatHeatmapParams,
+        lambda db, p: json_result(
+            HeatmapService.load_heatmaps(db, p.start_date, p.end_date, p.hall_number)
+        ),
+    ),
+    ReportJobKind.RESERVATIONS_EXPORT: JobKind(
+        ExportParams,
+        lambda db, p: (
+            ExportService.stream_reservations(db, p.format, p.start_date, p.end_date),
+            MEDIA_TYPES[p.format],
+        ),
+    ),
+}
+
+
+def error_message(exc: BaseException) -> str:
+    detail = getattr(exc, "detail", None)
+    return str(detail or exc) or type(exc).__name__
+
+
+class ReportJobRunner:
+    """Runs heavy admin reports off the request path.
+
+    Jobs are rows in ``report_jobs``: submitting inserts one, a bounded
+    thread pool runs it against the read database, and the result is
+    streamed to a file under ``results_dir`` whose path is stored on the row
+    for polling and download. A job identical to one still queued
+    or running is not started again; the unique partial index on dedupe_key
+    enforces that across workers.
+
+    Each runner stamps the jobs it queues with its ``owner`` id and, while
+    it has any in flight, refreshes their heartbeat every
+    ``heartbeat_interval``. In-flight jobs whose heartbeat is older than
+    ``stale_after`` belonged to a worker that died and are marked abandoned
+    by the next submission; jobs still queued at shutdown are marked
+    abandoned straight away.
+    """
+
+    def __init__(
+        self,
+        session_factory,
+        read_session_factory,
+        workers: int = 2,
+        max_pending: int = 16,
+        stale_after: float = 60.0,
+        retention: float = 86400.0,
+        retry_after: float = 5.0,
+        results_dir: str = settings.REPORT_JOB_RESULTS_DIR,
+        heartbeat_interval: float = 10.0,
+    ):
+        self.session_factory = session_factory
+        self.read_session_factory = read_session_factory
+        self.results_dir = results_dir
+        self.workers = workers
+        self.max_pending = max_pending
+        self.stale_after = stale_after
+        self.retention = retention
+        self.retry_after = retry_after
+        self.heartbeat_interval = heartbeat_interval
+        self.owner = f"{socket.gethostname()}:{os.getpid()}:{secrets.token_hex(4)}"
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._heartbeat: Optional[threading.Thread] = None
+        self._stop = threading.Event()
+        self._lock = threading.Lock()
+        self._pending = 0
+        # Submitted to the pool but not started yet.
+        self._queued = set()
+        self.submitted = 0
+        self.deduplicated = 0
+        self.rejected = 0
+        self.succeeded = 0
+        self.failed = 0
+
+    def _reserve_slot(self) -> None:
+        with self._lock:
+            if self._pending >= self.max_pending:
+                self.rejected += 1
+                raise HTTPException(
+                    status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+                    detail="Too many report jobs pending",
+                    headers={"Retry-After": str(math.ceil(self.retry_after))},
+                )
+            self._pending += 1
+
+    def _release_slot(self) -> None:
+        with self._lock:
+            self._pending -= 1
+
+    def submit(
+        self, db: Session, kind: ReportJobKind, params: dict, user_id: int
+    ) -> int:
+        """Queues a job and returns its id, or the id of an identical one."""
+        spec = JOB_KINDS[kind]
+        try:
+            validated = spec.params.model_validate(params)
+        except ValidationError as exc:
+            raise HTTPException(
+                status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+                detail=jsonable_encoder(exc.errors(include_url=False)),
+            )
+        canonical = json.dumps(
+            validated.model_dump(mode="json"), sort_keys=True, separators=(",", ":")
+        )
+        dedupe_key = hashlib.sha256(f"{kind.value}:{canonical}".encode()).hexdigest()
+        now = datetime.utcnow()
+
+        self._sweep(db, now)
+        existing = db.execute(IN_FLIGHT_STMT, {"job_dedupe_key": dedupe_key}).first()
+        if existing is not None:
+            db.commit()
+            self.deduplicated += 1
+            return existing.id
+
+        self._reserve_slot()
+        try:
+            job_id = db.execute(
+                INSERT_STMT,
+                {
+                    "job_kind": kind.value,
+                    "job_params": canonical,
+                    "job_dedupe_key": dedupe_key,
+                    "job_requested_by": user_id,
+                    "job_created_at": now,
+                    "job_owner": self.owner,
+                },
+            ).inserted_primary_key[0]
+            db.commit()
+        except IntegrityError:
+            # Another worker queued the same job between our check and insert.
+            db.rollback()
+            self._release_slot()
+            self.deduplicated += 1
+            return db.execute(IN_FLIGHT_STMT, {"job_dedupe_key": dedupe_key}).one().id
+        except BaseException:
+            self._release_slot()
+            raise
+
+        self.submitted += 1
+        with self._lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    self.workers, thread_name_prefix="report-job"
+                )
+                self._stop = threading.Event()
+                self._heartbeat = threading.Thread(
+                    target=self._send_heartbeats,
+                    args=(self._stop,),
+                    name="report-job-heartbeat",
+                    daemon=True,
+                )
+                self._heartbeat.start()
+            self._queued.add(job_id)
+            self._executor.submit(self._run, job_id, kind, validated)
+        return job_id
+
+    def _send_heartbeats(self, stop: threading.Event) -> None:
+        while not stop.wait(self.heartbeat_interval):
+            if not self._pending:
+                continue
+            try:
+                with self.session_factory() as db:
+                    db.execute(
+                        HEARTBEAT_STMT,
+                        {
+                            "job_owner": self.owner,
+                            "job_heartbeat_at": datetime.utcnow(),
+                        },
+                    )
+                    db.commit()
+            except Exception:
+                logger.warning("Report job heartbeat failed", exc_info=True)
+
+    def _sweep(self, db: Session, now: datetime) -> None:
+        """Abandons jobs of dead workers and deletes expired ones."""
+        db.execute(
+            ABANDON_STALE_STMT,
+            {
+                "job_stale_cutoff": now - timedelta(seconds=self.stale_after),
+                "job_finished_at": now,
+            },
+        )
+        expired = db.execute(
+            PRUNE_STMT, {"job_cutoff": now - timedelta(seconds=self.retention)}
+        ).scalars()
+        paths: List[str] = [path for path in expired if path]
+        db.commit()
+        for path in paths:
+            self._remove(os.path.join(self.results_dir, path))
+
+    @staticmethod
+    def _remove(path: str) -> None:
+        try:
+            os.remove(path)
+        except FileNotFoundError:
+            pass
+
+    def _write_result(self, job_id: int, chunks: Iterable[bytes]) -> str:
+        """Streams ``chunks`` to a new file; returns its path in results_dir."""
+        os.makedirs(self.results_dir, exist_ok=True)
+        # Ids of pruned jobs can be reused, so names also carry a random part.
+        name = f"{job_id}-{secrets.token_hex(8)}"
+        path = os.path.join(self.results_dir, name)
+        try:
+            with open(path, "wb") as result:
+                for chunk in chunks:
+                    result.write(chunk)
+        except BaseException:
+            self._remove(path)
+            raise
+        return name
+
+    def _finish(self, job_id: int, job_status: ReportJobStatus, **fields) -> None:
+        with self.session_factory() as db:
+            db.execute(
+                FINISH_STMT,
+                {
+                    "job_id": job_id,
+                    "job_status": job_status,
+                    "job_finished_at": datetime.utcnow(),
+                    "job_error": fields.get("error"),
+                    "job_content_type": fields.get("content_type"),
+                    "job_result_path": fields.get("result_path"),
+                },
+            )
+            db.commit()
+
+    def _run(self, job_id: int, kind: ReportJobKind, params: BaseModel) -> None:
+        with self._lock:
+            self._queued.discard(job_id)
+        try:
+            with self.session_factory() as db:
+                started = db.execute(
+                    START_STMT, {"job_id": job_id, "job_started_at": datetime.utcnow()}
+                ).rowcount
+                db.commit()
+            if not started:
+                # Marked abandoned while it waited in the queue.
+                return
+            with self.read_session_factory() as read_db:
+                chunks, content_type = JOB_KINDS[kind].run(read_db, params)
+                result_path = self._write_result(job_id, chunks)
+            try:
+                self._finish(
+                    job_id,
+                    ReportJobStatus.SUCCEEDED,
+                    content_type=content_type,
+                    result_path=result_path,
+                )
+            except BaseException:
+                self._remove(os.path.join(self.results_dir, result_path))
+                raise
+            self.succeeded += 1
+        except Exception as exc:
+            logger.warning("Report job %s failed", job_id, exc_info=True)
+            self.failed += 1
+            try:
+                self._finish(job_id, ReportJobStatus.FAILED, error=error_message(exc))
+            except Exception:
+                logger.exception("Could not record failure of report job %s", job_id)
+        finally:
+            self._release_slot()
+
+    def get(self, db: Session, job_id: int) -> dict:
+        row = db.execute(JOB_STMT, {"job_id": job_id}).first()
+        if row is None:
+            raise HTTPException(status_code=404, detail="Job not found")
+        return {
+            "id": row.id,
+            "kind": row.kind,
+            "params": json.loads(row.params),
+            "status": row.status,
+            "created_at": row.created_at,
+            "started_at": row.started_at,
+            "finished_at": row.finished_at,
+            "error": row.error,
+            "result_url": (
+                f"/admin/jobs/{row.id}/result"
+                if row.status == ReportJobStatus.SUCCEEDED
+                else None
+            ),
+        }
+
+    def get_result(self, db: Session, job_id: int) -> JobResult:
+        row = db.execute(JOB_RESULT_STMT, {"job_id": job_id}).first()
+        if row is None:
+            raise HTTPException(status_code=404, detail="Job not found")
+        if row.status != ReportJobStatus.SUCCEEDED:
+            raise HTTPException(
+                status_code=status.HTTP_409_CONFLICT,
+                detail=f"Job is {row.status.value}",
+            )
+        path = os.path.join(self.results_dir, row.result_path)
+        if not os.path.exists(path):
+            raise HTTPException(status_code=404, detail="Job result not found")
+        return JobResult(row.kind, row.content_type, path)
+
+    def shutdown(self) -> None:
+        """Waits for running jobs and marks queued ones abandoned."""
+        with self._lock:
+            executor, self._executor = self._executor, None
+            heartbeat, self._heartbeat = self._heartbeat, None
+        if executor is None:
+            return
+        executor.shutdown(wait=True, cancel_futures=True)
+        self._stop.set()
+        heartbeat.join()
+        with self._lock:
+            dropped, self._queued = self._queued, set()
+            self._pending = 0
+        if dropped:
+            now = datetime.utcnow()
+            with self.session_factory() as db:
+                db.execute(
+                    ABANDON_STMT,
+                    [{"job_id": job_id, "job_finished_at": now} for job_id in dropped],
+                )
+                db.commit()
+
+    def stats(self) -> dict:
+        return {
+            "workers": self.workers,
+            "pending": self._pending,
+            "max_pending": self.max_pending,
+            "submitted": self.submitted,
+            "deduplicated": self.deduplicated,
+            "rejected": self.rejected,
+            "succeeded": self.succeeded,
+            "failed": self.failed,
+        }
+
+
+report_jobs = ReportJobRunner(
+    SessionLocal,
+    ReadSessionLocal,
+    workers=settings.REPORT_JOB_WORKERS,
+    max_pending=settings.REPORT_JOB_MAX_PENDING,
+    stale_after=settings.REPORT_JOB_STALE_SECONDS,
+    retention=settings.REPORT_JOB_RETENTION_SECONDS,
+    retry_after=settings.REPORT_JOB_RETRY_AFTER_SECONDS,
+    results_dir=settings.REPORT_JOB_RESULTS_DIR,
+    heartbeat_interval=settings.REPORT_JOB_HEARTBEAT_SECONDS,
+)
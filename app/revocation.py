@@ -0,0 +1,203 @@
+import hashlib
+import math
+import threading
+import time
+from datetime import datetime, timedelta
+from typing import Optional
+from sqlalchemy import bindparam, delete, func, select
+from sqlalchemy.orm import Session
+from app.config import settings
+from app.invalidation import change_log_table, invalidation_bus
+from app.models.revoked_token import RevokedToken
+
+REVOKED_TOPIC = "token_revoked"
+
+revoked_tokens_table = RevokedToken.__table__
+
+LAST_CHANGE_STMT = select(func.max(change_log_table.c.id))
+
+REVOKED_SINCE_STMT = (
+    select(change_log_table.c.id, change_log_table.c.key)
+    .where(
+        change_log_table.c.id > bindparam("last_id"),
+        change_log_table.c.topic == REVOKED_TOPIC,
+    )
+    .order_by(change_log_table.c.id)
+)
+
+LIVE_KEYS_STMT = select(revoked_tokens_table.c.key).where(
+    revoked_tokens_table.c.expires_at > bindparam("now")
+)
+
+PRUNE_STMT = delete(revoked_tokens_table).where(
+    revoked_tokens_table.c.expires_at <= bindparam("now")
+)
+
+
+class BloomFilter:
+
+    def __init__(self, capacity: int, error_rate: float):
+        capacity = max(capacity, 1)
+        self.size = max(8, int(-capacity * math.log(error_rate) / (math.log(2) ** 2)))
+        self.hash_count = max(1, round(self.size / capacity * math.log(2)))
+        self.bits = bytearray((self.size + 7) // 8)
+
+    def _positions(self, key: str):
+        digest = hashlib.blake2b(key.encode(), digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], "little")
+        h2 = int.from_bytes(digest[8:], "little") | 1
+        for i in range(self.hash_count):
+            yield (h1 + i * h2) % self.size
+
+    def add(self, key: str) -> None:
+        for position in self._positions(key):
+            self.bits[position >> 3] |= 1 << (position & 7)
+
+    def __contains__(self, key: str) -> bool:
+        return all(
+            self.bits[position >> 3] & (1 << (position & 7))
+            for position in self._positions(key)
+        )
+
+
+EPOCH = datetime(1970, 1, 1)
+
+
+def subject_key(username: str) -> str:
+    return f"sub:{username}"
+
+
+class RevocationStore:
+    """Revoked token ids and user sessions, fronted by a Bloom filter.
+
+    Workers learn about each other's revocations by replaying the
+    ``token_revoked`` events that revoke() appends to the change log. The log
+    is tailed by id, which follows commit order, so a revocation stamped
+    earlier but committed later is still picked up. A worker that fell
+    further behind than ``replay_window`` (events may have been pruned)
+    reloads every live key from ``revoked_tokens`` instead.
+    """
+
+    def __init__(
+        self,
+        capacity: int = settings.REVOCATION_BLOOM_CAPACITY,
+        error_rate: float = settings.REVOCATION_BLOOM_ERROR_RATE,
+        sync_seconds: float = settings.REVOCATION_SYNC_SECONDS,
+        reload_seconds: float = settings.REVOCATION_RELOAD_SECONDS,
+        replay_window: float = settings.INVALIDATION_RETENTION_SECONDS / 2,
+    ):
+        self.capacity = capacity
+        self.error_rate = error_rate
+        self.sync_seconds = sync_seconds
+        self.reload_seconds = reload_seconds
+        self.replay_window = replay_window
+        self._lock = threading.Lock()
+        self._bloom = BloomFilter(capacity, error_rate)
+        self._last_id: Optional[int] = None
+        self._synced_at = 0.0
+        self._next_sync = 0.0
+        self._next_reload = time.monotonic() + reload_seconds
+
+    def revoke(self, db: Session, key: str, expires_at: datetime) -> None:
+        # Whole seconds, like the JWT iat it is compared against.
+        revoked_at = datetime.utcnow().replace(microsecond=0)
+        db.merge(RevokedToken(key=key, expires_at=expires_at, revoked_at=revoked_at))
+        invalidation_bus.publish(db, REVOKED_TOPIC, key)
+        db.commit()
+        with self._lock:
+            self._bloom.add(key)
+
+    def is_revoked(
+        self,
+        db: Session,
+        jti: Optional[str],
+        username: Optional[str] = None,
+        issued_at: Optional[int] = None,
+    ) -> bool:
+        self._maybe_sync(db)
+        now = datetime.utcnow()
+
+        # Bloom filters have no false negatives, so a miss needs no database hit.
+
+        if jti and jti in self._bloom:
+            record = db.get(RevokedToken, jti)
+            if record is not None and record.expires_at > now:
+                return True
+
+        if username:
+            key = subject_key(username)
+            if key in self._bloom:
+                record = db.get(RevokedToken, key)
+                if record is not None and record.expires_at > now:
+                    if issued_at is None:
+                        return True
+                    revoked_at = int((record.revoked_at - EPOCH).total_seconds())
+                    return issued_at <= revoked_at
+
+        return False
+
+    def issued_at(self, db: Session, username: str) -> datetime:
+        """Issue time for a new token of ``username``.
+
+        iat only has whole seconds, so a token issued in the same second as a
+        revocation of the user's sessions would be caught by it; such tokens
+        are stamped with the following second instead. Issuing is rare enough
+        to always ask the database, which also covers revocations made by
+        other workers that this one has not synced yet.
+        """
+        now = datetime.utcnow().replace(microsecond=0)
+        record = db.get(RevokedToken, subject_key(username))
+        if record is not None:
+            revoked_at = record.revoked_at.replace(microsecond=0)
+            if revoked_at >= now:
+                return revoked_at + timedelta(seconds=1)
+        return now
+
+    def _maybe_sync(self, db: Session) -> None:
+        now = time.monotonic()
+        if now < self._next_sync:
+            return
+
+        with self._lock:
+            if now < self._next_sync:
+                return
+            self._next_sync = now + self.sync_seconds
+
+            if (
+                self._last_id is None
+                or now >= self._next_reload
+                or now - self._synced_at > self.replay_window
+            ):
+                self._next_reload = now + self.reload_seconds
+                self._reload(db)
+            else:
+                for row in db.execute(REVOKED_SINCE_STMT, {"last_id": self._last_id}):
+                    self._bloom.add(row.key)
+                    self._last_id = row.id
+            self._synced_at = now
+
+    def prune(self, db: Session) -> int:
+        """Deletes expired revocations; run from ``manage.py``, not requests.
+
+        Request-path syncs only read, so they work on read-only sessions and
+        never commit a request's transaction. Expired keys already drop out
+        of the Bloom filter at its periodic reload.
+        """
+        deleted = db.execute(PRUNE_STMT, {"now": datetime.utcnow()}).rowcount
+        db.commit()
+        return deleted
+
+    def _reload(self, db: Session) -> None:
+        # The log position is read first: a revocation committed while the
+        # keys are read is then replayed by the next sync rather than lost.
+        last_id = db.execute(LAST_CHANGE_STMT).scalar() or 0
+        keys = db.execute(LIVE_KEYS_STMT, {"now": datetime.utcnow()}).scalars().all()
+        bloom = BloomFilter(max(self.capacity, 2 * len(keys)), self.error_rate)
+        for key in keys:
+            bloom.add(key)
+
+        self._bloom = bloom
+        self._last_id = last_id
+
+
+revocation_store = RevocationStore()
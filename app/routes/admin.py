@@ -1,13 +1,32 @@
-from fastapi import APIRouter, Depends, Query
+from fastapi import APIRouter, Depends, Query, status
+from fastapi.responses import FileResponse, StreamingResponse
+from typing import List
 from sqlalchemy.orm import Session
-from sqlalchemy import func
-from datetime import date, datetime
-from app.database import get_db
-from app.models.reservation import Reservation, ReservationStatus
-from app.models.showtime import Showtime
+from datetime import date
+from app.database import get_db, get_read_db, engine, read_engine, async_engine
+from app.pool_metrics import pool_metrics
 from app.models.user import User, UserRole
-from app.models.movie import Movie
-from app.dependencies import require_admin
+from app.read_models import CurrentUserRecord
+from app.dependencies import require_admin, require_admin_read
+from app.admission import admission_controller
+from app.config import settings
+from app.cache import cache
+from app.invalidation import invalidation_bus
+from app.report_jobs import report_jobs
+from app.schemas.analytics import (
+    AnalyticsDimension,
+    AnalyticsReport,
+    AnalyticsSort,
+    SeatHeatmapReport,
+)
+from app.schemas.export import ExportFormat
+from app.schemas.report_job import ReportJobCreate, ReportJobResponse
+from app.services.analytics_service import AnalyticsService
+from app.services.auth_service import AuthService
+from app.services.export_service import MEDIA_TYPES, ExportService
+from app.services.heatmap_service import HeatmapService
+from app.services.rollup_service import RollupService
+from app.stale import public_reads
 from fastapi import HTTPException
 
 router = APIRouter(prefix="/admin", tags=["Admin"])
@@ -17,83 +36,163 @@ router = APIRouter(prefix="/admin", tags=["Admin"])
 def get_reservations_report(
     start_date: date = Query(None),
     end_date: date = Query(None),
-    db: Session = Depends(get_db),
-    admin: User = Depends(require_admin),
+    db: Session = Depends(get_read_db),
+    admin: CurrentUserRecord = Depends(require_admin_read),
 ):
+    return RollupService.get_report(db, start_date, end_date)
+
 
-    query = (
-        db.query(
-            Showtime.id.label("showtime_id"),
-            Movie.title.label("movie_title"),
-            Showtime.start_time,
-            Showtime.hall_number,
-            Showtime.total_seats,
-            func.count(Reservation.id).label("reserved_seats"),
-            (Showtime.price * func.count(Reservation.id)).label("revenue"),
-        )
-        .join(Reservation, Showtime.id == Reservation.showtime_id)
-        .join(Movie, Showtime.movie_id == Movie.id)
-        .filter(Reservation.status == ReservationStatus.CONFIRMED)
+@router.get("/analytics/reservations", response_model=AnalyticsReport)
+def get_reservations_analytics(
+    group_by: List[AnalyticsDimension] = Query([AnalyticsDimension.MOVIE]),
+    start_date: date = Query(None),
+    end_date: date = Query(None),
+    sort: AnalyticsSort = Query(AnalyticsSort.REVENUE),
+    limit: int = Query(100, ge=1, le=settings.ANALYTICS_MAX_PAGE_SIZE),
+    offset: int = Query(0, ge=0),
+    db: Session = Depends(get_read_db),
+    admin: CurrentUserRecord = Depends(require_admin_read),
+):
+    return AnalyticsService.get_report(
+        db, group_by, start_date, end_date, sort, limit, offset
     )
 
-    if start_date:
-        query = query.filter(
-            Showtime.start_time >= datetime.combine(start_date, datetime.min.time())
-        )
-    if end_date:
-        query = query.filter(
-            Showtime.start_time <= datetime.combine(end_date, datetime.max.time())
-        )
-
-    query = query.group_by(
-        Showtime.id,
-        Movie.title,
-        Showtime.start_time,
-        Showtime.hall_number,
-        Showtime.total_seats,
-        Showtime.price,
+
+@router.get("/analytics/seat-heatmap", response_model=SeatHeatmapReport)
+def get_seat_heatmap(
+    start_date: date = Query(None),
+    end_date: date = Query(None),
+    hall_number: int = Query(None),
+    db: Session = Depends(get_read_db),
+    admin: CurrentUserRecord = Depends(require_admin_read),
+):
+    return HeatmapService.get_heatmaps(db, start_date, end_date, hall_number)
+
+
+@router.get("/export/reservations")
+def export_reservations(
+    format: ExportFormat = Query(ExportFormat.CSV),
+    start_date: date = Query(None),
+    end_date: date = Query(None),
+    db: Session = Depends(get_read_db),
+    admin: CurrentUserRecord = Depends(require_admin_read),
+):
+    # The session is closed by get_read_db once the body has been sent.
+    chunks = ExportService.stream_reservations(db, format, start_date, end_date)
+    return StreamingResponse(
+        chunks,
+        media_type=MEDIA_TYPES[format],
+        headers={
+            "Content-Disposition": (
+                f'attachment; filename="reservations.{format.value}"'
+            )
+        },
     )
 
-    results = query.all()
-
-    report = []
-    total_revenue = 0
-
-    for r in results:
-        capacity_percentage = (
-            (r.reserved_seats / r.total_seats * 100) if r.total_seats > 0 else 0
-        )
-        total_revenue += float(r.revenue)
-
-        report.append(
-            {
-                "showtime_id": r.showtime_id,
-                "movie_title": r.movie_title,
-                "start_time": r.start_time,
-                "hall_number": r.hall_number,
-                "total_seats": r.total_seats,
-                "reserved_seats": r.reserved_seats,
-                "capacity_percentage": round(capacity_percentage, 2),
-                "revenue": float(r.revenue),
-            }
-        )
-
-    return {
-        "report": report,
-        "total_revenue": total_revenue,
-        "total_showtimes": len(report),
-    }
+
+@router.post(
+    "/jobs",
+    response_model=ReportJobResponse,
+    status_code=status.HTTP_202_ACCEPTED,
+)
+def submit_report_job(
+    job: ReportJobCreate,
+    db: Session = Depends(get_db),
+    admin: CurrentUserRecord = Depends(require_admin),
+):
+    """Queues a report to run in the background; poll the returned job.
+
+    Submitting a job identical to one still queued or running returns that
+    job instead of starting another.
+    """
+    job_id = report_jobs.submit(db, job.kind, job.params, admin.id)
+    return report_jobs.get(db, job_id)
+
+
+@router.get("/jobs/{job_id}", response_model=ReportJobResponse)
+def get_report_job(
+    job_id: int,
+    db: Session = Depends(get_read_db),
+    admin: CurrentUserRecord = Depends(require_admin_read),
+):
+    return report_jobs.get(db, job_id)
+
+
+@router.get("/jobs/{job_id}/result")
+def download_report_job_result(
+    job_id: int,
+    db: Session = Depends(get_read_db),
+    admin: CurrentUserRecord = Depends(require_admin_read),
+):
+    job = report_jobs.get_result(db, job_id)
+    extension = job.content_type.split("/")[-1].split(".")[-1]
+    return FileResponse(
+        job.path,
+        media_type=job.content_type,
+        filename=f"{job.kind}-{job_id}.{extension}",
+    )
 
 
 @router.post("/users/{user_id}/promote")
 def promote_user_to_admin(
-    user_id: int, db: Session = Depends(get_db), admin: User = Depends(require_admin)
+    user_id: int,
+    db: Session = Depends(get_db),
+    admin: CurrentUserRecord = Depends(require_admin),
 ):
     user = db.query(User).filter(User.id == user_id).first()
     if not user:
         raise HTTPException(status_code=404, detail="User not found")
 
     user.role = UserRole.ADMIN
+    invalidation_bus.publish(db, "users", user.username)
     db.commit()
 
     return {"message": f"User {user.username} promoted to admin"}
+
+
+@router.post("/users/{user_id}/revoke-tokens")
+def revoke_user_tokens(
+    user_id: int,
+    db: Session = Depends(get_db),
+    admin: CurrentUserRecord = Depends(require_admin),
+):
+    user = db.query(User).filter(User.id == user_id).first()
+    if not user:
+        raise HTTPException(status_code=404, detail="User not found")
+
+    # Committed together with the revocation below.
+    invalidation_bus.publish(db, "users", user.username)
+    AuthService.revoke_user_sessions(db, user)
+
+    return {"message": f"All sessions of user {user.username} revoked"}
+
+
+@router.get("/metrics/pool")
+def get_pool_metrics(admin: CurrentUserRecord = Depends(require_admin_read)):
+    pools = {"primary": pool_metrics.pool_status(engine.pool)}
+    if read_engine is not engine:
+        pools["read"] = pool_metrics.pool_status(read_engine.pool)
+    if async_engine is not None:
+        pools["async"] = pool_metrics.pool_status(async_engine.pool)
+
+    return {"pools": pools, "routes": pool_metrics.route_stats()}
+
+
+@router.get("/metrics/invalidation")
+def get_invalidation_metrics(admin: CurrentUserRecord = Depends(require_admin_read)):
+    return invalidation_bus.stats()
+
+
+@router.get("/metrics/cache")
+def get_cache_metrics(admin: CurrentUserRecord = Depends(require_admin_read)):
+    return {**cache.stats(), "stale_while_revalidate": public_reads.stats()}
+
+
+@router.get("/metrics/admission")
+def get_admission_metrics(admin: CurrentUserRecord = Depends(require_admin_read)):
+    return admission_controller.stats()
+
+
+@router.get("/metrics/jobs")
+def get_report_job_metrics(admin: CurrentUserRecord = Depends(require_admin_read)):
+    return report_jobs.stats()
@@ -0,0 +1,104 @@
+from fastapi import APIRouter, Depends, HTTPException, Response, status, Query
+from sqlalchemy.ext.asyncio import AsyncSession
+from datetime import date
+from typing import List
+from app.database import AsyncLazySession, get_async_db, get_lazy_async_db
+from app.models.movie import Movie
+from app.schemas.movie import MovieCreate, MovieUpdate, MovieResponse
+from app.read_models import CurrentUserRecord
+from app.dependencies import require_admin_async
+from app.invalidation import invalidation_bus
+from app.services.movie_service import MovieService
+from app.stale import public_reads
+
+router = APIRouter(prefix="/movies", tags=["Movies"])
+
+
+@router.post("/", response_model=MovieResponse, status_code=status.HTTP_201_CREATED)
+async def create_movie(
+    movie_data: MovieCreate,
+    db: AsyncSession = Depends(get_async_db),
+    admin: CurrentUserRecord = Depends(require_admin_async),
+):
+    movie = Movie(**movie_data.model_dump())
+    db.add(movie)
+    await db.flush()
+    await db.run_sync(invalidation_bus.publish, "movies", movie.id)
+    await db.commit()
+    await db.refresh(movie)
+    return movie
+
+
+@router.get("/", response_model=List[MovieResponse])
+async def get_movies(
+    response: Response, db: AsyncLazySession = Depends(get_lazy_async_db)
+):
+    return await public_reads.get_async(
+        db, response, "movies:list", MovieService.load_movies, tags=("movies",)
+    )
+
+
+@router.get("/schedule")
+async def get_movies_schedule(
+    response: Response,
+    target_date: date = Query(default=date.today()),
+    db: AsyncLazySession = Depends(get_lazy_async_db),
+):
+    return await public_reads.get_async(
+        db,
+        response,
+        f"movies:schedule:{target_date.isoformat()}",
+        lambda session: MovieService.load_schedule(session, target_date),
+        tags=("movies", "showtimes"),
+    )
+
+
+@router.get("/{movie_id}", response_model=MovieResponse)
+async def get_movie(
+    movie_id: int,
+    response: Response,
+    db: AsyncLazySession = Depends(get_lazy_async_db),
+):
+    return await public_reads.get_async(
+        db,
+        response,
+        f"movies:{movie_id}",
+        lambda session: MovieService.load_movie(session, movie_id),
+        tags=(f"movies:{movie_id}",),
+    )
+
+
+@router.put("/{movie_id}", response_model=MovieResponse)
+async def update_movie(
+    movie_id: int,
+    movie_data: MovieUpdate,
+    db: AsyncSession = Depends(get_async_db),
+    admin: CurrentUserRecord = Depends(require_admin_async),
+):
+    movie = await db.get(Movie, movie_id)
+    if not movie:
+        raise HTTPException(status_code=404, detail="Movie not found")
+
+    for key, value in movie_data.model_dump(exclude_unset=True).items():
+        setattr(movie, key, value)
+
+    await db.run_sync(invalidation_bus.publish, "movies", movie.id)
+    await db.commit()
+    await db.refresh(movie)
+    return movie
+
+
+@router.delete("/{movie_id}", status_code=status.HTTP_204_NO_CONTENT)
+async def delete_movie(
+    movie_id: int,
+    db: AsyncSession = Depends(get_async_db),
+    admin: CurrentUserRecord = Depends(require_admin_async),
+):
+    movie = await db.get(Movie, movie_id)
+    if not movie:
+        raise HTTPException(status_code=404, detail="Movie not found")
+
+    await db.delete(movie)
+    await db.run_sync(invalidation_bus.publish, "movies", movie.id)
+    await db.commit()
+    return None
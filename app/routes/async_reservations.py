@@ -0,0 +1,59 @@
+from fastapi import APIRouter, Depends, Query, Response, status
+from sqlalchemy.ext.asyncio import AsyncSession
+from typing import List, Optional
+from app.database import get_async_db
+from app.schemas.reservation import (
+    ReservationCreate,
+    ReservationResponse,
+    ReservationDetail,
+)
+from app.read_models import CurrentUserRecord
+from app.dependencies import get_current_user_async
+from app.services.reservation_service import AsyncReservationService
+
+router = APIRouter(prefix="/reservations", tags=["Reservations"])
+
+
+@router.post(
+    "/", response_model=List[ReservationResponse], status_code=status.HTTP_201_CREATED
+)
+async def create_reservation(
+    reservation_data: ReservationCreate,
+    db: AsyncSession = Depends(get_async_db),
+    current_user: CurrentUserRecord = Depends(get_current_user_async),
+):
+    return await AsyncReservationService.reserve_seats(
+        db=db,
+        user_id=current_user.id,
+        showtime_id=reservation_data.showtime_id,
+        seat_ids=reservation_data.seat_ids,
+    )
+
+
+@router.get("/my", response_model=List[ReservationDetail])
+async def get_my_reservations(
+    response: Response,
+    upcoming_only: bool = False,
+    limit: int = Query(default=50, ge=1, le=200),
+    cursor: Optional[str] = None,
+    db: AsyncSession = Depends(get_async_db),
+    current_user: CurrentUserRecord = Depends(get_current_user_async),
+):
+    reservations, next_cursor = await AsyncReservationService.get_user_reservation_page(
+        db, current_user.id, upcoming_only, limit, cursor
+    )
+    if next_cursor is not None:
+        response.headers["X-Next-Cursor"] = next_cursor
+    return reservations
+
+
+@router.delete("/{reservation_id}", status_code=status.HTTP_204_NO_CONTENT)
+async def cancel_reservation(
+    reservation_id: int,
+    db: AsyncSession = Depends(get_async_db),
+    current_user: CurrentUserRecord = Depends(get_current_user_async),
+):
+    await AsyncReservationService.cancel_reservation(
+        db, reservation_id, current_user.id
+    )
+    return None
@@ -0,0 +1,79 @@
+from fastapi import APIRouter, Depends, Query, status
+from fastapi.responses import StreamingResponse
+from sqlalchemy.ext.asyncio import AsyncSession
+from typing import List
+from app.config import settings
+from app.database import get_async_db
+from app.schemas.showtime import SeatMap, SeatMapDelta, ShowtimeCreate
+from app.schemas.reservation import SeatInfo
+from app.read_models import CurrentUserRecord
+from app.dependencies import require_admin_async
+from app.seat_events import seat_broadcaster, seat_event_stream
+from app.services.movie_service import AsyncMovieService
+
+router = APIRouter(prefix="/showtimes", tags=["Showtimes"])
+
+
+@router.post("/", status_code=status.HTTP_201_CREATED)
+async def create_showtime(
+    showtime_data: ShowtimeCreate,
+    db: AsyncSession = Depends(get_async_db),
+    admin: CurrentUserRecord = Depends(require_admin_async),
+):
+    showtime = await AsyncMovieService.create_showtime_with_seats(
+        db=db,
+        movie_id=showtime_data.movie_id,
+        start_time=showtime_data.start_time,
+        hall_number=showtime_data.hall_number,
+        price=float(showtime_data.price),
+        total_seats=showtime_data.total_seats,
+    )
+    return {"id": showtime.id, "message": "Showtime created with seats"}
+
+
+@router.get("/{showtime_id}/seats", response_model=List[SeatInfo])
+async def get_showtime_seats(
+    showtime_id: int, db: AsyncSession = Depends(get_async_db)
+):
+    return await AsyncMovieService.get_showtime_seats(db, showtime_id)
+
+
+@router.get("/{showtime_id}/available-seats", response_model=List[SeatInfo])
+async def get_available_seats(
+    showtime_id: int, db: AsyncSession = Depends(get_async_db)
+):
+    return await AsyncMovieService.get_available_seats(db, showtime_id)
+
+
+@router.get("/{showtime_id}/seat-map", response_model=SeatMap)
+async def get_seat_map(showtime_id: int, db: AsyncSession = Depends(get_async_db)):
+    return await AsyncMovieService.get_seat_map(db, showtime_id)
+
+
+@router.get("/{showtime_id}/seat-map/delta", response_model=SeatMapDelta)
+async def get_seat_map_delta(
+    showtime_id: int,
+    since: int = Query(ge=0),
+    db: AsyncSession = Depends(get_async_db),
+):
+    return await AsyncMovieService.get_seat_map_delta(db, showtime_id, since)
+
+
+@router.get("/{showtime_id}/seat-events")
+async def stream_seat_events(
+    showtime_id: int, db: AsyncSession = Depends(get_async_db)
+):
+    subscription = seat_broadcaster.subscribe(showtime_id)
+    try:
+        snapshot = await AsyncMovieService.get_seat_map(db, showtime_id)
+    except BaseException:
+        seat_broadcaster.unsubscribe(subscription)
+        raise
+    finally:
+        await db.close()
+
+    return StreamingResponse(
+        seat_event_stream(subscription, snapshot, settings.SEAT_PUSH_HEARTBEAT_SECONDS),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache"},
+    )
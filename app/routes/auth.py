@@ -1,11 +1,21 @@
 from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi.security import HTTPAuthorizationCredentials
 from sqlalchemy.orm import Session
-from datetime import timedelta
+from typing import Optional
 from app.database import get_db
 from app.models.user import User
-from app.schemas.user import UserCreate, UserLogin, UserResponse, Token
-from app.utils import verify_password, get_password_hash, create_access_token
-from app.config import settings
+from app.schemas.user import (
+    UserCreate,
+    UserLogin,
+    UserResponse,
+    Token,
+    RefreshRequest,
+    LogoutRequest,
+)
+from app.utils import verify_password, get_password_hash, decode_access_token
+from app.read_models import CurrentUserRecord
+from app.dependencies import security, get_current_user
+from app.services.auth_service import AuthService
 
 router = APIRouter(prefix="/auth", tags=["Authentication"])
 
@@ -49,9 +59,24 @@ def login(credentials: UserLogin, db: Session = Depends(get_db)):
             detail="Incorrect username or password",
         )
 
-    access_token_expires = timedelta(minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES)
-    access_token = create_access_token(
-        data={"sub": user.username}, expires_delta=access_token_expires
-    )
+    return AuthService.issue_tokens(db, user.id, user.username)
+
 
-    return {"access_token": access_token, "token_type": "bearer"}
+@router.post("/refresh", response_model=Token)
+def refresh(data: RefreshRequest, db: Session = Depends(get_db)):
+    return AuthService.rotate_refresh_token(db, data.refresh_token)
+
+
+@router.post("/logout", status_code=status.HTTP_204_NO_CONTENT)
+def logout(
+    data: Optional[LogoutRequest] = None,
+    credentials: HTTPAuthorizationCredentials = Depends(security),
+    db: Session = Depends(get_db),
+    current_user: CurrentUserRecord = Depends(get_current_user),
+):
+    AuthService.logout(
+        db,
+        decode_access_token(credentials.credentials),
+        data.refresh_token if data else None,
+    )
+    return None
@@ -0,0 +1,227 @@
+from datetime import date
+from typing import Any, Callable, List, NamedTuple, Optional, Type
+from urllib.parse import parse_qsl, urlsplit
+from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi.encoders import jsonable_encoder
+from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
+from pydantic import BaseModel, Field, TypeAdapter, ValidationError
+from sqlalchemy.orm import Session
+from starlette.routing import compile_path
+from app.database import begin_snapshot, get_read_db
+from app.dependencies import authenticate_token
+from app.schemas.batch import BatchItemResult, BatchRequest, BatchResponse
+from app.schemas.movie import MovieResponse
+from app.schemas.reservation import ReservationDetail, SeatInfo
+from app.schemas.showtime import SeatMap, SeatMapDelta
+from app.services.movie_service import MovieService
+from app.services.reservation_service import ReservationService
+
+router = APIRouter(prefix="/batch", tags=["Batch"])
+
+optional_security = HTTPBearer(auto_error=False)
+
+
+class BatchContext:
+    """State shared by the sub-requests of one batch."""
+
+    def __init__(self, db: Session, token: Optional[str]):
+        self.db = db
+        self.token = token
+        self.headers: dict = {}
+        self._user = None
+        self._auth_error: Optional[HTTPException] = None
+
+    def current_user(self):
+        # Authenticated once per batch, on the first sub-request that needs it.
+        if self._user is None and self._auth_error is None:
+            try:
+                if self.token is None:
+                    raise HTTPException(
+                        status_code=status.HTTP_401_UNAUTHORIZED,
+                        detail="Not authenticated",
+                    )
+                self._user = authenticate_token(self.db, self.token)
+            except HTTPException as exc:
+                self._auth_error = exc
+        if self._auth_error is not None:
+            raise self._auth_error
+        return self._user
+
+
+class NoQuery(BaseModel):
+    pass
+
+
+class ScheduleQuery(BaseModel):
+    target_date: date = Field(default_factory=date.today)
+
+
+class SeatMapDeltaQuery(BaseModel):
+    since: int = Field(ge=0)
+
+
+class ReservationPageQuery(BaseModel):
+    upcoming_only: bool = False
+    limit: int = Field(default=50, ge=1, le=200)
+    cursor: Optional[str] = None
+
+
+def my_reservations(ctx: BatchContext, query: ReservationPageQuery):
+    records, next_cursor = ReservationService.get_user_reservation_page(
+        ctx.db,
+        ctx.current_user().id,
+        query.upcoming_only,
+        query.limit,
+        query.cursor,
+    )
+    if next_cursor is not None:
+        ctx.headers["X-Next-Cursor"] = next_cursor
+    return records
+
+
+class BatchRoute(NamedTuple):
+    path: str
+    handler: Callable
+    query: Type[BaseModel]
+    response: Optional[TypeAdapter]
+
+
+# Mirrors the public GET routes. Handlers read through the uncached loaders
+# so every result comes from the batch's snapshot.
+BATCH_ROUTES = [
+    BatchRoute(
+        "/movies/",
+        lambda ctx, query: MovieService.load_movies(ctx.db),
+        NoQuery,
+        TypeAdapter(List[MovieResponse]),
+    ),
+    BatchRoute(
+        "/movies/schedule",
+        lambda ctx, query: MovieService.load_schedule(ctx.db, query.target_date),
+        ScheduleQuery,
+        None,
+    ),
+    BatchRoute(
+        "/movies/{movie_id:int}",
+        lambda ctx, query, movie_id: MovieService.load_movie(ctx.db, movie_id),
+        NoQuery,
+        TypeAdapter(MovieResponse),
+    ),
+    BatchRoute(
+        "/showtimes/{showtime_id:int}/seats",
+        lambda ctx, query, showtime_id: MovieService.load_showtime_seats(
+            ctx.db, showtime_id
+        ),
+        NoQuery,
+        TypeAdapter(List[SeatInfo]),
+    ),
+    BatchRoute(
+        "/showtimes/{showtime_id:int}/available-seats",
+        lambda ctx, query, showtime_id: MovieService.load_available_seats(
+            ctx.db, showtime_id
+        ),
+        NoQuery,
+        TypeAdapter(List[SeatInfo]),
+    ),
+    BatchRoute(
+        "/showtimes/{showtime_id:int}/seat-map",
+        lambda ctx, query, showtime_id: MovieService.load_seat_map(ctx.db, showtime_id),
+        NoQuery,
+        TypeAdapter(SeatMap),
+    ),
+    BatchRoute(
+        "/showtimes/{showtime_id:int}/seat-map/delta",
+        lambda ctx, query, showtime_id: MovieService.get_seat_map_delta(
+            ctx.db, showtime_id, query.since
+        ),
+        SeatMapDeltaQuery,
+        TypeAdapter(SeatMapDelta),
+    ),
+    BatchRoute(
+        "/reservations/my",
+        my_reservations,
+        ReservationPageQuery,
+        TypeAdapter(List[ReservationDetail]),
+    ),
+]
+
+
+def normalize(path: str) -> str:
+    return path.rstrip("/") or "/"
+
+
+def _compile(route: BatchRoute):
+    regex, _, convertors = compile_path(normalize(route.path))
+    return regex, convertors, route
+
+
+_COMPILED_ROUTES = [_compile(route) for route in BATCH_ROUTES]
+
+
+def resolve(path: str):
+    path = normalize(path)
+    for regex, convertors, route in _COMPILED_ROUTES:
+        match = regex.match(path)
+        if match:
+            params = {
+                name: convertors[name].convert(value)
+                for name, value in match.groupdict().items()
+            }
+            return route, params
+    return None, None
+
+
+def run_item(ctx: BatchContext, target: str) -> BatchItemResult:
+    url = urlsplit(target)
+    route, params = resolve(url.path)
+    if route is None:
+        return BatchItemResult(
+            path=target,
+            status=status.HTTP_404_NOT_FOUND,
+            body={"detail": "Not batchable"},
+        )
+
+    ctx.headers = {}
+    try:
+        query = route.query.model_validate(dict(parse_qsl(url.query)))
+        result = route.handler(ctx, query, **params)
+    except ValidationError as exc:
+        return BatchItemResult(
+            path=target,
+            status=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            body={"detail": jsonable_encoder(exc.errors(include_url=False))},
+        )
+    except HTTPException as exc:
+        return BatchItemResult(
+            path=target,
+            status=exc.status_code,
+            headers=exc.headers or {},
+            body={"detail": exc.detail},
+        )
+
+    if route.response is not None:
+        body = route.response.dump_python(
+            route.response.validate_python(result, from_attributes=True),
+            mode="json",
+        )
+    else:
+        body = jsonable_encoder(result)
+    return BatchItemResult(
+        path=target, status=status.HTTP_200_OK, headers=ctx.headers, body=body
+    )
+
+
+@router.post("/", response_model=BatchResponse)
+def run_batch(
+    batch: BatchRequest,
+    db: Session = Depends(get_read_db),
+    credentials: Optional[HTTPAuthorizationCredentials] = Depends(optional_security),
+) -> Any:
+    """Runs GET sub-requests in one session against one database snapshot.
+
+    Each sub-request gets its own status, headers and body; a failing one
+    does not affect the others.
+    """
+    begin_snapshot(db)
+    ctx = BatchContext(db, credentials.credentials if credentials else None)
+    return {"responses": [run_item(ctx, item.path) for item in batch.requests]}
@@ -1,13 +1,15 @@
-from fastapi import APIRouter, Depends, HTTPException, status, Query
+from fastapi import APIRouter, Depends, HTTPException, Response, status, Query
 from sqlalchemy.orm import Session
 from datetime import date
 from typing import List
-from app.database import get_db
+from app.database import LazySession, get_db, get_lazy_read_db
 from app.models.movie import Movie
 from app.schemas.movie import MovieCreate, MovieUpdate, MovieResponse
+from app.read_models import CurrentUserRecord
 from app.dependencies import require_admin
+from app.invalidation import invalidation_bus
 from app.services.movie_service import MovieService
-from app.models.user import User
+from app.stale import public_reads
 
 router = APIRouter(prefix="/movies", tags=["Movies"])
 
@@ -16,33 +18,50 @@ router = APIRouter(prefix="/movies", tags=["Movies"])
 def create_movie(
     movie_data: MovieCreate,
     db: Session = Depends(get_db),
-    admin: User = Depends(require_admin),
+    admin: CurrentUserRecord = Depends(require_admin),
 ):
     movie = Movie(**movie_data.model_dump())
     db.add(movie)
+    db.flush()
+    invalidation_bus.publish(db, "movies", movie.id)
     db.commit()
     db.refresh(movie)
     return movie
 
 
 @router.get("/", response_model=List[MovieResponse])
-def get_movies(db: Session = Depends(get_db)):
-    return db.query(Movie).all()
+def get_movies(response: Response, db: LazySession = Depends(get_lazy_read_db)):
+    return public_reads.get(
+        db, response, "movies:list", MovieService.load_movies, tags=("movies",)
+    )
 
 
 @router.get("/schedule")
 def get_movies_schedule(
-    target_date: date = Query(default=date.today()), db: Session = Depends(get_db)
+    response: Response,
+    target_date: date = Query(default=date.today()),
+    db: LazySession = Depends(get_lazy_read_db),
 ):
-    return MovieService.get_movies_with_showtimes(db, target_date)
+    return public_reads.get(
+        db,
+        response,
+        f"movies:schedule:{target_date.isoformat()}",
+        lambda session: MovieService.load_schedule(session, target_date),
+        tags=("movies", "showtimes"),
+    )
 
 
 @router.get("/{movie_id}", response_model=MovieResponse)
-def get_movie(movie_id: int, db: Session = Depends(get_db)):
-    movie = db.query(Movie).filter(Movie.id == movie_id).first()
-    if not movie:
-        raise HTTPException(status_code=404, detail="Movie not found")
-    return movie
+def get_movie(
+    movie_id: int, response: Response, db: LazySession = Depends(get_lazy_read_db)
+):
+    return public_reads.get(
+        db,
+        response,
+        f"movies:{movie_id}",
+        lambda session: MovieService.load_movie(session, movie_id),
+        tags=(f"movies:{movie_id}",),
+    )
 
 
 @router.put("/{movie_id}", response_model=MovieResponse)
@@ -50,7 +69,7 @@ def update_movie(
     movie_id: int,
     movie_data: MovieUpdate,
     db: Session = Depends(get_db),
-    admin: User = Depends(require_admin),
+    admin: CurrentUserRecord = Depends(require_admin),
 ):
     movie = db.query(Movie).filter(Movie.id == movie_id).first()
     if not movie:
@@ -59,6 +78,7 @@ def update_movie(
     for key, value in movie_data.model_dump(exclude_unset=True).items():
         setattr(movie, key, value)
 
+    invalidation_bus.publish(db, "movies", movie.id)
     db.commit()
     db.refresh(movie)
     return movie
@@ -66,12 +86,15 @@ def update_movie(
 
 @router.delete("/{movie_id}", status_code=status.HTTP_204_NO_CONTENT)
 def delete_movie(
-    movie_id: int, db: Session = Depends(get_db), admin: User = Depends(require_admin)
+    movie_id: int,
+    db: Session = Depends(get_db),
+    admin: CurrentUserRecord = Depends(require_admin),
 ):
     movie = db.query(Movie).filter(Movie.id == movie_id).first()
     if not movie:
         raise HTTPException(status_code=404, detail="Movie not found")
 
     db.delete(movie)
+    invalidation_bus.publish(db, "movies", movie.id)
     db.commit()
     return None
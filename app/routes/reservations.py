@@ -1,13 +1,13 @@
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Response, status
 from sqlalchemy.orm import Session
-from typing import List
+from typing import List, Optional
 from app.database import get_db
-from app.models.user import User
 from app.schemas.reservation import (
     ReservationCreate,
     ReservationResponse,
     ReservationDetail,
 )
+from app.read_models import CurrentUserRecord
 from app.dependencies import get_current_user
 from app.services.reservation_service import ReservationService
 
@@ -20,7 +20,7 @@ router = APIRouter(prefix="/reservations", tags=["Reservations"])
 def create_reservation(
     reservation_data: ReservationCreate,
     db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user),
+    current_user: CurrentUserRecord = Depends(get_current_user),
 ):
     reservations = ReservationService.reserve_seats(
         db=db,
@@ -31,39 +31,28 @@ def create_reservation(
     return reservations
 
 
-@router.get("/my")
+@router.get("/my", response_model=List[ReservationDetail])
 def get_my_reservations(
+    response: Response,
     upcoming_only: bool = False,
+    limit: int = Query(default=50, ge=1, le=200),
+    cursor: Optional[str] = None,
     db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user),
+    current_user: CurrentUserRecord = Depends(get_current_user),
 ):
-    reservations = ReservationService.get_user_reservations(
-        db, current_user.id, upcoming_only
+    reservations, next_cursor = ReservationService.get_user_reservation_page(
+        db, current_user.id, upcoming_only, limit, cursor
     )
-
-    result = []
-    for res in reservations:
-        result.append(
-            {
-                "id": res.id,
-                "movie_title": res.showtime.movie.title,
-                "showtime": res.showtime.start_time,
-                "hall_number": res.showtime.hall_number,
-                "seat_row": res.seat.row,
-                "seat_number": res.seat.number,
-                "status": res.status.value,
-                "created_at": res.created_at,
-            }
-        )
-
-    return result
+    if next_cursor is not None:
+        response.headers["X-Next-Cursor"] = next_cursor
+    return reservations
 
 
 @router.delete("/{reservation_id}", status_code=status.HTTP_204_NO_CONTENT)
 def cancel_reservation(
     reservation_id: int,
     db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user),
+    current_user: CurrentUserRecord = Depends(get_current_user),
 ):
     ReservationService.cancel_reservation(db, reservation_id, current_user.id)
     return None
@@ -1,13 +1,16 @@
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import StreamingResponse
 from sqlalchemy.orm import Session
 from typing import List
-from app.database import get_db
-from app.models.showtime import Showtime
-from app.schemas.showtime import ShowtimeCreate
+from app.config import settings
+from app.database import get_db, get_read_db
+from app.schemas.showtime import SeatMap, SeatMapDelta, ShowtimeCreate
 from app.schemas.reservation import SeatInfo
+from app.read_models import CurrentUserRecord
 from app.dependencies import require_admin
+from app.seat_events import seat_broadcaster, seat_event_stream
 from app.services.movie_service import MovieService
-from app.models.user import User
 
 router = APIRouter(prefix="/showtimes", tags=["Showtimes"])
 
@@ -16,7 +19,7 @@ router = APIRouter(prefix="/showtimes", tags=["Showtimes"])
 def create_showtime(
     showtime_data: ShowtimeCreate,
     db: Session = Depends(get_db),
-    admin: User = Depends(require_admin),
+    admin: CurrentUserRecord = Depends(require_admin),
 ):
     showtime = MovieService.create_showtime_with_seats(
         db=db,
@@ -30,14 +33,44 @@ def create_showtime(
 
 
 @router.get("/{showtime_id}/seats", response_model=List[SeatInfo])
-def get_showtime_seats(showtime_id: int, db: Session = Depends(get_db)):
-    showtime = db.query(Showtime).filter(Showtime.id == showtime_id).first()
-    if not showtime:
-        raise HTTPException(status_code=404, detail="Showtime not found")
-
-    return showtime.seats
+def get_showtime_seats(showtime_id: int, db: Session = Depends(get_read_db)):
+    return MovieService.get_showtime_seats(db, showtime_id)
 
 
 @router.get("/{showtime_id}/available-seats", response_model=List[SeatInfo])
-def get_available_seats(showtime_id: int, db: Session = Depends(get_db)):
+def get_available_seats(showtime_id: int, db: Session = Depends(get_read_db)):
     return MovieService.get_available_seats(db, showtime_id)
+
+
+@router.get("/{showtime_id}/seat-map", response_model=SeatMap)
+def get_seat_map(showtime_id: int, db: Session = Depends(get_read_db)):
+    return MovieService.get_seat_map(db, showtime_id)
+
+
+@router.get("/{showtime_id}/seat-map/delta", response_model=SeatMapDelta)
+def get_seat_map_delta(
+    showtime_id: int, since: int = Query(ge=0), db: Session = Depends(get_read_db)
+):
+    return MovieService.get_seat_map_delta(db, showtime_id, since)
+
+
+@router.get("/{showtime_id}/seat-events")
+async def stream_seat_events(showtime_id: int, db: Session = Depends(get_read_db)):
+    # Subscribe before the snapshot so nothing committed in between is lost;
+    # clients drop events whose version is not newer than the snapshot.
+    subscription = seat_broadcaster.subscribe(showtime_id)
+    try:
+        snapshot = await run_in_threadpool(MovieService.get_seat_map, db, showtime_id)
+    except BaseException:
+        seat_broadcaster.unsubscribe(subscription)
+        raise
+    finally:
+        # Subscribers stay connected for a long time; release the pooled
+        # connection now rather than when the stream ends.
+        await run_in_threadpool(db.close)
+
+    return StreamingResponse(
+        seat_event_stream(subscription, snapshot, settings.SEAT_PUSH_HEARTBEAT_SECONDS),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache"},
+    )
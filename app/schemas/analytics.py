@@ -0,0 +1,59 @@
+import enum
+from datetime import date
+from typing import Any, Dict, List, Optional
+from pydantic import BaseModel
+
+
+class AnalyticsDimension(str, enum.Enum):
+    MOVIE = "movie"
+    GENRE = "genre"
+    HALL = "hall"
+    # 0 = Sunday ... 6 = Saturday, as returned by SQLite's strftime('%w').
+    WEEKDAY = "weekday"
+    HOUR = "hour"
+
+
+class AnalyticsSort(str, enum.Enum):
+    REVENUE = "revenue"
+    OCCUPANCY = "occupancy_percentage"
+    RESERVED_SEATS = "reserved_seats"
+    SHOWTIMES = "showtimes"
+
+
+class AnalyticsTotals(BaseModel):
+    showtimes: int
+    capacity: int
+    reserved_seats: int
+    occupancy_percentage: Optional[float]
+    revenue: float
+
+
+class AnalyticsReport(BaseModel):
+    group_by: List[AnalyticsDimension]
+    start_date: Optional[date]
+    end_date: Optional[date]
+    total_groups: int
+    limit: int
+    offset: int
+    totals: AnalyticsTotals
+    # One row per group: the dimension columns followed by the totals.
+    rows: List[Dict[str, Any]]
+
+
+class HallHeatmap(BaseModel):
+    hall_number: int
+    showtimes: int
+    rows: List[str]
+    first_number: int
+    seat_numbers: int
+    # Indexed [row][number - first_number]; None where the seat does not exist (or, for
+    # fill_order, never sold). fill_order is the mean share of the showtime
+    # already sold when the seat sold: low values sell first.
+    occupancy: List[List[Optional[float]]]
+    fill_order: List[List[Optional[float]]]
+
+
+class SeatHeatmapReport(BaseModel):
+    start_date: Optional[date]
+    end_date: Optional[date]
+    halls: List[HallHeatmap]
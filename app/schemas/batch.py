@@ -0,0 +1,26 @@
+from pydantic import BaseModel, Field
+from typing import Any, Dict, List, Literal
+from app.config import settings
+
+
+class BatchItem(BaseModel):
+    method: Literal["GET"] = "GET"
+    # Path with optional query string, e.g. "/movies/schedule?target_date=2024-05-01"
+    path: str
+
+
+class BatchRequest(BaseModel):
+    requests: List[BatchItem] = Field(
+        min_length=1, max_length=settings.BATCH_MAX_REQUESTS
+    )
+
+
+class BatchItemResult(BaseModel):
+    path: str
+    status: int
+    headers: Dict[str, str] = {}
+    body: Any = None
+
+
+class BatchResponse(BaseModel):
+    responses: List[BatchItemResult]
@@ -0,0 +1,59 @@
+import enum
+from datetime import date, datetime
+from typing import Any, Dict, List, Optional
+from pydantic import BaseModel, ConfigDict, Field
+from app.config import settings
+from app.models.report_job import ReportJobStatus
+from app.schemas.analytics import AnalyticsDimension, AnalyticsSort
+from app.schemas.export import ExportFormat
+
+
+class ReportJobKind(str, enum.Enum):
+    RESERVATIONS_REPORT = "reservations_report"
+    ANALYTICS = "analytics"
+    SEAT_HEATMAP = "seat_heatmap"
+    RESERVATIONS_EXPORT = "reservations_export"
+
+
+# Parameters mirror the query parameters of the matching admin endpoints.
+# Unknown fields are rejected so that a typo cannot defeat de-duplication.
+class DateRangeParams(BaseModel):
+    model_config = ConfigDict(extra="forbid")
+
+    start_date: Optional[date] = None
+    end_date: Optional[date] = None
+
+
+class AnalyticsParams(DateRangeParams):
+    group_by: List[AnalyticsDimension] = Field(
+        default=[AnalyticsDimension.MOVIE], min_length=1
+    )
+    sort: AnalyticsSort = AnalyticsSort.REVENUE
+    limit: int = Field(default=100, ge=1, le=settings.ANALYTICS_MAX_PAGE_SIZE)
+    offset: int = Field(default=0, ge=0)
+
+
+class SeatHeatmapParams(DateRangeParams):
+    hall_number: Optional[int] = None
+
+
+class ExportParams(DateRangeParams):
+    format: ExportFormat = ExportFormat.CSV
+
+
+class ReportJobCreate(BaseModel):
+    kind: ReportJobKind
+    params: Dict[str, Any] = {}
+
+
+class ReportJobResponse(BaseModel):
+    id: int
+    kind: ReportJobKind
+    params: Dict[str, Any]
+    status: ReportJobStatus
+    created_at: datetime
+    started_at: Optional[datetime]
+    finished_at: Optional[datetime]
+    error: Optional[str]
+    # Set once the job has succeeded.
+    result_url: Optional[str]
@@ -38,3 +38,6 @@ class ReservationDetail(BaseModel):
     seat_number: int
     status: str
     created_at: datetime
+
+    class Config:
+        from_attributes = True
@@ -24,3 +24,16 @@ class ShowtimeResponse(BaseModel):
 
     class Config:
         from_attributes = True
+
+
+class SeatMap(BaseModel):
+    showtime_id: int
+    version: int
+    seats: str
+
+
+class SeatMapDelta(BaseModel):
+    showtime_id: int
+    version: int
+    since: int
+    changes: str
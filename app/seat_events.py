@@ -0,0 +1,186 @@
+import asyncio
+import json
+import threading
+from collections import defaultdict
+from typing import AsyncIterator, Dict, Iterable, Optional, Set, Tuple
+from app.config import settings
+from app.invalidation import RESET_TOPIC, InvalidationEvent, invalidation_bus
+from app.seat_map import encode_seat_changes
+
+SeatKey = Tuple[str, int]
+
+
+class Subscription:
+    def __init__(self, showtime_id: int, queue_size: int):
+        self.showtime_id = showtime_id
+        self.queue: asyncio.Queue = asyncio.Queue(maxsize=queue_size)
+        self.lagged = False
+
+    def offer(self, message: Tuple[str, dict]) -> None:
+        # A subscriber that can't keep up gets a single resync marker instead
+        # of an unbounded backlog; it re-reads the full seat map.
+        if self.lagged:
+            return
+        try:
+            self.queue.put_nowait(message)
+        except asyncio.QueueFull:
+            self.lagged = True
+            while not self.queue.empty():
+                self.queue.get_nowait()
+            self.queue.put_nowait(("resync", {}))
+
+
+class SeatBroadcaster:
+    """Fans seat changes out to every subscriber of a showtime.
+
+    Seat writes arrive via the invalidation bus from any thread. Changes are
+    merged per showtime and flushed by one task on the event loop at most
+    once per interval, so a burst of reservations becomes one message and
+    no subscriber ever queries the database for updates.
+    """
+
+    def __init__(self, interval: float, queue_size: int):
+        self.interval = interval
+        self.queue_size = queue_size
+        self._lock = threading.Lock()
+        self._subscribers: Dict[int, Set[Subscription]] = defaultdict(set)
+        self._pending: Dict[int, Dict[SeatKey, bool]] = {}
+        self._versions: Dict[int, int] = {}
+        self._flusher: Optional[asyncio.Task] = None
+        self._resync_requested = False
+        self.published = 0
+        self.messages_sent = 0
+
+    def subscriber_count(self, showtime_id: Optional[int] = None) -> int:
+        with self._lock:
+            if showtime_id is not None:
+                return len(self._subscribers.get(showtime_id, ()))
+            return sum(len(subs) for subs in self._subscribers.values())
+
+    def subscribe(self, showtime_id: int) -> Subscription:
+        subscription = Subscription(showtime_id, self.queue_size)
+        with self._lock:
+            self._subscribers[showtime_id].add(subscription)
+        loop = asyncio.get_running_loop()
+        if (
+            self._flusher is None
+            or self._flusher.done()
+            or self._flusher.get_loop() is not loop
+        ):
+            self._flusher = loop.create_task(self._run())
+        return subscription
+
+    def unsubscribe(self, subscription: Subscription) -> None:
+        with self._lock:
+            subscribers = self._subscribers.get(subscription.showtime_id)
+            if subscribers is not None:
+                subscribers.discard(subscription)
+                if not subscribers:
+                    del self._subscribers[subscription.showtime_id]
+                    self._pending.pop(subscription.showtime_id, None)
+                    self._versions.pop(subscription.showtime_id, None)
+
+    def publish(
+        self, showtime_id: int, version: int, seats: Iterable[Tuple[str, int, bool]]
+    ) -> None:
+        with self._lock:
+            if showtime_id not in self._subscribers:
+                return
+            pending = self._pending.setdefault(showtime_id, {})
+            for row, number, is_reserved in seats:
+                pending[(row, number)] = is_reserved
+            self._versions[showtime_id] = max(
+                version, self._versions.get(showtime_id, 0)
+            )
+            self.published += 1
+
+    def request_resync(self) -> None:
+        with self._lock:
+            self._resync_requested = True
+
+    def flush(self) -> int:
+        with self._lock:
+            if self._resync_requested:
+                self._resync_requested = False
+                self._pending = {}
+                subscribers = [s for subs in self._subscribers.values() for s in subs]
+                for subscription in subscribers:
+                    subscription.offer(("resync", {}))
+                return len(subscribers)
+            pending, self._pending = self._pending, {}
+            batches = [
+                (
+                    self._versions[showtime_id],
+                    seats,
+                    list(self._subscribers.get(showtime_id, ())),
+                )
+                for showtime_id, seats in pending.items()
+            ]
+
+        sent = 0
+        for version, seats, subscribers in batches:
+            changes = encode_seat_changes(
+                (row, number, is_reserved)
+                for (row, number), is_reserved in sorted(seats.items())
+            )
+            message = ("seats", {"version": version, "changes": changes})
+            for subscription in subscribers:
+                subscription.offer(message)
+                sent += 1
+        self.messages_sent += sent
+        return sent
+
+    async def _run(self) -> None:
+        while self.subscriber_count():
+            await asyncio.sleep(self.interval)
+            self.flush()
+
+
+def format_sse(event: str, data: dict) -> str:
+    return f"event: {event}\ndata: {json.dumps(data, separators=(',', ':'))}\n\n"
+
+
+async def seat_event_stream(
+    subscription: Subscription, snapshot: dict, heartbeat: float
+) -> AsyncIterator[str]:
+    try:
+        yield format_sse("snapshot", snapshot)
+        while True:
+            try:
+                event, data = await asyncio.wait_for(
+                    subscription.queue.get(), timeout=heartbeat
+                )
+            except asyncio.TimeoutError:
+                yield ": keep-alive\n\n"
+                continue
+
+            yield format_sse(event, data)
+            if event == "resync":
+                return
+    finally:
+        seat_broadcaster.unsubscribe(subscription)
+
+
+seat_broadcaster = SeatBroadcaster(
+    interval=settings.SEAT_PUSH_INTERVAL_SECONDS,
+    queue_size=settings.SEAT_PUSH_QUEUE_SIZE,
+)
+
+
+def _on_seat_change(event: InvalidationEvent) -> None:
+    # Seat writes reach subscribers through the bus, so a reservation made in
+    # any worker is pushed by every worker's broadcaster.
+    if event.topic == RESET_TOPIC:
+        seat_broadcaster.request_resync()
+        return
+    seat_broadcaster.publish(
+        int(event.key),
+        event.payload["version"],
+        [
+            (row, number, is_reserved)
+            for row, number, is_reserved in event.payload["seats"]
+        ],
+    )
+
+
+invalidation_bus.subscribe("seats", _on_seat_change)
@@ -0,0 +1,91 @@
+from typing import Iterable, List
+import numpy as np
+
+# One element per seat of every showtime in range; ``reservation`` is the
+# id of its confirmed reservation, or 0 when the seat was not sold.
+SEAT_DTYPE = np.dtype(
+    [
+        ("hall", np.int32),
+        ("showtime", np.int64),
+        ("row", "U5"),
+        ("number", np.int32),
+        ("reservation", np.int64),
+    ]
+)
+
+
+def load_seats(rows: Iterable[tuple]) -> np.ndarray:
+    return np.fromiter((tuple(row) for row in rows), dtype=SEAT_DTYPE)
+
+
+def fill_positions(showtime: np.ndarray, reservation: np.ndarray) -> np.ndarray:
+    """Share of its showtime already sold when each seat sold; NaN if unsold.
+
+    Reservation ids grow with time, so ranking sold seats by id within their
+    showtime gives the order they sold in. The rank is divided by the
+    showtime's seat count: 0.0 is the first seat sold.
+    """
+    _, showtime_index, capacity = np.unique(
+        showtime, return_inverse=True, return_counts=True
+    )
+    sold = np.flatnonzero(reservation > 0)
+    order = sold[np.lexsort((reservation[sold], showtime_index[sold]))]
+    groups = showtime_index[order]
+    starts = np.flatnonzero(np.r_[True, groups[1:] != groups[:-1]])
+    sizes = np.diff(np.r_[starts, len(order)])
+    rank = np.arange(len(order)) - np.repeat(starts, sizes)
+
+    positions = np.full(len(showtime), np.nan)
+    positions[order] = rank / capacity[groups]
+    return positions
+
+
+def compact(matrix: np.ndarray, decimals: int = 3) -> list:
+    return np.where(np.isnan(matrix), None, np.round(matrix, decimals)).tolist()
+
+
+def hall_heatmaps(seats: np.ndarray) -> List[dict]:
+    """Per-hall occupancy-rate and mean fill-position matrices.
+
+    Matrices are indexed [row][number - first_number], rows in label order,
+    first_number being the lowest seat number in the hall. A cell is
+    None where the hall has no such seat (occupancy) or it never sold (fill
+    order).
+    """
+    positions = fill_positions(seats["showtime"], seats["reservation"])
+    by_hall = np.argsort(seats["hall"], kind="stable")
+    seats, positions = seats[by_hall], positions[by_hall]
+    halls, starts = np.unique(seats["hall"], return_index=True)
+
+    heatmaps = []
+    for hall, hall_seats, hall_positions in zip(
+        halls, np.split(seats, starts[1:]), np.split(positions, starts[1:])
+    ):
+        rows, row_index = np.unique(hall_seats["row"], return_inverse=True)
+        first_number = int(hall_seats["number"].min())
+        width = int(hall_seats["number"].max()) - first_number + 1
+        cells = row_index * width + hall_seats["number"] - first_number
+        size = len(rows) * width
+        sold = ~np.isnan(hall_positions)
+
+        offered = np.bincount(cells, minlength=size)
+        sold_count = np.bincount(cells[sold], minlength=size)
+        position_sum = np.bincount(
+            cells[sold], weights=hall_positions[sold], minlength=size
+        )
+        with np.errstate(invalid="ignore", divide="ignore"):
+            occupancy = (sold_count / offered).reshape(len(rows), width)
+            fill_order = (position_sum / sold_count).reshape(len(rows), width)
+
+        heatmaps.append(
+            {
+                "hall_number": int(hall),
+                "showtimes": len(np.unique(hall_seats["showtime"])),
+                "rows": rows.tolist(),
+                "first_number": first_number,
+                "seat_numbers": width,
+                "occupancy": compact(occupancy),
+                "fill_order": compact(fill_order),
+            }
+        )
+    return heatmaps
@@ -0,0 +1,62 @@
+import re
+from itertools import groupby
+from typing import Dict, Iterable, Tuple
+
+FREE = "."
+RESERVED = "x"
+MISSING = "_"
+
+ROW_SEPARATOR = "/"
+CHANGE_SEPARATOR = ","
+
+_RUN = re.compile(r"(\d*)([._x])")
+
+
+def seat_symbol(is_reserved: bool) -> str:
+    return RESERVED if is_reserved else FREE
+
+
+def encode_runs(symbols: Iterable[str]) -> str:
+    runs = []
+    for symbol, group in groupby(symbols):
+        count = sum(1 for _ in group)
+        runs.append(f"{count}{symbol}" if count > 1 else symbol)
+    return "".join(runs)
+
+
+def decode_runs(encoded: str) -> str:
+    return "".join(symbol * int(count or 1) for count, symbol in _RUN.findall(encoded))
+
+
+def encode_seat_map(seats: Iterable[Tuple[str, int, bool]]) -> str:
+    """Row-major run-length map, e.g. ``A:3.2x5./B:10.``.
+
+    ``seats`` must be ordered by row, then number. Numbers start at 1; a gap
+    in the numbering is drawn as ``_`` so positions stay aligned.
+    """
+    rows: Dict[str, list] = {}
+    for row, number, is_reserved in seats:
+        cells = rows.setdefault(row, [])
+        cells.extend(MISSING * (number - len(cells) - 1))
+        cells.append(seat_symbol(is_reserved))
+    return ROW_SEPARATOR.join(
+        f"{row}:{encode_runs(cells)}" for row, cells in rows.items()
+    )
+
+
+def decode_seat_map(encoded: str) -> Dict[str, str]:
+    if not encoded:
+        return {}
+    rows = {}
+    for chunk in encoded.split(ROW_SEPARATOR):
+        row, runs = chunk.split(":", 1)
+        rows[row] = decode_runs(runs)
+    return rows
+
+
+def encode_seat_changes(seats: Iterable[Tuple[str, int, bool]]) -> str:
+    """Changed seats as ``row:number`` plus symbol, e.g. ``A:3x,B:7.``."""
+    return CHANGE_SEPARATOR.join(
+        f"{row}:{number}{seat_symbol(is_reserved)}"
+        for row, number, is_reserved in seats
+    )
@@ -0,0 +1,170 @@
+from datetime import date
+from functools import lru_cache
+from typing import Any, NamedTuple, Optional, Sequence, Tuple
+from sqlalchemy import Integer, bindparam, cast, func, select
+from sqlalchemy.orm import Session
+from app.cache import cache
+from app.config import settings
+from app.models.movie import Movie
+from app.models.rollup import ShowtimeRollup
+from app.models.showtime import Showtime
+from app.schemas.analytics import AnalyticsDimension, AnalyticsSort
+from app.utils import date_range_bounds
+
+movies_table = Movie.__table__
+showtimes_table = Showtime.__table__
+showtime_rollups = ShowtimeRollup.__table__
+
+DIMENSION_COLUMNS = {
+    AnalyticsDimension.MOVIE: (
+        movies_table.c.id.label("movie_id"),
+        movies_table.c.title.label("movie_title"),
+    ),
+    AnalyticsDimension.GENRE: (movies_table.c.genre.label("genre"),),
+    AnalyticsDimension.HALL: (showtimes_table.c.hall_number.label("hall_number"),),
+    AnalyticsDimension.WEEKDAY: (
+        cast(func.strftime("%w", showtimes_table.c.start_time), Integer).label(
+            "weekday"
+        ),
+    ),
+    AnalyticsDimension.HOUR: (
+        cast(func.strftime("%H", showtimes_table.c.start_time), Integer).label("hour"),
+    ),
+}
+
+MOVIE_DIMENSIONS = {AnalyticsDimension.MOVIE, AnalyticsDimension.GENRE}
+
+_reserved = func.coalesce(func.sum(showtime_rollups.c.reserved_seats), 0)
+_capacity = func.coalesce(func.sum(showtimes_table.c.total_seats), 0)
+
+METRIC_COLUMNS = (
+    func.count(showtimes_table.c.id).label("showtimes"),
+    _capacity.label("capacity"),
+    _reserved.label("reserved_seats"),
+    func.round(100.0 * _reserved / func.nullif(_capacity, 0), 2).label(
+        "occupancy_percentage"
+    ),
+    func.round(
+        func.coalesce(func.sum(showtime_rollups.c.revenue_cents), 0) / 100.0, 2
+    ).label("revenue"),
+)
+
+METRIC_NAMES = [column.name for column in METRIC_COLUMNS]
+
+
+class AnalyticsStatements(NamedTuple):
+    rows: Any
+    count: Any
+    totals: Any
+
+
+@lru_cache(maxsize=256)
+def build_statements(
+    dimensions: Tuple[AnalyticsDimension, ...], sort: AnalyticsSort
+) -> AnalyticsStatements:
+    """Builds the grouped, count and totals statements for one combination.
+
+    Showtimes within the range are scanned through their covering
+    start_time index and joined to the rollups by primary key; movies are
+    joined only when a movie dimension is requested.
+    """
+    source = showtimes_table.outerjoin(showtime_rollups)
+    if MOVIE_DIMENSIONS.intersection(dimensions):
+        source = source.join(movies_table)
+    in_range = (
+        showtimes_table.c.start_time >= bindparam("start"),
+        showtimes_table.c.start_time < bindparam("end"),
+    )
+    keys = [
+        column for dimension in dimensions for column in DIMENSION_COLUMNS[dimension]
+    ]
+
+    grouped = (
+        select(*keys, *METRIC_COLUMNS)
+        .select_from(source)
+        .where(*in_range)
+        .group_by(*keys)
+    )
+    # Group keys break ties so that pages never overlap.
+    rows = (
+        grouped.order_by(METRIC_COLUMNS[METRIC_NAMES.index(sort.value)].desc(), *keys)
+        .limit(bindparam("limit"))
+        .offset(bindparam("offset"))
+    )
+    count = select(func.count()).select_from(
+        select(*keys).select_from(source).where(*in_range).group_by(*keys).subquery()
+    )
+    totals = (
+        select(*METRIC_COLUMNS)
+        .select_from(showtimes_table.outerjoin(showtime_rollups))
+        .where(*in_range)
+    )
+    return AnalyticsStatements(rows, count, totals)
+
+
+def normalize_dimensions(
+    dimensions: Sequence[AnalyticsDimension],
+) -> Tuple[AnalyticsDimension, ...]:
+    return tuple(dict.fromkeys(dimensions))
+
+
+class AnalyticsService:
+
+    @staticmethod
+    def load_report(
+        db: Session,
+        dimensions: Tuple[AnalyticsDimension, ...],
+        start_date: Optional[date],
+        end_date: Optional[date],
+        sort: AnalyticsSort,
+        limit: int,
+        offset: int,
+    ) -> dict:
+        statements = build_statements(dimensions, sort)
+        bounds = date_range_bounds(start_date, end_date)
+        rows = db.execute(statements.rows, {**bounds, "limit": limit, "offset": offset})
+        totals = db.execute(statements.totals, bounds).one()
+
+        return {
+            "group_by": list(dimensions),
+            "start_date": start_date,
+            "end_date": end_date,
+            "total_groups": db.execute(statements.count, bounds).scalar(),
+            "limit": limit,
+            "offset": offset,
+            "totals": dict(totals._mapping),
+            "rows": [dict(row._mapping) for row in rows],
+        }
+
+    @staticmethod
+    def get_report(
+        db: Session,
+        dimensions: Sequence[AnalyticsDimension],
+        start_date: Optional[date] = None,
+        end_date: Optional[date] = None,
+        sort: AnalyticsSort = AnalyticsSort.REVENUE,
+        limit: int = 100,
+        offset: int = 0,
+    ) -> dict:
+        """Revenue and occupancy grouped by the requested dimensions.
+
+        Cached for ANALYTICS_CACHE_TTL_SECONDS; catalog changes invalidate
+        it, new reservations show up once the entry expires.
+        """
+        dimensions = normalize_dimensions(dimensions)
+        key = "analytics:{}:{}:{}:{}:{}:{}".format(
+            ",".join(d.value for d in dimensions),
+            start_date,
+            end_date,
+            sort.value,
+            limit,
+            offset,
+        )
+        return cache.get_or_load(
+            key,
+            lambda: AnalyticsService.load_report(
+                db, dimensions, start_date, end_date, sort, limit, offset
+            ),
+            ttl=settings.ANALYTICS_CACHE_TTL_SECONDS,
+            tags=("movies", "showtimes"),
+        )
@@ -0,0 +1,144 @@
+from sqlalchemy.orm import Session
+from fastapi import HTTPException, status
+from datetime import datetime, timedelta
+from typing import Optional
+from app.models.refresh_token import RefreshToken
+from app.models.user import User
+from app.utils import create_access_token, create_refresh_token, hash_refresh_token
+from app.revocation import revocation_store, subject_key
+from app.config import settings
+
+
+class AuthService:
+
+    @staticmethod
+    def issue_tokens(db: Session, user_id: int, username: str) -> dict:
+        access_token = create_access_token(
+            data={"sub": username},
+            expires_delta=timedelta(minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES),
+            issued_at=revocation_store.issued_at(db, username),
+        )
+
+        refresh_token = create_refresh_token()
+        db.add(
+            RefreshToken(
+                token_hash=hash_refresh_token(refresh_token),
+                user_id=user_id,
+                expires_at=datetime.utcnow()
+                + timedelta(days=settings.REFRESH_TOKEN_EXPIRE_DAYS),
+            )
+        )
+        db.commit()
+
+        return {
+            "access_token": access_token,
+            "refresh_token": refresh_token,
+            "token_type": "bearer",
+        }
+
+    @staticmethod
+    def rotate_refresh_token(db: Session, refresh_token: str) -> dict:
+        record = (
+            db.query(
+                RefreshToken.id,
+                RefreshToken.user_id,
+                RefreshToken.expires_at,
+                RefreshToken.revoked_at,
+                User.username,
+            )
+            .join(User, User.id == RefreshToken.user_id)
+            .filter(RefreshToken.token_hash == hash_refresh_token(refresh_token))
+            .first()
+        )
+
+        if record is None:
+            raise HTTPException(
+                status_code=status.HTTP_401_UNAUTHORIZED,
+                detail="Invalid refresh token",
+            )
+
+        now = datetime.utcnow()
+
+        if record.revoked_at is not None:
+            # A rotated token was presented again: treat the whole chain as stolen.
+            AuthService.revoke_user_refresh_tokens(db, record.user_id)
+            db.commit()
+            raise HTTPException(
+                status_code=status.HTTP_401_UNAUTHORIZED,
+                detail="Refresh token has been revoked",
+            )
+
+        if record.expires_at < now:
+            raise HTTPException(
+                status_code=status.HTTP_401_UNAUTHORIZED,
+                detail="Refresh token expired",
+            )
+
+        rotated = (
+            db.query(RefreshToken)
+            .filter(RefreshToken.id == record.id, RefreshToken.revoked_at.is_(None))
+            .update({RefreshToken.revoked_at: now}, synchronize_session=False)
+        )
+        if rotated != 1:
+            db.rollback()
+            raise HTTPException(
+                status_code=status.HTTP_401_UNAUTHORIZED,
+                detail="Refresh token has been revoked",
+            )
+
+        return AuthService.issue_tokens(db, record.user_id, record.username)
+
+    @staticmethod
+    def revoke_user_refresh_tokens(db: Session, user_id: int) -> int:
+        """Marks the user's refresh tokens revoked; the caller commits."""
+        return (
+            db.query(RefreshToken)
+            .filter(RefreshToken.user_id == user_id, RefreshToken.revoked_at.is_(None))
+            .update(
+                {RefreshToken.revoked_at: datetime.utcnow()}, synchronize_session=False
+            )
+        )
+
+    @staticmethod
+    def prune_refresh_tokens(db: Session) -> int:
+        """Deletes expired refresh tokens; run from ``manage.py``.
+
+        Rotation keeps each replaced token as a revoked row so that reusing
+        it can be detected, but only until it expires: an expired token is
+        rejected whether or not its row is still there.
+        """
+        deleted = (
+            db.query(RefreshToken)
+            .filter(RefreshToken.expires_at <= datetime.utcnow())
+            .delete(synchronize_session=False)
+        )
+        db.commit()
+        return deleted
+
+    @staticmethod
+    def logout(db: Session, payload: dict, refresh_token: Optional[str] = None) -> None:
+        if refresh_token:
+            db.query(RefreshToken).filter(
+                RefreshToken.token_hash == hash_refresh_token(refresh_token),
+                RefreshToken.revoked_at.is_(None),
+            ).update(
+                {RefreshToken.revoked_at: datetime.utcnow()}, synchronize_session=False
+            )
+
+        if payload.get("jti"):
+            revocation_store.revoke(
+                db, payload["jti"], datetime.utcfromtimestamp(payload["exp"])
+            )
+        else:
+            db.commit()
+
+    @staticmethod
+    def revoke_user_sessions(db: Session, user: User) -> None:
+        # One transaction: revoke() commits the refresh tokens with the
+        # revocation of the user's access tokens.
+        AuthService.revoke_user_refresh_tokens(db, user.id)
+        revocation_store.revoke(
+            db,
+            subject_key(user.username),
+            datetime.utcnow() + timedelta(minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES),
+        )
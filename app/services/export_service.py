@@ -0,0 +1,189 @@
+import csv
+import io
+from datetime import date
+from typing import Iterator, Optional
+from fastapi import HTTPException, status
+from sqlalchemy import String, bindparam, func, select, type_coerce
+from sqlalchemy.orm import Session
+from app.config import settings
+from app.models.movie import Movie
+from app.models.reservation import Reservation
+from app.models.seat import Seat
+from app.models.showtime import Showtime
+from app.schemas.export import ExportFormat
+from app.utils import date_range_bounds
+
+movies_table = Movie.__table__
+showtimes_table = Showtime.__table__
+seats_table = Seat.__table__
+reservations_table = Reservation.__table__
+
+# Timestamps are read as the stored ISO text: CSV writes it unchanged and
+# Parquet parses a whole column at once, instead of building a datetime per
+# value. There is no ORDER BY, which would sort the full result before the
+# first row could be sent.
+EXPORT_STMT = (
+    select(
+        reservations_table.c.id.label("reservation_id"),
+        func.lower(reservations_table.c.status, type_=String).label("status"),
+        type_coerce(reservations_table.c.created_at, String).label("reserved_at"),
+        reservations_table.c.user_id,
+        seats_table.c.id.label("seat_id"),
+        seats_table.c.row.label("seat_row"),
+        seats_table.c.number.label("seat_number"),
+        showtimes_table.c.id.label("showtime_id"),
+        type_coerce(showtimes_table.c.start_time, String).label("start_time"),
+        showtimes_table.c.hall_number,
+        showtimes_table.c.price,
+        movies_table.c.id.label("movie_id"),
+        movies_table.c.title.label("movie_title"),
+        movies_table.c.genre,
+    )
+    .select_from(
+        reservations_table.join(seats_table)
+        .join(showtimes_table, reservations_table.c.showtime_id == showtimes_table.c.id)
+        .join(movies_table)
+    )
+    .where(
+        showtimes_table.c.start_time >= bindparam("start"),
+        showtimes_table.c.start_time < bindparam("end"),
+    )
+)
+
+EXPORT_COLUMNS = [column.name for column in EXPORT_STMT.selected_columns]
+
+TIMESTAMP_COLUMNS = {"reserved_at", "start_time"}
+
+MEDIA_TYPES = {
+    ExportFormat.CSV: "text/csv",
+    ExportFormat.PARQUET: "application/vnd.apache.parquet",
+}
+
+
+def parquet_schema(pa):
+    return pa.schema(
+        [
+            ("reservation_id", pa.int64()),
+            ("status", pa.string()),
+            ("reserved_at", pa.timestamp("us")),
+            ("user_id", pa.int64()),
+            ("seat_id", pa.int64()),
+            ("seat_row", pa.string()),
+            ("seat_number", pa.int32()),
+            ("showtime_id", pa.int64()),
+            ("start_time", pa.timestamp("us")),
+            ("hall_number", pa.int32()),
+            ("price", pa.decimal128(10, 2)),
+            ("movie_id", pa.int64()),
+            ("movie_title", pa.string()),
+            ("genre", pa.string()),
+        ]
+    )
+
+
+class ChunkSink:
+    """Write-only file object that hands written bytes back in chunks."""
+
+    closed = False
+
+    def __init__(self):
+        self._chunks = []
+        self._position = 0
+
+    def write(self, data) -> int:
+        data = bytes(data)
+        self._chunks.append(data)
+        self._position += len(data)
+        return len(data)
+
+    def tell(self) -> int:
+        return self._position
+
+    def flush(self) -> None:
+        pass
+
+    def close(self) -> None:
+        self.closed = True
+
+    def drain(self) -> bytes:
+        data = b"".join(self._chunks)
+        self._chunks.clear()
+        return data
+
+
+def iter_csv(partitions) -> Iterator[bytes]:
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerow(EXPORT_COLUMNS)
+    for rows in partitions:
+        writer.writerows(rows)
+        yield buffer.getvalue().encode()
+        buffer.seek(0)
+        buffer.truncate()
+    if buffer.tell():
+        yield buffer.getvalue().encode()
+
+
+def iter_parquet(partitions, pa, pq) -> Iterator[bytes]:
+    # One row group per partition, flushed to the client as soon as written.
+    schema = parquet_schema(pa)
+    sink = ChunkSink()
+    writer = pq.ParquetWriter(sink, schema)
+    try:
+        for rows in partitions:
+            arrays = []
+            for field, values in zip(schema, zip(*rows)):
+                if field.name in TIMESTAMP_COLUMNS:
+                    arrays.append(pa.array(values, pa.string()).cast(field.type))
+                else:
+                    arrays.append(pa.array(values, field.type))
+            writer.write_batch(pa.record_batch(arrays, schema=schema))
+            yield sink.drain()
+    finally:
+        writer.close()
+    yield sink.drain()
+
+
+class ExportService:
+
+    @staticmethod
+    def stream_reservations(
+        db: Session,
+        export_format: ExportFormat,
+        start_date: Optional[date] = None,
+        end_date: Optional[date] = None,
+    ) -> Iterator[bytes]:
+        """Streams reservation facts in ``export_format``, chunk by chunk.
+
+        Rows come from a server-side cursor EXPORT_CHUNK_ROWS at a time, so
+        memory stays flat however many reservations are exported. Nothing is
+        queried until the first chunk is requested.
+        """
+        if export_format == ExportFormat.PARQUET:
+            try:
+                import pyarrow as pa
+                import pyarrow.parquet as pq
+            except ImportError:
+                raise HTTPException(
+                    status_code=status.HTTP_400_BAD_REQUEST,
+                    detail="Parquet export requires pyarrow",
+                )
+
+        params = date_range_bounds(start_date, end_date)
+
+        def generate():
+            result = db.execute(
+                EXPORT_STMT,
+                params,
+                execution_options={"yield_per": settings.EXPORT_CHUNK_ROWS},
+            )
+            try:
+                partitions = result.partitions()
+                if export_format == ExportFormat.PARQUET:
+                    yield from iter_parquet(partitions, pa, pq)
+                else:
+                    yield from iter_csv(partitions)
+            finally:
+                result.close()
+
+        return generate()
@@ -0,0 +1,86 @@
+from datetime import date
+from typing import Optional
+from sqlalchemy import bindparam, func, select
+from sqlalchemy.orm import Session
+from app.cache import cache
+from app.config import settings
+from app.models.reservation import Reservation, ReservationStatus
+from app.models.seat import Seat
+from app.models.showtime import Showtime
+from app.utils import date_range_bounds
+
+showtimes_table = Showtime.__table__
+seats_table = Seat.__table__
+reservations_table = Reservation.__table__
+
+# Every seat of every showtime in range with its confirmed reservation id
+# (0 if unsold), in the column order of seat_heatmap.SEAT_DTYPE.
+HEATMAP_STMT = (
+    select(
+        showtimes_table.c.hall_number,
+        seats_table.c.showtime_id,
+        seats_table.c.row,
+        seats_table.c.number,
+        func.coalesce(reservations_table.c.id, 0),
+    )
+    .select_from(
+        seats_table.join(showtimes_table).outerjoin(
+            reservations_table,
+            (reservations_table.c.seat_id == seats_table.c.id)
+            & (reservations_table.c.status == ReservationStatus.CONFIRMED),
+        )
+    )
+    .where(
+        showtimes_table.c.start_time >= bindparam("start"),
+        showtimes_table.c.start_time < bindparam("end"),
+    )
+)
+
+HALL_HEATMAP_STMT = HEATMAP_STMT.where(
+    showtimes_table.c.hall_number == bindparam("hall_number")
+)
+
+
+class HeatmapService:
+
+    @staticmethod
+    def load_heatmaps(
+        db: Session,
+        start_date: Optional[date],
+        end_date: Optional[date],
+        hall_number: Optional[int],
+    ) -> dict:
+        # numpy is only needed here; importing it lazily keeps it out of
+        # application startup.
+        from app.seat_heatmap import hall_heatmaps, load_seats
+
+        params = date_range_bounds(start_date, end_date)
+        stmt = HEATMAP_STMT
+        if hall_number is not None:
+            stmt = HALL_HEATMAP_STMT
+            params["hall_number"] = hall_number
+        result = db.execute(
+            stmt, params, execution_options={"yield_per": settings.EXPORT_CHUNK_ROWS}
+        )
+        with result:
+            seats = load_seats(result)
+
+        return {
+            "start_date": start_date,
+            "end_date": end_date,
+            "halls": hall_heatmaps(seats),
+        }
+
+    @staticmethod
+    def get_heatmaps(
+        db: Session,
+        start_date: Optional[date] = None,
+        end_date: Optional[date] = None,
+        hall_number: Optional[int] = None,
+    ) -> dict:
+        return cache.get_or_load(
+            f"heatmap:{start_date}:{end_date}:{hall_number}",
+            lambda: HeatmapService.load_heatmaps(db, start_date, end_date, hall_number),
+            ttl=settings.ANALYTICS_CACHE_TTL_SECONDS,
+            tags=("showtimes",),
+        )
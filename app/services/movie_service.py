@@ -1,10 +1,60 @@
 from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import bindparam, select
+from fastapi import HTTPException
 from app.models.movie import Movie
 from app.models.showtime import Showtime
 from app.models.seat import Seat
+from app.cache import cache
+from app.invalidation import invalidation_bus
+from app.read_models import MovieRecord, SeatRecord
+from app.seat_map import encode_seat_changes, encode_seat_map
 from datetime import datetime, date
 from typing import List
 
+movies_table = Movie.__table__
+showtimes_table = Showtime.__table__
+seats_table = Seat.__table__
+
+# Built once so each request reuses the cached compiled form; read paths
+# select only the serialized columns into compact records instead of
+# identity-mapped ORM instances.
+MOVIES_STMT = select(
+    movies_table.c.id,
+    movies_table.c.title,
+    movies_table.c.description,
+    movies_table.c.poster_url,
+    movies_table.c.genre,
+    movies_table.c.duration_minutes,
+)
+
+MOVIE_STMT = MOVIES_STMT.where(movies_table.c.id == bindparam("movie_id"))
+
+SHOWTIME_EXISTS_STMT = select(showtimes_table.c.id).where(
+    showtimes_table.c.id == bindparam("showtime_id")
+)
+
+SHOWTIME_SEATS_STMT = select(
+    seats_table.c.id,
+    seats_table.c.row,
+    seats_table.c.number,
+    seats_table.c.is_reserved,
+).where(seats_table.c.showtime_id == bindparam("showtime_id"))
+
+AVAILABLE_SEATS_STMT = SHOWTIME_SEATS_STMT.where(seats_table.c.is_reserved == False)
+
+SEAT_MAP_VERSION_STMT = select(showtimes_table.c.seat_map_version).where(
+    showtimes_table.c.id == bindparam("showtime_id")
+)
+
+SEAT_MAP_STMT = (
+    select(seats_table.c.row, seats_table.c.number, seats_table.c.is_reserved)
+    .where(seats_table.c.showtime_id == bindparam("showtime_id"))
+    .order_by(seats_table.c.row, seats_table.c.number)
+)
+
+SEAT_MAP_CHANGES_STMT = SEAT_MAP_STMT.where(seats_table.c.version > bindparam("since"))
+
 
 class MovieService:
 
@@ -38,6 +88,7 @@ class MovieService:
                 )
                 db.add(seat)
 
+        invalidation_bus.publish(db, "showtimes", showtime.id)
         db.commit()
         db.refresh(showtime)
 
@@ -92,10 +143,188 @@ class MovieService:
 
         return result
 
+    # Cached reads are tagged after the bus topic and key that change them
+    # ("movies", "movies:3", "seats:12"); app.cache drops the tags when the
+    # change event is dispatched.
     @staticmethod
-    def get_available_seats(db: Session, showtime_id: int) -> List[Seat]:
-        return (
-            db.query(Seat)
-            .filter(Seat.showtime_id == showtime_id, Seat.is_reserved == False)
-            .all()
+    def load_movies(db: Session) -> List[MovieRecord]:
+        return list(map(MovieRecord._make, db.execute(MOVIES_STMT)))
+
+    @staticmethod
+    def list_movies(db: Session) -> List[MovieRecord]:
+        return cache.get_or_load(
+            "movies:list", lambda: MovieService.load_movies(db), tags=("movies",)
         )
+
+    @staticmethod
+    def load_movie(db: Session, movie_id: int) -> MovieRecord:
+        row = db.execute(MOVIE_STMT, {"movie_id": movie_id}).first()
+        if row is None:
+            raise HTTPException(status_code=404, detail="Movie not found")
+        return MovieRecord._make(row)
+
+    @staticmethod
+    def get_movie(db: Session, movie_id: int) -> MovieRecord:
+        return cache.get_or_load(
+            f"movies:{movie_id}",
+            lambda: MovieService.load_movie(db, movie_id),
+            tags=(f"movies:{movie_id}",),
+        )
+
+    @staticmethod
+    def load_schedule(db: Session, target_date: date) -> List[dict]:
+        # Plain dicts rather than ORM rows, so the result can be cached.
+        return [
+            {
+                "movie": {
+                    field: getattr(entry["movie"], field)
+                    for field in MovieRecord._fields
+                },
+                "showtimes": entry["showtimes"],
+            }
+            for entry in MovieService.get_movies_with_showtimes(db, target_date)
+        ]
+
+    @staticmethod
+    def load_showtime_seats(db: Session, showtime_id: int) -> List[SeatRecord]:
+        params = {"showtime_id": showtime_id}
+        seats = list(map(SeatRecord._make, db.execute(SHOWTIME_SEATS_STMT, params)))
+        # Only an empty result needs the extra round trip to tell a seatless
+        # showtime apart from a missing one.
+        if not seats and db.execute(SHOWTIME_EXISTS_STMT, params).first() is None:
+            raise HTTPException(status_code=404, detail="Showtime not found")
+        return seats
+
+    @staticmethod
+    def get_showtime_seats(db: Session, showtime_id: int) -> List[SeatRecord]:
+        return cache.get_or_load(
+            f"showtimes:{showtime_id}:seats",
+            lambda: MovieService.load_showtime_seats(db, showtime_id),
+            tags=(f"seats:{showtime_id}",),
+        )
+
+    @staticmethod
+    def load_available_seats(db: Session, showtime_id: int) -> List[SeatRecord]:
+        return list(
+            map(
+                SeatRecord._make,
+                db.execute(AVAILABLE_SEATS_STMT, {"showtime_id": showtime_id}),
+            )
+        )
+
+    @staticmethod
+    def get_available_seats(db: Session, showtime_id: int) -> List[SeatRecord]:
+        return cache.get_or_load(
+            f"showtimes:{showtime_id}:available-seats",
+            lambda: MovieService.load_available_seats(db, showtime_id),
+            tags=(f"seats:{showtime_id}",),
+        )
+
+    @staticmethod
+    def get_seat_map_version(db: Session, showtime_id: int) -> int:
+        version = db.execute(
+            SEAT_MAP_VERSION_STMT, {"showtime_id": showtime_id}
+        ).scalar()
+        if version is None:
+            raise HTTPException(status_code=404, detail="Showtime not found")
+        return version
+
+    # The version is read before the seats: a reservation committed in
+    # between shows up in the seats and is simply resent by the next delta.
+    @staticmethod
+    def load_seat_map(db: Session, showtime_id: int) -> dict:
+        version = MovieService.get_seat_map_version(db, showtime_id)
+        seats = db.execute(SEAT_MAP_STMT, {"showtime_id": showtime_id})
+        return {
+            "showtime_id": showtime_id,
+            "version": version,
+            "seats": encode_seat_map(seats),
+        }
+
+    @staticmethod
+    def get_seat_map(db: Session, showtime_id: int) -> dict:
+        return cache.get_or_load(
+            f"showtimes:{showtime_id}:seat-map",
+            lambda: MovieService.load_seat_map(db, showtime_id),
+            tags=(f"seats:{showtime_id}",),
+        )
+
+    @staticmethod
+    def get_seat_map_delta(db: Session, showtime_id: int, since: int) -> dict:
+        version = MovieService.get_seat_map_version(db, showtime_id)
+        if since > version:
+            raise HTTPException(
+                status_code=409,
+                detail="Seat map version is ahead of the server; fetch the full map",
+            )
+
+        changes = ""
+        if since < version:
+            changes = encode_seat_changes(
+                db.execute(
+                    SEAT_MAP_CHANGES_STMT, {"showtime_id": showtime_id, "since": since}
+                )
+            )
+        return {
+            "showtime_id": showtime_id,
+            "version": version,
+            "since": since,
+            "changes": changes,
+        }
+
+
+class AsyncMovieService:
+
+    @staticmethod
+    async def create_showtime_with_seats(
+        db: AsyncSession,
+        movie_id: int,
+        start_time: datetime,
+        hall_number: int,
+        price: float,
+        total_seats: int = 100,
+    ) -> Showtime:
+        return await db.run_sync(
+            MovieService.create_showtime_with_seats,
+            movie_id,
+            start_time,
+            hall_number,
+            price,
+            total_seats,
+        )
+
+    @staticmethod
+    async def get_movies_with_showtimes(
+        db: AsyncSession, target_date: date
+    ) -> List[dict]:
+        return await db.run_sync(MovieService.get_movies_with_showtimes, target_date)
+
+    @staticmethod
+    async def list_movies(db: AsyncSession) -> List[MovieRecord]:
+        return await db.run_sync(MovieService.list_movies)
+
+    @staticmethod
+    async def get_movie(db: AsyncSession, movie_id: int) -> MovieRecord:
+        return await db.run_sync(MovieService.get_movie, movie_id)
+
+    @staticmethod
+    async def get_showtime_seats(
+        db: AsyncSession, showtime_id: int
+    ) -> List[SeatRecord]:
+        return await db.run_sync(MovieService.get_showtime_seats, showtime_id)
+
+    @staticmethod
+    async def get_available_seats(
+        db: AsyncSession, showtime_id: int
+    ) -> List[SeatRecord]:
+        return await db.run_sync(MovieService.get_available_seats, showtime_id)
+
+    @staticmethod
+    async def get_seat_map(db: AsyncSession, showtime_id: int) -> dict:
+        return await db.run_sync(MovieService.get_seat_map, showtime_id)
+
+    @staticmethod
+    async def get_seat_map_delta(
+        db: AsyncSession, showtime_id: int, since: int
+    ) -> dict:
+        return await db.run_sync(MovieService.get_seat_map_delta, showtime_id, since)
@@ -1,11 +1,138 @@
 from sqlalchemy.orm import Session
-from sqlalchemy import and_
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import Integer, bindparam, select, tuple_, update
 from fastapi import HTTPException, status
 from app.models.reservation import Reservation, ReservationStatus
+from app.models.movie import Movie
 from app.models.seat import Seat
 from app.models.showtime import Showtime
-from typing import List
+from app.read_models import ReservationDetailRecord
+from app.invalidation import invalidation_bus
+from app.services.rollup_service import RollupService
+from typing import List, Optional, Tuple
 from datetime import datetime
+import base64
+import binascii
+
+# Hot-path statements are built once at import time. Reusing the same
+# statement object lets SQLAlchemy hit its compiled cache without rebuilding
+# the expression tree per request, and selecting plain columns returns row
+# tuples instead of identity-mapped ORM instances.
+movies_table = Movie.__table__
+showtimes_table = Showtime.__table__
+seats_table = Seat.__table__
+reservations_table = Reservation.__table__
+
+SHOWTIME_LOOKUP_STMT = select(
+    showtimes_table.c.start_time, showtimes_table.c.price
+).where(showtimes_table.c.id == bindparam("showtime_id"))
+
+SEAT_LOOKUP_STMT = (
+    select(
+        seats_table.c.id,
+        seats_table.c.row,
+        seats_table.c.number,
+        seats_table.c.is_reserved,
+    )
+    .where(
+        seats_table.c.id.in_(bindparam("seat_ids", expanding=True)),
+        seats_table.c.showtime_id == bindparam("showtime_id"),
+    )
+    .with_for_update()
+)
+
+# Every seat write bumps the showtime's seat-map version and stamps the
+# changed seats with it, so kiosks can poll for seats changed since a version.
+BUMP_SEAT_MAP_VERSION_STMT = (
+    update(showtimes_table)
+    .where(showtimes_table.c.id == bindparam("map_showtime_id"))
+    .values(seat_map_version=showtimes_table.c.seat_map_version + 1)
+    .returning(showtimes_table.c.seat_map_version)
+)
+
+MARK_SEATS_RESERVED_STMT = (
+    update(seats_table)
+    .where(
+        seats_table.c.id.in_(bindparam("seat_ids", expanding=True)),
+        seats_table.c.is_reserved == False,
+    )
+    .values(is_reserved=True, version=bindparam("seat_map_version"))
+)
+
+RELEASE_SEAT_STMT = (
+    update(seats_table)
+    .where(seats_table.c.id == bindparam("seat_id"))
+    .values(is_reserved=False, version=bindparam("seat_map_version"))
+    .returning(seats_table.c.row, seats_table.c.number)
+)
+
+
+def build_reservation_page_stmt(upcoming_only: bool, after_cursor: bool):
+    stmt = (
+        select(
+            reservations_table.c.id,
+            movies_table.c.title.label("movie_title"),
+            showtimes_table.c.start_time.label("showtime"),
+            showtimes_table.c.hall_number,
+            seats_table.c.row.label("seat_row"),
+            seats_table.c.number.label("seat_number"),
+            reservations_table.c.status,
+            reservations_table.c.created_at,
+        )
+        .select_from(
+            reservations_table.join(showtimes_table)
+            .join(movies_table)
+            .join(seats_table, seats_table.c.id == reservations_table.c.seat_id)
+        )
+        .where(
+            reservations_table.c.user_id == bindparam("user_id"),
+            reservations_table.c.status == ReservationStatus.CONFIRMED,
+        )
+    )
+    if upcoming_only:
+        stmt = stmt.where(showtimes_table.c.start_time > bindparam("now"))
+    if after_cursor:
+        stmt = stmt.where(
+            tuple_(reservations_table.c.created_at, reservations_table.c.id)
+            < tuple_(
+                # Typed so the cursor binds in the column's storage format;
+                # untyped, whole-second datetimes lose their ".000000".
+                bindparam(
+                    "after_created_at", type_=reservations_table.c.created_at.type
+                ),
+                bindparam("after_id", type_=Integer),
+            )
+        )
+    # Newest first, walked along ix_reservations_user_id_status_created_at so
+    # every page is an index range scan regardless of history length.
+    return stmt.order_by(
+        reservations_table.c.created_at.desc(), reservations_table.c.id.desc()
+    ).limit(bindparam("limit"))
+
+
+RESERVATION_PAGE_STMTS = {
+    (upcoming_only, after_cursor): build_reservation_page_stmt(
+        upcoming_only, after_cursor
+    )
+    for upcoming_only in (False, True)
+    for after_cursor in (False, True)
+}
+
+
+def encode_reservation_cursor(created_at: datetime, reservation_id: int) -> str:
+    raw = f"{created_at.isoformat()}|{reservation_id}".encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_reservation_cursor(cursor: str) -> Tuple[datetime, int]:
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)).decode()
+        created_at, reservation_id = raw.split("|")
+        return datetime.fromisoformat(created_at), int(reservation_id)
+    except (binascii.Error, UnicodeDecodeError, ValueError):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid cursor"
+        )
 
 
 class ReservationService:
@@ -15,8 +142,10 @@ class ReservationService:
         db: Session, user_id: int, showtime_id: int, seat_ids: List[int]
     ) -> List[Reservation]:
 
-        showtime = db.query(Showtime).filter(Showtime.id == showtime_id).first()
-        if not showtime:
+        showtime = db.execute(
+            SHOWTIME_LOOKUP_STMT, {"showtime_id": showtime_id}
+        ).first()
+        if showtime is None:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND, detail="Showtime not found"
             )
@@ -27,12 +156,9 @@ class ReservationService:
                 detail="Cannot reserve seats for past showtimes",
             )
 
-        seats = (
-            db.query(Seat)
-            .filter(and_(Seat.id.in_(seat_ids), Seat.showtime_id == showtime_id))
-            .with_for_update()
-            .all()
-        )
+        seats = db.execute(
+            SEAT_LOOKUP_STMT, {"seat_ids": seat_ids, "showtime_id": showtime_id}
+        ).all()
 
         if len(seats) != len(seat_ids):
             raise HTTPException(
@@ -46,11 +172,26 @@ class ReservationService:
                 detail=f"Seats already reserved: {[f'{s.row}{s.number}' for s in reserved_seats]}",
             )
 
+        # The guarded UPDATE re-checks is_reserved inside the write
+        # transaction, so a concurrent reservation that slipped in after the
+        # lookup is caught on backends where FOR UPDATE is a no-op.
+        version = db.execute(
+            BUMP_SEAT_MAP_VERSION_STMT, {"map_showtime_id": showtime_id}
+        ).scalar_one()
+        marked = db.execute(
+            MARK_SEATS_RESERVED_STMT,
+            {"seat_ids": seat_ids, "seat_map_version": version},
+        )
+        if marked.rowcount != len(seat_ids):
+            db.rollback()
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="Seats already reserved",
+            )
+
         reservations = []
 
         for seat in seats:
-            seat.is_reserved = True
-
             reservation = Reservation(
                 user_id=user_id,
                 showtime_id=showtime_id,
@@ -60,6 +201,18 @@ class ReservationService:
             db.add(reservation)
             reservations.append(reservation)
 
+        RollupService.record(
+            db, showtime_id, showtime.start_time, showtime.price, len(seats)
+        )
+        invalidation_bus.publish(
+            db,
+            "seats",
+            showtime_id,
+            {
+                "version": version,
+                "seats": [[seat.row, seat.number, True] for seat in seats],
+            },
+        )
         db.commit()
 
         for reservation in reservations:
@@ -98,10 +251,24 @@ class ReservationService:
             )
 
         reservation.status = ReservationStatus.CANCELLED
+        showtime = reservation.showtime
+        RollupService.record(db, showtime.id, showtime.start_time, showtime.price, -1)
 
-        seat = db.query(Seat).filter(Seat.id == reservation.seat_id).first()
-        seat.is_reserved = False
+        showtime_id = reservation.showtime_id
+        version = db.execute(
+            BUMP_SEAT_MAP_VERSION_STMT, {"map_showtime_id": showtime_id}
+        ).scalar_one()
+        seat = db.execute(
+            RELEASE_SEAT_STMT,
+            {"seat_id": reservation.seat_id, "seat_map_version": version},
+        ).one()
 
+        invalidation_bus.publish(
+            db,
+            "seats",
+            showtime_id,
+            {"version": version, "seats": [[seat.row, seat.number, False]]},
+        )
         db.commit()
         db.refresh(reservation)
 
@@ -118,3 +285,77 @@ class ReservationService:
             query = query.join(Showtime).filter(Showtime.start_time > datetime.utcnow())
 
         return query.all()
+
+    @staticmethod
+    def get_user_reservation_page(
+        db: Session,
+        user_id: int,
+        upcoming_only: bool = False,
+        limit: int = 50,
+        cursor: Optional[str] = None,
+    ) -> Tuple[List[ReservationDetailRecord], Optional[str]]:
+        params = {"user_id": user_id, "limit": limit + 1}
+        if upcoming_only:
+            params["now"] = datetime.utcnow()
+        if cursor is not None:
+            params["after_created_at"], params["after_id"] = decode_reservation_cursor(
+                cursor
+            )
+
+        stmt = RESERVATION_PAGE_STMTS[(upcoming_only, cursor is not None)]
+        records = [
+            ReservationDetailRecord(
+                row.id,
+                row.movie_title,
+                row.showtime,
+                row.hall_number,
+                row.seat_row,
+                row.seat_number,
+                row.status.value,
+                row.created_at,
+            )
+            for row in db.execute(stmt, params)
+        ]
+
+        next_cursor = None
+        if len(records) > limit:
+            records = records[:limit]
+            last = records[-1]
+            next_cursor = encode_reservation_cursor(last.created_at, last.id)
+
+        return records, next_cursor
+
+
+class AsyncReservationService:
+
+    @staticmethod
+    async def reserve_seats(
+        db: AsyncSession, user_id: int, showtime_id: int, seat_ids: List[int]
+    ) -> List[Reservation]:
+        return await db.run_sync(
+            ReservationService.reserve_seats, user_id, showtime_id, seat_ids
+        )
+
+    @staticmethod
+    async def cancel_reservation(
+        db: AsyncSession, reservation_id: int, user_id: int
+    ) -> Reservation:
+        return await db.run_sync(
+            ReservationService.cancel_reservation, reservation_id, user_id
+        )
+
+    @staticmethod
+    async def get_user_reservation_page(
+        db: AsyncSession,
+        user_id: int,
+        upcoming_only: bool = False,
+        limit: int = 50,
+        cursor: Optional[str] = None,
+    ) -> Tuple[List[ReservationDetailRecord], Optional[str]]:
+        return await db.run_sync(
+            ReservationService.get_user_reservation_page,
+            user_id,
+            upcoming_only,
+            limit,
+            cursor,
+        )
@@ -0,0 +1,193 @@
+from datetime import date, datetime
+from decimal import Decimal
+from typing import Optional
+from sqlalchemy import Integer, bindparam, cast, delete, func, insert, select
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.orm import Session
+from app.models.movie import Movie
+from app.models.reservation import Reservation, ReservationStatus
+from app.models.rollup import DailyRollup, ShowtimeRollup
+from app.models.showtime import Showtime
+
+movies_table = Movie.__table__
+showtimes_table = Showtime.__table__
+reservations_table = Reservation.__table__
+showtime_rollups = ShowtimeRollup.__table__
+daily_rollups = DailyRollup.__table__
+
+
+def build_increment_stmt(table, key_column: str, key_param: str):
+    stmt = sqlite_insert(table).values(
+        {
+            key_column: bindparam(key_param),
+            "reserved_seats": bindparam("seats_delta"),
+            "revenue_cents": bindparam("revenue_delta"),
+        }
+    )
+    return stmt.on_conflict_do_update(
+        index_elements=[table.c[key_column]],
+        set_={
+            "reserved_seats": table.c.reserved_seats + stmt.excluded.reserved_seats,
+            "revenue_cents": table.c.revenue_cents + stmt.excluded.revenue_cents,
+        },
+    )
+
+
+INCREMENT_SHOWTIME_STMT = build_increment_stmt(
+    showtime_rollups, "showtime_id", "rollup_showtime_id"
+)
+INCREMENT_DAY_STMT = build_increment_stmt(daily_rollups, "day", "rollup_day")
+
+# Recomputed from scratch by rebuild(); revenue uses the showtime's current
+# price, as the reservation rows do not record what was paid.
+SHOWTIME_TOTALS_STMT = (
+    select(
+        reservations_table.c.showtime_id,
+        func.count().label("reserved_seats"),
+        (func.count() * cast(func.round(showtimes_table.c.price * 100), Integer)).label(
+            "revenue_cents"
+        ),
+    )
+    .select_from(reservations_table.join(showtimes_table))
+    .where(reservations_table.c.status == ReservationStatus.CONFIRMED)
+    .group_by(reservations_table.c.showtime_id)
+)
+
+DAY_TOTALS_STMT = (
+    select(
+        func.date(showtimes_table.c.start_time).label("day"),
+        func.sum(showtime_rollups.c.reserved_seats).label("reserved_seats"),
+        func.sum(showtime_rollups.c.revenue_cents).label("revenue_cents"),
+    )
+    .select_from(showtime_rollups.join(showtimes_table))
+    .group_by(func.date(showtimes_table.c.start_time))
+)
+
+REPORT_STMT = (
+    select(
+        showtimes_table.c.id.label("showtime_id"),
+        movies_table.c.title.label("movie_title"),
+        showtimes_table.c.start_time,
+        showtimes_table.c.hall_number,
+        showtimes_table.c.total_seats,
+        showtime_rollups.c.reserved_seats,
+        showtime_rollups.c.revenue_cents,
+    )
+    .select_from(showtime_rollups.join(showtimes_table).join(movies_table))
+    .where(
+        showtime_rollups.c.reserved_seats > 0,
+        showtimes_table.c.start_time >= bindparam("start"),
+        showtimes_table.c.start_time <= bindparam("end"),
+    )
+    .order_by(showtimes_table.c.start_time, showtimes_table.c.id)
+)
+
+REPORT_TOTAL_STMT = select(
+    func.coalesce(func.sum(daily_rollups.c.revenue_cents), 0)
+).where(daily_rollups.c.day.between(bindparam("start_day"), bindparam("end_day")))
+
+
+def to_cents(price) -> int:
+    return int((Decimal(str(price)) * 100).to_integral_value())
+
+
+class RollupService:
+
+    @staticmethod
+    def record(
+        db: Session, showtime_id: int, start_time: datetime, price, seats: int
+    ) -> None:
+        """Adds ``seats`` (negative for cancellations) to both rollups.
+
+        Runs in the caller's transaction, so the rollups commit or roll back
+        together with the reservation rows.
+        """
+        params = {
+            "rollup_showtime_id": showtime_id,
+            "rollup_day": start_time.date(),
+            "seats_delta": seats,
+            "revenue_delta": seats * to_cents(price),
+        }
+        db.execute(INCREMENT_SHOWTIME_STMT, params)
+        db.execute(INCREMENT_DAY_STMT, params)
+
+    @staticmethod
+    def rebuild(db: Session) -> dict:
+        """Recomputes both rollups from reservations and reports the drift."""
+        before = {
+            row.showtime_id: (row.reserved_seats, row.revenue_cents)
+            for row in db.execute(select(showtime_rollups))
+        }
+        # Deleting first takes the write lock, so no reservation can commit
+        # between computing the totals and storing them.
+        db.execute(delete(showtime_rollups))
+        db.execute(delete(daily_rollups))
+        totals = {
+            row.showtime_id: (row.reserved_seats, row.revenue_cents)
+            for row in db.execute(SHOWTIME_TOTALS_STMT)
+        }
+        drifted = sum(
+            1
+            for showtime_id in before.keys() | totals.keys()
+            if before.get(showtime_id, (0, 0)) != totals.get(showtime_id, (0, 0))
+        )
+
+        if totals:
+            db.execute(
+                insert(showtime_rollups),
+                [
+                    {
+                        "showtime_id": showtime_id,
+                        "reserved_seats": seats,
+                        "revenue_cents": cents,
+                    }
+                    for showtime_id, (seats, cents) in totals.items()
+                ],
+            )
+        days = db.execute(
+            insert(daily_rollups).from_select(
+                ["day", "reserved_seats", "revenue_cents"], DAY_TOTALS_STMT
+            )
+        ).rowcount
+        db.commit()
+
+        return {"showtimes": len(totals), "days": days, "drifted_showtimes": drifted}
+
+    @staticmethod
+    def get_report(
+        db: Session, start_date: Optional[date], end_date: Optional[date]
+    ) -> dict:
+        start_date = start_date or date.min
+        end_date = end_date or date.max
+        rows = db.execute(
+            REPORT_STMT,
+            {
+                "start": datetime.combine(start_date, datetime.min.time()),
+                "end": datetime.combine(end_date, datetime.max.time()),
+            },
+        )
+
+        report = [
+            {
+                "showtime_id": r.showtime_id,
+                "movie_title": r.movie_title,
+                "start_time": r.start_time,
+                "hall_number": r.hall_number,
+                "total_seats": r.total_seats,
+                "reserved_seats": r.reserved_seats,
+                "capacity_percentage": round(
+                    r.reserved_seats / r.total_seats * 100 if r.total_seats else 0, 2
+                ),
+                "revenue": r.revenue_cents / 100,
+            }
+            for r in rows
+        ]
+        total_cents = db.execute(
+            REPORT_TOTAL_STMT, {"start_day": start_date, "end_day": end_date}
+        ).scalar()
+
+        return {
+            "report": report,
+            "total_revenue": total_cents / 100,
+            "total_showtimes": len(report),
+        }
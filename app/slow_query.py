@@ -0,0 +1,96 @@
+import logging
+import re
+import time
+from typing import List, Optional
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from app.config import settings
+from app.query_stats import current_query_stats
+
+logger = logging.getLogger(__name__)
+
+FULL_SCAN_TABLES = ("seats", "reservations")
+
+_FULL_SCAN = re.compile(
+    r"^SCAN (?:TABLE )?(%s)\b(?!.*\bUSING\b)" % "|".join(FULL_SCAN_TABLES)
+)
+_EXPLAINABLE = ("SELECT", "WITH", "UPDATE", "DELETE")
+
+
+def parameter_shape(parameters, executemany: bool = False) -> str:
+    if executemany:
+        parameters = list(parameters)
+        first = parameter_shape(parameters[0]) if parameters else "()"
+        return f"{len(parameters)} x {first}"
+    if isinstance(parameters, dict):
+        return (
+            "{"
+            + ", ".join(f"{k}: {type(v).__name__}" for k, v in parameters.items())
+            + "}"
+        )
+    return "(" + ", ".join(type(v).__name__ for v in parameters or ()) + ")"
+
+
+def explain_query_plan(conn, statement, parameters, executemany) -> Optional[List[str]]:
+    if conn.dialect.name != "sqlite":
+        return None
+    if not statement.lstrip().upper().startswith(_EXPLAINABLE):
+        return None
+    if executemany:
+        parameters = parameters[0] if parameters else ()
+
+    cursor = conn.connection.dbapi_connection.cursor()
+    try:
+        cursor.execute(f"EXPLAIN QUERY PLAN {statement}", parameters or ())
+        return [row[3] for row in cursor.fetchall()]
+    except Exception as exc:
+        return [f"<explain failed: {exc}>"]
+    finally:
+        cursor.close()
+
+
+def full_table_scans(plan: Optional[List[str]]) -> List[str]:
+    scans = []
+    for detail in plan or ():
+        match = _FULL_SCAN.match(detail)
+        if match:
+            scans.append(match.group(1))
+    return scans
+
+
+@event.listens_for(Engine, "before_cursor_execute")
+def _start_timer(conn, cursor, statement, parameters, context, executemany):
+    conn.info.setdefault("slow_query_started", []).append(time.perf_counter())
+
+
+@event.listens_for(Engine, "after_cursor_execute")
+def _log_slow_query(conn, cursor, statement, parameters, context, executemany):
+    elapsed_ms = (time.perf_counter() - conn.info["slow_query_started"].pop()) * 1000
+    threshold = settings.SLOW_QUERY_THRESHOLD_MS
+    if threshold is None or elapsed_ms < threshold:
+        return
+
+    stats = current_query_stats.get()
+    route = stats.route if stats is not None else None
+    plan = (
+        explain_query_plan(conn, statement, parameters, executemany)
+        if settings.SLOW_QUERY_EXPLAIN
+        else None
+    )
+    scans = full_table_scans(plan)
+
+    logger.warning(
+        "Slow query %.1f ms on %s%s: %s | params %s | plan %s",
+        elapsed_ms,
+        route or "<no request>",
+        f" [FULL SCAN: {', '.join(scans)}]" if scans else "",
+        " ".join(statement.split()),
+        parameter_shape(parameters, executemany),
+        " / ".join(plan) if plan else "-",
+        extra={
+            "duration_ms": elapsed_ms,
+            "route": route,
+            "query_plan": plan,
+            "full_scans": scans,
+        },
+    )
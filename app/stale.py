@@ -0,0 +1,221 @@
+import asyncio
+import logging
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Iterable, NamedTuple, Optional, Tuple
+from fastapi import HTTPException, Response
+from sqlalchemy.exc import OperationalError, TimeoutError as PoolTimeoutError
+from sqlalchemy.orm import Session
+from app.cache import cache
+from app.config import settings
+from app.database import AsyncLazySession, LazySession
+
+logger = logging.getLogger(__name__)
+
+STALE_HEADER = "X-Stale-Age"
+
+Loader = Callable[[Session], Any]
+
+
+class Envelope(NamedTuple):
+    value: Any
+    fetched_at: float
+    fresh_until: float
+
+
+def is_degraded(exc: BaseException) -> bool:
+    """Errors that mean the database is busy rather than the request wrong."""
+    if isinstance(exc, HTTPException):
+        return exc.status_code == 503
+    return isinstance(exc, (OperationalError, PoolTimeoutError))
+
+
+class StaleWhileRevalidate:
+    """Serves the last good response while the data is refreshed or unavailable.
+
+    Each key keeps two cache entries: the value with its fetch time, kept for
+    ``fresh_ttl + max_stale``, and a freshness marker kept for ``fresh_ttl``
+    and carrying the invalidation tags. While the marker lives the value is
+    served as is. Once it expires, the value is served stale and a single
+    background refresh is started. Once a change event drops it, the value
+    is reloaded inline and only served stale if the database is unavailable.
+    """
+
+    def __init__(self, fresh_ttl: float, max_stale: float, refresh_workers: int = 2):
+        self.fresh_ttl = fresh_ttl
+        self.max_stale = max_stale
+        self.refresh_workers = refresh_workers
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._refreshing = set()
+        self._tasks = set()
+        self._lock = threading.Lock()
+        self.fresh = 0
+        self.stale = 0
+        self.degraded = 0
+        self.loads = 0
+        self.refreshes = 0
+        self.refresh_errors = 0
+
+    def _lookup(self, key: str) -> Tuple[Optional[Envelope], bool]:
+        found = cache.get_many([f"swr:{key}", f"swr-fresh:{key}"])
+        envelope = found.get(f"swr:{key}")
+        if envelope is not None and time.time() - envelope.fetched_at > (
+            self.fresh_ttl + self.max_stale
+        ):
+            envelope = None
+        return envelope, f"swr-fresh:{key}" in found
+
+    def _store(
+        self, key: str, value: Any, tags: Iterable[str], generations: tuple
+    ) -> None:
+        # ``generations`` are the tags' generations from before loading. A
+        # value read before a change event is dropped rather than marked
+        # fresh; the marker set is the atomic check, the early return just
+        # keeps such a value from replacing the envelope served when stale.
+        if cache.generations(tags) != generations:
+            return
+        now = time.time()
+        cache.set(
+            f"swr:{key}",
+            Envelope(value, now, now + self.fresh_ttl),
+            ttl=self.fresh_ttl + self.max_stale,
+        )
+        cache.set(
+            f"swr-fresh:{key}",
+            True,
+            ttl=self.fresh_ttl,
+            tags=tags,
+            generations=generations,
+        )
+
+    def _claim(self, key: str) -> bool:
+        with self._lock:
+            if key in self._refreshing:
+                return False
+            self._refreshing.add(key)
+            return True
+
+    def _release(self, key: str) -> None:
+        with self._lock:
+            self._refreshing.discard(key)
+
+    def _serve_stale(self, response: Response, envelope: Envelope) -> Any:
+        response.headers[STALE_HEADER] = str(int(time.time() - envelope.fetched_at))
+        return envelope.value
+
+    def get(
+        self,
+        db: LazySession,
+        response: Response,
+        key: str,
+        loader: Loader,
+        tags: Iterable[str] = (),
+    ) -> Any:
+        envelope, fresh = self._lookup(key)
+        if envelope is not None:
+            if fresh:
+                self.fresh += 1
+                return envelope.value
+            if time.time() >= envelope.fresh_until:
+                self.stale += 1
+                self._refresh_in_thread(db.factory, key, loader, tags)
+                return self._serve_stale(response, envelope)
+
+        generations = cache.generations(tags)
+        try:
+            value = loader(db.get())
+        except Exception as exc:
+            if envelope is None or not is_degraded(exc):
+                raise
+            self.degraded += 1
+            return self._serve_stale(response, envelope)
+        self.loads += 1
+        self._store(key, value, tags, generations)
+        return value
+
+    async def get_async(
+        self,
+        db: AsyncLazySession,
+        response: Response,
+        key: str,
+        loader: Loader,
+        tags: Iterable[str] = (),
+    ) -> Any:
+        envelope, fresh = self._lookup(key)
+        if envelope is not None:
+            if fresh:
+                self.fresh += 1
+                return envelope.value
+            if time.time() >= envelope.fresh_until:
+                self.stale += 1
+                if self._claim(key):
+                    task = asyncio.create_task(
+                        self._refresh_async(db.factory, key, loader, tags)
+                    )
+                    self._tasks.add(task)
+                    task.add_done_callback(self._tasks.discard)
+                return self._serve_stale(response, envelope)
+
+        generations = cache.generations(tags)
+        try:
+            value = await (await db.get()).run_sync(loader)
+        except Exception as exc:
+            if envelope is None or not is_degraded(exc):
+                raise
+            self.degraded += 1
+            return self._serve_stale(response, envelope)
+        self.loads += 1
+        self._store(key, value, tags, generations)
+        return value
+
+    def _refresh_in_thread(self, factory, key, loader, tags) -> None:
+        if not self._claim(key):
+            return
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                self.refresh_workers, thread_name_prefix="swr-refresh"
+            )
+        self._executor.submit(self._refresh, factory, key, loader, tags)
+
+    def _refresh(self, factory, key, loader, tags) -> None:
+        try:
+            generations = cache.generations(tags)
+            with factory() as db:
+                self._store(key, loader(db), tags, generations)
+            self.refreshes += 1
+        except Exception:
+            self.refresh_errors += 1
+            logger.warning("Background refresh of %s failed", key, exc_info=True)
+        finally:
+            self._release(key)
+
+    async def _refresh_async(self, factory, key, loader, tags) -> None:
+        try:
+            generations = cache.generations(tags)
+            async with factory() as db:
+                self._store(key, await db.run_sync(loader), tags, generations)
+            self.refreshes += 1
+        except Exception:
+            self.refresh_errors += 1
+            logger.warning("Background refresh of %s failed", key, exc_info=True)
+        finally:
+            self._release(key)
+
+    def stats(self) -> dict:
+        return {
+            "fresh": self.fresh,
+            "stale": self.stale,
+            "degraded": self.degraded,
+            "loads": self.loads,
+            "refreshes": self.refreshes,
+            "refresh_errors": self.refresh_errors,
+            "refreshing": len(self._refreshing),
+        }
+
+
+public_reads = StaleWhileRevalidate(
+    fresh_ttl=settings.SWR_FRESH_SECONDS,
+    max_stale=settings.SWR_MAX_STALE_SECONDS,
+    refresh_workers=settings.SWR_REFRESH_WORKERS,
+)
@@ -1,27 +1,46 @@
-from datetime import datetime, timedelta
+import hashlib
+import hmac
+import secrets
+import uuid
+from datetime import date, datetime, time, timedelta
+from functools import lru_cache
 from typing import Optional
-from jose import JWTError, jwt
-from passlib.context import CryptContext
 from app.config import settings
 
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+
+# passlib/bcrypt and jose/cryptography are imported on first use so that
+# importing the app (worker spawn, tests, CLI) does not pay for them.
+@lru_cache(maxsize=None)
+def get_pwd_context():
+    from passlib.context import CryptContext
+
+    return CryptContext(schemes=["bcrypt"], deprecated="auto")
 
 
 def verify_password(plain_password: str, hashed_password: str) -> bool:
-    return pwd_context.verify(plain_password, hashed_password)
+    return get_pwd_context().verify(plain_password, hashed_password)
 
 
 def get_password_hash(password: str) -> str:
-    return pwd_context.hash(password)
+    return get_pwd_context().hash(password)
 
 
-def create_access_token(data: dict, expires_delta: Optional[timedelta] = None):
+def create_access_token(
+    data: dict,
+    expires_delta: Optional[timedelta] = None,
+    issued_at: Optional[datetime] = None,
+):
     to_encode = data.copy()
+    now = issued_at or datetime.utcnow()
     if expires_delta:
-        expire = datetime.utcnow() + expires_delta
+        expire = now + expires_delta
     else:
-        expire = datetime.utcnow() + timedelta(minutes=15)
-    to_encode.update({"exp": expire})
+        expire = now + timedelta(minutes=15)
+    to_encode.update({"exp": expire, "iat": now})
+    to_encode.setdefault("jti", uuid.uuid4().hex)
+
+    from jose import jwt
+
     encoded_jwt = jwt.encode(
         to_encode, settings.SECRET_KEY, algorithm=settings.ALGORITHM
     )
@@ -29,6 +48,8 @@ def create_access_token(data: dict, expires_delta: Optional[timedelta] = None):
 
 
 def decode_access_token(token: str):
+    from jose import JWTError, jwt
+
     try:
         payload = jwt.decode(
             token, settings.SECRET_KEY, algorithms=[settings.ALGORITHM]
@@ -36,3 +57,25 @@ def decode_access_token(token: str):
         return payload
     except JWTError:
         return None
+
+
+def create_refresh_token() -> str:
+    return secrets.token_urlsafe(32)
+
+
+def hash_refresh_token(token: str) -> str:
+    return hmac.new(
+        settings.SECRET_KEY.encode(), token.encode(), hashlib.sha256
+    ).hexdigest()
+
+
+def date_range_bounds(start_date: Optional[date], end_date: Optional[date]) -> dict:
+    """Half-open ``start``/``end`` datetimes covering whole days, inclusive."""
+    return {
+        "start": datetime.combine(start_date, time.min) if start_date else datetime.min,
+        "end": (
+            datetime.combine(end_date + timedelta(days=1), time.min)
+            if end_date
+            else datetime.max
+        ),
+    }
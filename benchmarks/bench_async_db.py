@@ -0,0 +1,196 @@
+"""
+Throughput of the sync and async database stacks at N concurrent connections.
+
+Starts a uvicorn server per mode against a scratch SQLite database and hammers
+it with a read-heavy mix (available seats, /reservations/my) over N
+simultaneous keep-alive connections.
+
+    python benchmarks/bench_async_db.py --concurrency 500 --requests 20000
+"""
+
+import argparse
+import asyncio
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import httpx
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+
+def prepare_database(url: str) -> None:
+    os.environ["DATABASE_URL"] = url
+    os.environ.setdefault("SECRET_KEY", "benchmark")
+
+    from datetime import datetime, timedelta
+    from app.database import SessionLocal, engine
+    from app.migrations import migrate
+    from app.models import Movie, Showtime, Seat, User, Reservation
+    from app.utils import get_password_hash
+
+    migrate(engine)
+    db = SessionLocal()
+    user = User(
+        email="bench@example.com",
+        username="bench",
+        hashed_password=get_password_hash("bench"),
+    )
+    movie = Movie(title="Benchmark", genre="Drama", duration_minutes=100)
+    db.add_all([user, movie])
+    db.flush()
+    showtime = Showtime(
+        movie_id=movie.id,
+        start_time=datetime.utcnow() + timedelta(days=1),
+        hall_number=1,
+        price=10,
+        total_seats=100,
+    )
+    db.add(showtime)
+    db.flush()
+    seats = [
+        Seat(showtime_id=showtime.id, row=row, number=n, is_reserved=n % 3 == 0)
+        for row in "ABCDEFGHIJ"
+        for n in range(1, 11)
+    ]
+    db.add_all(seats)
+    db.flush()
+    db.add_all(
+        Reservation(user_id=user.id, showtime_id=showtime.id, seat_id=seat.id)
+        for seat in seats
+        if seat.is_reserved
+    )
+    db.commit()
+    db.close()
+    engine.dispose()
+
+
+async def wait_until_ready(base_url: str, timeout: float = 30.0) -> None:
+    deadline = time.monotonic() + timeout
+    async with httpx.AsyncClient(base_url=base_url) as client:
+        while time.monotonic() < deadline:
+            try:
+                if (await client.get("/health")).status_code == 200:
+                    return
+            except httpx.TransportError:
+                pass
+            await asyncio.sleep(0.2)
+    raise RuntimeError("server did not start")
+
+
+async def run_load(base_url: str, concurrency: int, total: int, token: str):
+    limits = httpx.Limits(
+        max_connections=concurrency, max_keepalive_connections=concurrency
+    )
+    headers = {"Authorization": f"Bearer {token}"}
+    latencies = []
+    errors = 0
+    issued = 0
+
+    async with httpx.AsyncClient(
+        base_url=base_url, limits=limits, timeout=120.0
+    ) as client:
+
+        async def worker():
+            nonlocal errors, issued
+            while issued < total:
+                issued += 1
+                path = (
+                    "/reservations/my"
+                    if issued % 4 == 0
+                    else "/showtimes/1/available-seats"
+                )
+                started = time.perf_counter()
+                try:
+                    response = await client.get(path, headers=headers)
+                    if response.status_code != 200:
+                        errors += 1
+                except httpx.HTTPError:
+                    errors += 1
+                latencies.append(time.perf_counter() - started)
+
+        started = time.perf_counter()
+        await asyncio.gather(*(worker() for _ in range(concurrency)))
+        elapsed = time.perf_counter() - started
+
+    latencies.sort()
+    return {
+        "requests": len(latencies),
+        "errors": errors,
+        "rps": len(latencies) / elapsed,
+        "p50_ms": statistics.median(latencies) * 1000,
+        "p99_ms": latencies[int(len(latencies) * 0.99) - 1] * 1000,
+    }
+
+
+def bench_mode(mode: str, args) -> dict:
+    workdir = tempfile.mkdtemp(prefix="bench_async_")
+    url = f"sqlite:///{workdir}/bench.db"
+    subprocess.run([sys.executable, __file__, "--prepare", url], check=True, cwd=ROOT)
+
+    env = dict(
+        os.environ,
+        DATABASE_URL=url,
+        DATABASE_ASYNC="true" if mode == "async" else "false",
+        SECRET_KEY=os.environ.get("SECRET_KEY", "benchmark"),
+    )
+    server = subprocess.Popen(
+        [
+            sys.executable,
+            "-m",
+            "uvicorn",
+            "--factory",
+            "app.main:create_app",
+            "--port",
+            str(args.port),
+            "--log-level",
+            "warning",
+            "--backlog",
+            str(max(2048, args.concurrency * 2)),
+        ],
+        cwd=ROOT,
+        env=env,
+    )
+    base_url = f"http://127.0.0.1:{args.port}"
+    try:
+        asyncio.run(wait_until_ready(base_url))
+        os.environ["SECRET_KEY"] = env["SECRET_KEY"]
+        from app.utils import create_access_token
+
+        token = create_access_token(data={"sub": "bench"})
+        return asyncio.run(run_load(base_url, args.concurrency, args.requests, token))
+    finally:
+        server.terminate()
+        server.wait()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--concurrency", type=int, default=500)
+    parser.add_argument("--requests", type=int, default=20000)
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--modes", default="sync,async")
+    parser.add_argument("--prepare", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.prepare:
+        prepare_database(args.prepare)
+        return
+
+    print(f"{args.requests} requests over {args.concurrency} concurrent connections")
+    print(f"{'mode':<6} {'req/s':>9} {'p50 ms':>9} {'p99 ms':>9} {'errors':>7}")
+    for mode in args.modes.split(","):
+        r = bench_mode(mode, args)
+        print(
+            f"{mode:<6} {r['rps']:>9.0f} {r['p50_ms']:>9.1f} "
+            f"{r['p99_ms']:>9.1f} {r['errors']:>7}"
+        )
+
+
+if __name__ == "__main__":
+    main()
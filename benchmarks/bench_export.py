@@ -0,0 +1,162 @@
+"""
+Throughput and memory of the streaming reservation export (CSV and Parquet).
+
+Seeds a scratch database with --rows reservations (one seat each, 100 seats
+per showtime), then drains ExportService.stream_reservations for each format
+and reports rows/s, output size and peak RSS growth while exporting. A flat
+RSS as --rows grows is the point: only one cursor batch is held at a time.
+
+    python benchmarks/bench_export.py --rows 10000000 --db /tmp/export.db
+
+Seeding 10M rows takes a few minutes; pass the same --db again to reuse it.
+Anonymous RSS is sampled from /proc, so memory figures are Linux only.
+"""
+
+import argparse
+import os
+import sys
+import tempfile
+import threading
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+os.environ.setdefault("SECRET_KEY", "benchmark")
+
+from sqlalchemy import create_engine, func, select
+from sqlalchemy.orm import sessionmaker
+from app.config import settings
+from app.database import Base, configure_engine
+from app.models import Reservation
+from app.schemas.export import ExportFormat
+from app.services.export_service import ExportService
+
+SEATS_PER_SHOWTIME = 100
+BATCH = 100_000
+
+
+def seed(engine, rows: int):
+    showtimes = -(-rows // SEATS_PER_SHOWTIME)
+    start = datetime(2024, 1, 1, 10)
+    conn = engine.raw_connection()
+    try:
+        cursor = conn.cursor()
+        cursor.execute(
+            "INSERT INTO users (id, email, username, hashed_password, role) "
+            "VALUES (1, 'bench@example.com', 'bench', 'x', 'USER')"
+        )
+        cursor.executemany(
+            "INSERT INTO movies (id, title, genre, duration_minutes) "
+            "VALUES (?, ?, ?, 100)",
+            [(i, f"Movie {i}", f"Genre {i % 7}") for i in range(1, 51)],
+        )
+        cursor.executemany(
+            "INSERT INTO showtimes (id, movie_id, start_time, hall_number, price, "
+            "total_seats, seat_map_version) VALUES (?, ?, ?, ?, 12.5, ?, 0)",
+            (
+                (
+                    i,
+                    i % 50 + 1,
+                    str(start + timedelta(hours=3 * i)),
+                    i % 10 + 1,
+                    SEATS_PER_SHOWTIME,
+                )
+                for i in range(1, showtimes + 1)
+            ),
+        )
+        created_at = str(start)
+        for offset in range(0, rows, BATCH):
+            ids = range(offset + 1, min(offset + BATCH, rows) + 1)
+            cursor.executemany(
+                "INSERT INTO seats (id, showtime_id, row, number, is_reserved, "
+                "version) VALUES (?, ?, ?, ?, 1, 0)",
+                (
+                    (i, (i - 1) // SEATS_PER_SHOWTIME + 1, "ABCDEFGHIJ"[i % 10], i % 97)
+                    for i in ids
+                ),
+            )
+            cursor.executemany(
+                "INSERT INTO reservations (id, user_id, showtime_id, seat_id, "
+                "status, created_at) VALUES (?, 1, ?, ?, ?, ?)",
+                (
+                    (
+                        i,
+                        (i - 1) // SEATS_PER_SHOWTIME + 1,
+                        i,
+                        "CANCELLED" if i % 20 == 0 else "CONFIRMED",
+                        created_at,
+                    )
+                    for i in ids
+                ),
+            )
+            conn.commit()
+    finally:
+        conn.close()
+
+
+def rss_bytes() -> int:
+    # Anonymous memory only: pages of the database file mapped by mmap_size
+    # count towards RSS too, but are page cache rather than export buffers.
+    with open("/proc/self/status") as status:
+        for line in status:
+            if line.startswith("RssAnon:"):
+                return int(line.split()[1]) * 1024
+    return 0
+
+
+def export(SessionLocal, export_format: ExportFormat) -> dict:
+    baseline = rss_bytes()
+    peak = [baseline]
+    done = threading.Event()
+
+    def sample():
+        while not done.wait(0.05):
+            peak[0] = max(peak[0], rss_bytes())
+
+    sampler = threading.Thread(target=sample, daemon=True)
+    sampler.start()
+    size = 0
+    started = time.perf_counter()
+    with SessionLocal() as db:
+        for chunk in ExportService.stream_reservations(db, export_format):
+            size += len(chunk)
+    elapsed = time.perf_counter() - started
+    done.set()
+    sampler.join()
+    return {"seconds": elapsed, "bytes": size, "rss_growth": peak[0] - baseline}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rows", type=int, default=10_000_000)
+    parser.add_argument("--chunk-rows", type=int, default=settings.EXPORT_CHUNK_ROWS)
+    parser.add_argument("--db", help="database file, seeded when it does not exist")
+    parser.add_argument("--formats", nargs="+", default=[f.value for f in ExportFormat])
+    args = parser.parse_args()
+    settings.EXPORT_CHUNK_ROWS = args.chunk_rows
+
+    path = Path(args.db or Path(tempfile.mkdtemp(prefix="bench_export_")) / "bench.db")
+    engine = configure_engine(create_engine(f"sqlite:///{path}"))
+    SessionLocal = sessionmaker(bind=engine)
+    if not path.exists():
+        Base.metadata.create_all(bind=engine)
+        started = time.perf_counter()
+        seed(engine, args.rows)
+        print(f"seeded {args.rows} rows in {time.perf_counter() - started:.1f}s")
+
+    with SessionLocal() as db:
+        rows = db.execute(select(func.count()).select_from(Reservation)).scalar()
+    print(f"{rows} reservations, {args.chunk_rows} rows per chunk, {path}")
+    print(f"{'format':<8} {'seconds':>9} {'rows/s':>11} {'MB out':>9} {'RSS +MB':>9}")
+    for name in args.formats:
+        r = export(SessionLocal, ExportFormat(name))
+        print(
+            f"{name:<8} {r['seconds']:>9.1f} {rows / r['seconds']:>11.0f} "
+            f"{r['bytes'] / 2**20:>9.1f} {r['rss_growth'] / 2**20:>9.1f}"
+        )
+    engine.dispose()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,126 @@
+"""
+Per-call latency of the hot lookups, built per request through the ORM Query
+API versus the pre-built statements the services now execute.
+
+Covers the showtime fetch and seat lookup in ReservationService.reserve_seats,
+the user lookup behind get_current_user and MovieService.get_available_seats.
+Each variant runs against the same scratch database and session.
+
+    python benchmarks/bench_hot_queries.py --iterations 5000
+"""
+
+import argparse
+import os
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+os.environ.setdefault("SECRET_KEY", "benchmark")
+
+from sqlalchemy import and_, create_engine
+from sqlalchemy.orm import sessionmaker
+from app.database import Base, configure_engine
+from app.dependencies import CURRENT_USER_STMT
+from app.models import Movie, Showtime, Seat, User
+from app.services.movie_service import AVAILABLE_SEATS_STMT
+from app.services.reservation_service import SEAT_LOOKUP_STMT, SHOWTIME_LOOKUP_STMT
+
+
+def seed(db):
+    movie = Movie(title="Benchmark", genre="Drama", duration_minutes=100)
+    user = User(email="bench@example.com", username="bench", hashed_password="x")
+    db.add_all([movie, user])
+    db.flush()
+    showtime = Showtime(
+        movie_id=movie.id,
+        start_time=datetime.utcnow() + timedelta(days=1),
+        hall_number=1,
+        price=10,
+        total_seats=100,
+    )
+    db.add(showtime)
+    db.flush()
+    db.bulk_insert_mappings(
+        Seat,
+        [
+            {"showtime_id": showtime.id, "row": row, "number": n, "is_reserved": False}
+            for row in "ABCDEFGHIJ"
+            for n in range(1, 11)
+        ],
+    )
+    db.commit()
+    seat_ids = [seat_id for (seat_id,) in db.query(Seat.id).limit(4)]
+    return showtime.id, seat_ids
+
+
+def timed(db, fn, iterations: int) -> float:
+    for _ in range(min(iterations, 100)):
+        fn()
+    db.expunge_all()
+    started = time.perf_counter()
+    for _ in range(iterations):
+        fn()
+        # Requests never share an identity map, so don't let ORM variants
+        # benefit from instances loaded by the previous iteration.
+        db.expunge_all()
+    return (time.perf_counter() - started) / iterations * 1_000_000
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--iterations", type=int, default=5000)
+    args = parser.parse_args()
+
+    path = Path(tempfile.mkdtemp(prefix="bench_hot_queries_")) / "bench.db"
+    engine = configure_engine(create_engine(f"sqlite:///{path}"))
+    Base.metadata.create_all(bind=engine)
+    SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+    db = SessionLocal()
+    showtime_id, seat_ids = seed(db)
+
+    cases = {
+        "showtime fetch": (
+            lambda: db.query(Showtime).filter(Showtime.id == showtime_id).first(),
+            lambda: db.execute(
+                SHOWTIME_LOOKUP_STMT, {"showtime_id": showtime_id}
+            ).scalar(),
+        ),
+        "seat lookup": (
+            lambda: db.query(Seat)
+            .filter(and_(Seat.id.in_(seat_ids), Seat.showtime_id == showtime_id))
+            .with_for_update()
+            .all(),
+            lambda: db.execute(
+                SEAT_LOOKUP_STMT, {"seat_ids": seat_ids, "showtime_id": showtime_id}
+            ).all(),
+        ),
+        "current user": (
+            lambda: db.query(User).filter(User.username == "bench").first(),
+            lambda: db.execute(CURRENT_USER_STMT, {"username": "bench"}).first(),
+        ),
+        "available seats": (
+            lambda: db.query(Seat)
+            .filter(Seat.showtime_id == showtime_id, Seat.is_reserved == False)
+            .all(),
+            lambda: db.execute(
+                AVAILABLE_SEATS_STMT, {"showtime_id": showtime_id}
+            ).all(),
+        ),
+    }
+
+    print(f"{args.iterations} iterations per variant, microseconds per call")
+    print(f"{'query':<16} {'orm query':>10} {'cached':>10} {'speedup':>8}")
+    for name, (legacy, cached) in cases.items():
+        before = timed(db, legacy, args.iterations)
+        after = timed(db, cached, args.iterations)
+        print(f"{name:<16} {before:>10.1f} {after:>10.1f} {before / after:>7.2f}x")
+
+    db.close()
+    engine.dispose()
+
+
+if __name__ == "__main__":
+    main()
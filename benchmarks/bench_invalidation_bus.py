@@ -0,0 +1,122 @@
+"""
+Delivery latency and loss of the change-log invalidation bus across worker
+processes.
+
+One publisher commits change events at a fixed rate to a scratch database.
+Several subscriber processes tail it with their own InvalidationBus, as
+uvicorn workers would. Each subscriber reports what it received, the p50, p99
+and max commit-to-handler latency, and the events it counted as dropped.
+
+    python benchmarks/bench_invalidation_bus.py --workers 4 --events 2000 --rate 500
+"""
+
+import argparse
+import multiprocessing
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+os.environ.setdefault("SECRET_KEY", "benchmark")
+
+
+def make_engine(path: Path):
+    from sqlalchemy import create_engine
+    from app.database import configure_engine
+
+    return configure_engine(
+        create_engine(f"sqlite:///{path}", connect_args={"check_same_thread": False})
+    )
+
+
+def subscriber(path, poll_interval, retention, expected, ready, results):
+    from app.invalidation import InvalidationBus
+
+    bus = InvalidationBus(poll_interval=poll_interval, retention=retention)
+    received = []
+    bus.subscribe("bench", received.append)
+    bus.start(make_engine(path))
+    ready.put(os.getpid())
+
+    deadline = time.monotonic() + 60
+    while len(received) + bus.dropped < expected and time.monotonic() < deadline:
+        time.sleep(0.05)
+    bus.stop()
+    results.put(bus.stats())
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--workers", type=int, default=4)
+    parser.add_argument("--events", type=int, default=2000)
+    parser.add_argument("--rate", type=float, default=500.0)
+    parser.add_argument("--poll-interval", type=float, default=0.05)
+    parser.add_argument("--retention", type=float, default=300.0)
+    args = parser.parse_args()
+
+    from sqlalchemy.orm import sessionmaker
+    from app.database import Base
+    from app.invalidation import invalidation_bus
+
+    path = Path(tempfile.mkdtemp(prefix="bench_invalidation_")) / "bench.db"
+    engine = make_engine(path)
+    Base.metadata.create_all(bind=engine)
+    SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+
+    ctx = multiprocessing.get_context("spawn")
+    ready, results = ctx.Queue(), ctx.Queue()
+    workers = [
+        ctx.Process(
+            target=subscriber,
+            args=(
+                path,
+                args.poll_interval,
+                args.retention,
+                args.events,
+                ready,
+                results,
+            ),
+        )
+        for _ in range(args.workers)
+    ]
+    for worker in workers:
+        worker.start()
+    for _ in workers:
+        ready.get(timeout=60)
+
+    db = SessionLocal()
+    started = time.perf_counter()
+    for index in range(args.events):
+        invalidation_bus.publish(db, "bench", index)
+        db.commit()
+        delay = started + (index + 1) / args.rate - time.perf_counter()
+        if delay > 0:
+            time.sleep(delay)
+    db.close()
+    elapsed = time.perf_counter() - started
+
+    stats = [results.get(timeout=120) for _ in workers]
+    for worker in workers:
+        worker.join()
+    engine.dispose()
+
+    print(
+        f"{args.events} events in {elapsed:.2f}s to {args.workers} workers, "
+        f"poll interval {args.poll_interval * 1000:.0f} ms"
+    )
+    print(
+        f"{'worker':<8} {'delivered':>9} {'dropped':>8} {'p50 ms':>8} {'p99 ms':>8} {'max ms':>8}"
+    )
+    for index, s in enumerate(stats):
+        latency = s["latency_ms"]
+        print(
+            f"{index:<8} {s['delivered']:>9} {s['dropped']:>8} "
+            f"{latency['p50'] or 0:>8.1f} {latency['p99'] or 0:>8.1f} "
+            f"{latency['max'] or 0:>8.1f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,133 @@
+"""
+Memory and latency of the seat read paths on a single 500-seat showtime:
+full ORM entities (the previous implementation) versus the column-only
+records returned by MovieService.
+
+Each call fetches the seats and serializes them through the SeatInfo response
+schema, like /showtimes/{id}/seats and /available-seats do. Peak memory is
+measured with tracemalloc over one call on a fresh session.
+
+    python benchmarks/bench_read_records.py --seats 500 --iterations 500
+"""
+
+import argparse
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import List
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+os.environ.setdefault("SECRET_KEY", "benchmark")
+
+from pydantic import TypeAdapter
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from app.database import Base, configure_engine
+from app.models import Movie, Showtime, Seat
+from app.schemas.reservation import SeatInfo
+from app.services.movie_service import MovieService
+
+seat_list = TypeAdapter(List[SeatInfo])
+
+
+def seed(SessionLocal, seats: int) -> int:
+    db = SessionLocal()
+    movie = Movie(title="Benchmark", genre="Drama", duration_minutes=100)
+    db.add(movie)
+    db.flush()
+    showtime = Showtime(
+        movie_id=movie.id,
+        start_time=datetime.utcnow() + timedelta(days=1),
+        hall_number=1,
+        price=10,
+        total_seats=seats,
+    )
+    db.add(showtime)
+    db.flush()
+    db.bulk_insert_mappings(
+        Seat,
+        [
+            {
+                "showtime_id": showtime.id,
+                "row": f"R{n // 25}",
+                "number": n % 25 + 1,
+                "is_reserved": n % 3 == 0,
+            }
+            for n in range(seats)
+        ],
+    )
+    db.commit()
+    showtime_id = showtime.id
+    db.close()
+    return showtime_id
+
+
+def orm_seats(db, showtime_id):
+    showtime = db.query(Showtime).filter(Showtime.id == showtime_id).first()
+    return showtime.seats
+
+
+def orm_available_seats(db, showtime_id):
+    return (
+        db.query(Seat)
+        .filter(Seat.showtime_id == showtime_id, Seat.is_reserved == False)
+        .all()
+    )
+
+
+def serialize(seats) -> bytes:
+    return seat_list.dump_json(seat_list.validate_python(seats, from_attributes=True))
+
+
+def measure(SessionLocal, fn, showtime_id, iterations: int):
+    db = SessionLocal()
+    tracemalloc.start()
+    serialize(fn(db, showtime_id))
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    db.close()
+
+    db = SessionLocal()
+    started = time.perf_counter()
+    for _ in range(iterations):
+        serialize(fn(db, showtime_id))
+        # Each request gets its own session, so drop loaded entities.
+        db.expunge_all()
+    elapsed = (time.perf_counter() - started) / iterations * 1000
+    db.close()
+    return elapsed, peak / 1024
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--seats", type=int, default=500)
+    parser.add_argument("--iterations", type=int, default=500)
+    args = parser.parse_args()
+
+    path = Path(tempfile.mkdtemp(prefix="bench_read_records_")) / "bench.db"
+    engine = configure_engine(create_engine(f"sqlite:///{path}"))
+    Base.metadata.create_all(bind=engine)
+    SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+    showtime_id = seed(SessionLocal, args.seats)
+
+    cases = [
+        ("seats", orm_seats, MovieService.get_showtime_seats),
+        ("available", orm_available_seats, MovieService.get_available_seats),
+    ]
+
+    print(f"{args.seats}-seat showtime, {args.iterations} iterations per variant")
+    print(f"{'endpoint':<10} {'variant':<8} {'ms/call':>8} {'peak KiB':>9}")
+    for name, legacy, records in cases:
+        for variant, fn in (("orm", legacy), ("records", records)):
+            latency, peak = measure(SessionLocal, fn, showtime_id, args.iterations)
+            print(f"{name:<10} {variant:<8} {latency:>8.2f} {peak:>9.1f}")
+
+    engine.dispose()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,155 @@
+"""
+Reservation throughput under concurrent readers, with and without the SQLite
+performance profile (WAL, synchronous, cache/mmap, busy_timeout, temp_store).
+
+Writer threads reserve seats one at a time through ReservationService while
+reader threads poll available seats, all against one scratch database file.
+
+    python benchmarks/bench_sqlite_profile.py --readers 8 --writers 2 --seconds 10
+"""
+
+import argparse
+import os
+import sys
+import tempfile
+import threading
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+os.environ.setdefault("SECRET_KEY", "benchmark")
+
+from fastapi import HTTPException
+from sqlalchemy import create_engine
+from sqlalchemy.exc import OperationalError
+from sqlalchemy.orm import sessionmaker
+from app.config import settings
+from app.database import Base, configure_engine
+from app.models import Movie, Showtime, Seat, User
+from app.services.movie_service import MovieService
+from app.services.reservation_service import ReservationService
+
+
+def seed(SessionLocal, writers: int, showtimes: int):
+    db = SessionLocal()
+    movie = Movie(title="Benchmark", genre="Drama", duration_minutes=100)
+    users = [
+        User(email=f"w{i}@example.com", username=f"w{i}", hashed_password="x")
+        for i in range(writers)
+    ]
+    db.add(movie)
+    db.add_all(users)
+    db.flush()
+    db.bulk_insert_mappings(
+        Showtime,
+        [
+            {
+                "id": i,
+                "movie_id": movie.id,
+                "start_time": datetime.utcnow() + timedelta(days=1),
+                "hall_number": 1,
+                "price": 10,
+                "total_seats": 100,
+            }
+            for i in range(1, showtimes + 1)
+        ],
+    )
+    db.bulk_insert_mappings(
+        Seat,
+        [
+            {"showtime_id": i, "row": row, "number": n, "is_reserved": False}
+            for i in range(1, showtimes + 1)
+            for row in "ABCDEFGHIJ"
+            for n in range(1, 11)
+        ],
+    )
+    db.commit()
+    seats = db.query(Seat.showtime_id, Seat.id).order_by(Seat.id).all()
+    user_ids = [u.id for u in users]
+    db.close()
+    return seats, user_ids
+
+
+def run(profile: bool, args) -> dict:
+    settings.SQLITE_PRAGMAS_ENABLED = profile
+    path = Path(tempfile.mkdtemp(prefix="bench_sqlite_")) / "bench.db"
+    engine = configure_engine(
+        create_engine(
+            f"sqlite:///{path}",
+            pool_size=args.readers + args.writers,
+            connect_args={"check_same_thread": False},
+        )
+    )
+    SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+    Base.metadata.create_all(bind=engine)
+    seats, user_ids = seed(SessionLocal, args.writers, args.showtimes)
+
+    stop = threading.Event()
+    counts = {"reservations": 0, "reads": 0, "locked": 0}
+    lock = threading.Lock()
+
+    def bump(key):
+        with lock:
+            counts[key] += 1
+
+    def writer(index: int):
+        db = SessionLocal()
+        for showtime_id, seat_id in seats[index :: args.writers]:
+            if stop.is_set():
+                break
+            try:
+                ReservationService.reserve_seats(
+                    db, user_ids[index], showtime_id, [seat_id]
+                )
+                bump("reservations")
+            except (OperationalError, HTTPException):
+                db.rollback()
+                bump("locked")
+        db.close()
+
+    def reader(index: int):
+        db = SessionLocal()
+        while not stop.is_set():
+            try:
+                MovieService.get_available_seats(db, index % args.showtimes + 1)
+                db.commit()
+                bump("reads")
+            except OperationalError:
+                db.rollback()
+                bump("locked")
+        db.close()
+
+    threads = [threading.Thread(target=writer, args=(i,)) for i in range(args.writers)]
+    threads += [threading.Thread(target=reader, args=(i,)) for i in range(args.readers)]
+    for thread in threads:
+        thread.start()
+    time.sleep(args.seconds)
+    stop.set()
+    for thread in threads:
+        thread.join()
+    engine.dispose()
+
+    return {key: value / args.seconds for key, value in counts.items()}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--readers", type=int, default=8)
+    parser.add_argument("--writers", type=int, default=2)
+    parser.add_argument("--seconds", type=float, default=10.0)
+    parser.add_argument("--showtimes", type=int, default=200)
+    args = parser.parse_args()
+
+    print(f"{args.readers} readers, {args.writers} writers, {args.seconds}s per run")
+    print(f"{'profile':<8} {'reservations/s':>17} {'reads/s':>9} {'errors/s':>9}")
+    for profile in (False, True):
+        r = run(profile, args)
+        print(
+            f"{'on' if profile else 'off':<8} {r['reservations']:>17.1f} "
+            f"{r['reads']:>9.1f} {r['locked']:>9.1f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
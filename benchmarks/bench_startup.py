@@ -0,0 +1,126 @@
+"""
+Startup-time budget for building the application.
+
+Runs `python -X importtime` on `create_app()` in a fresh interpreter several
+times, reports total import time and the heaviest modules, and exits non-zero
+when the median exceeds the budget or when a module that must stay lazy
+(bcrypt/passlib, jose/cryptography) is imported during startup.
+
+    python benchmarks/bench_startup.py --budget-ms 1500 --runs 5 [--json]
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+
+LAZY_MODULES = ("passlib", "bcrypt", "jose", "cryptography")
+
+STARTUP_SNIPPET = (
+    "import time; started = time.perf_counter(); "
+    "from app.main import create_app; create_app(); "
+    "print(time.perf_counter() - started)"
+)
+
+
+def measure_once() -> dict:
+    env = dict(os.environ)
+    env.setdefault("SECRET_KEY", "benchmark")
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", STARTUP_SNIPPET],
+        cwd=ROOT,
+        env=env,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+
+    modules = []
+    total_us = 0
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        _, self_us, cumulative_us, name = (
+            part.strip() for part in line.replace("import time:", "|").split("|")
+        )
+        depth = (len(line.rsplit("|", 1)[1]) - len(name) - 1) // 2
+        modules.append((name, int(self_us)))
+        if depth == 0:
+            total_us += int(cumulative_us)
+
+    return {
+        "import_ms": total_us / 1000,
+        "create_app_ms": float(result.stdout.strip().splitlines()[-1]) * 1000,
+        "modules": modules,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "--budget-ms",
+        type=float,
+        default=float(os.environ.get("STARTUP_BUDGET_MS", 1500)),
+    )
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--top", type=int, default=10)
+    parser.add_argument("--json", action="store_true", help="Machine-readable output")
+    args = parser.parse_args()
+
+    runs = [measure_once() for _ in range(args.runs)]
+    import_ms = statistics.median(r["import_ms"] for r in runs)
+    create_app_ms = statistics.median(r["create_app_ms"] for r in runs)
+
+    self_times = {}
+    for run in runs:
+        for name, self_us in run["modules"]:
+            self_times.setdefault(name, []).append(self_us)
+    heaviest = sorted(
+        ((name, statistics.median(times) / 1000) for name, times in self_times.items()),
+        key=lambda item: item[1],
+        reverse=True,
+    )[: args.top]
+    eager = sorted({name for name in self_times if name.split(".")[0] in LAZY_MODULES})
+
+    failures = []
+    if import_ms > args.budget_ms:
+        failures.append(
+            f"import time {import_ms:.0f} ms exceeds {args.budget_ms:.0f} ms"
+        )
+    if eager:
+        failures.append(f"modules imported eagerly: {', '.join(eager[:5])}")
+
+    if args.json:
+        print(
+            json.dumps(
+                {
+                    "import_ms": round(import_ms, 1),
+                    "create_app_ms": round(create_app_ms, 1),
+                    "budget_ms": args.budget_ms,
+                    "heaviest": [[n, round(ms, 2)] for n, ms in heaviest],
+                    "eager_lazy_modules": eager,
+                    "ok": not failures,
+                }
+            )
+        )
+    else:
+        print(
+            f"median import time: {import_ms:.1f} ms (budget {args.budget_ms:.0f} ms)"
+        )
+        print(f"median create_app(): {create_app_ms:.1f} ms")
+        print("heaviest modules (self time):")
+        for name, ms in heaviest:
+            print(f"  {ms:8.2f} ms  {name}")
+        for failure in failures:
+            print(f"FAIL: {failure}")
+
+    sys.exit(1 if failures else 0)
+
+
+if __name__ == "__main__":
+    main()
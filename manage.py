@@ -0,0 +1,91 @@
+import argparse
+import sys
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).parent))
+
+from app.database import SessionLocal, engine
+from app.migrations import LATEST_VERSION, MIGRATIONS, get_current_version, migrate
+
+
+def cmd_migrate(args):
+    applied = migrate(engine, args.target or LATEST_VERSION)
+    if applied:
+        print(f"✅ Applied migrations: {', '.join(map(str, applied))}")
+    else:
+        print("✅ Schema is up to date")
+
+
+def cmd_status(args):
+    with engine.connect() as conn:
+        current = get_current_version(conn)
+
+    for migration in MIGRATIONS:
+        mark = "x" if migration.version <= current else " "
+        print(f"[{mark}] {migration.version:04d} {migration.description}")
+
+    if current < LATEST_VERSION:
+        sys.exit(1)
+
+
+def cmd_rebuild_rollups(args):
+    from app.services.rollup_service import RollupService
+
+    with SessionLocal() as db:
+        result = RollupService.rebuild(db)
+    print(
+        f"✅ Rebuilt rollups for {result['showtimes']} showtimes over "
+        f"{result['days']} days ({result['drifted_showtimes']} had drifted)"
+    )
+
+
+def cmd_prune_revocations(args):
+    from app.revocation import revocation_store
+
+    with SessionLocal() as db:
+        deleted = revocation_store.prune(db)
+    print(f"✅ Deleted {deleted} expired token revocations")
+
+
+def cmd_prune_refresh_tokens(args):
+    from app.services.auth_service import AuthService
+
+    with SessionLocal() as db:
+        deleted = AuthService.prune_refresh_tokens(db)
+    print(f"✅ Deleted {deleted} expired refresh tokens")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Movie Reservation API management")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    migrate_parser = subparsers.add_parser("migrate", help="Apply schema migrations")
+    migrate_parser.add_argument("--target", type=int, help="Stop at this version")
+    migrate_parser.set_defaults(func=cmd_migrate)
+
+    status_parser = subparsers.add_parser(
+        "status", help="Show applied migrations (exit 1 if behind)"
+    )
+    status_parser.set_defaults(func=cmd_status)
+
+    rollups_parser = subparsers.add_parser(
+        "rebuild-rollups", help="Recompute report rollups from reservations"
+    )
+    rollups_parser.set_defaults(func=cmd_rebuild_rollups)
+
+    revocations_parser = subparsers.add_parser(
+        "prune-revocations", help="Delete expired token revocations"
+    )
+    revocations_parser.set_defaults(func=cmd_prune_revocations)
+
+    refresh_parser = subparsers.add_parser(
+        "prune-refresh-tokens", help="Delete expired refresh tokens"
+    )
+    refresh_parser.set_defaults(func=cmd_prune_refresh_tokens)
+
+    args = parser.parse_args()
+    args.func(args)
+
+
+if __name__ == "__main__":
+    main()
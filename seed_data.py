@@ -5,7 +5,8 @@ sys.path.append(str(Path(__file__).parent))
 
 from sqlalchemy import create_engine, text
 from sqlalchemy_utils import database_exists, create_database
-from app.database import SessionLocal, engine, Base
+from app.database import SessionLocal, engine
+from app.migrations import migrate
 from app.models.user import User, UserRole
 from app.utils import get_password_hash
 
@@ -20,9 +21,9 @@ def create_database_if_not_exists():
 
 
 def create_tables():
-    print("Creating tables...")
-    Base.metadata.create_all(bind=engine)
-    print("✅ Tables created")
+    print("Applying migrations...")
+    migrate(engine)
+    print("✅ Schema is up to date")
 
 
 def create_initial_admin():
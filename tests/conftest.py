@@ -1,10 +1,26 @@
 import pytest
 import os
+from contextlib import contextmanager
+from datetime import datetime, timedelta
+from decimal import Decimal
+
+os.environ.setdefault("SCHEMA_CHECK_ON_STARTUP", "false")
+os.environ.setdefault("INVALIDATION_BUS_ENABLED", "false")
+
 from sqlalchemy import create_engine
 from sqlalchemy.orm import sessionmaker
+from fastapi import Request
 from fastapi.testclient import TestClient
-from app.database import Base, get_db
+from app.cache import cache
+from app.database import Base, LazySession, get_db, get_lazy_read_db, get_read_db
 from app.main import app
+from app.models.movie import Movie
+from app.models.seat import Seat
+from app.models.showtime import Showtime
+from app.models.user import User, UserRole
+from app.query_stats import count_queries
+from app.revocation import RevocationStore
+from app.utils import create_access_token
 
 SQLALCHEMY_DATABASE_URL = "sqlite:///./test_movie_reservation.db"
 
@@ -22,6 +38,14 @@ def override_get_db():
         db.close()
 
 
+def override_get_lazy_read_db(request: Request):
+    lazy = LazySession(TestingSessionLocal, request)
+    try:
+        yield lazy
+    finally:
+        lazy.close()
+
+
 @pytest.fixture(scope="function")
 def db_session():
     """Создает новую сессию базы данных для каждого теста"""
@@ -34,15 +58,54 @@ def db_session():
         Base.metadata.drop_all(bind=engine)
 
 
+@pytest.fixture(autouse=True)
+def clear_cache():
+    """Сбрасывает кэш чтения: база пересоздаётся между тестами"""
+    cache.clear()
+    yield
+    cache.clear()
+
+
+@pytest.fixture(autouse=True)
+def revocation_store(monkeypatch):
+    """Подменяет хранилище отзывов новым: его синхронизация не зависит от
+    порядка тестов и не попадает в бюджеты запросов"""
+    store = RevocationStore(sync_seconds=3600, reload_seconds=3600)
+    for module in ("app.revocation", "app.dependencies", "app.services.auth_service"):
+        monkeypatch.setattr(f"{module}.revocation_store", store)
+    return store
+
+
 @pytest.fixture(scope="function")
-def client(db_session):
+def client(db_session, revocation_store):
     """Создает тестовый клиент FastAPI"""
+    # Первая синхронизация хранилища отзывов выполняется до запросов теста.
+    with TestingSessionLocal() as db:
+        revocation_store.is_revoked(db, None)
     app.dependency_overrides[get_db] = override_get_db
+    app.dependency_overrides[get_read_db] = override_get_db
+    app.dependency_overrides[get_lazy_read_db] = override_get_lazy_read_db
     with TestClient(app) as test_client:
         yield test_client
     app.dependency_overrides.clear()
 
 
+@pytest.fixture
+def assert_max_queries():
+    """Проверяет, что блок выполняет не больше заданного числа SQL-запросов"""
+
+    @contextmanager
+    def _assert_max_queries(limit):
+        with count_queries() as stats:
+            yield stats
+        assert stats.count <= limit, (
+            f"{stats.count} queries executed, expected at most {limit}. "
+            f"Repeated statements: {stats.suspected_n_plus_one(2)}"
+        )
+
+    return _assert_max_queries
+
+
 @pytest.fixture
 def test_user_data():
     """Тестовые данные пользователя"""
@@ -87,3 +150,75 @@ def admin_user_data():
         "username": "admin",
         "password": "adminpassword123",
     }
+
+
+@pytest.fixture
+def create_user(db_session):
+    """Создаёт пользователя с заданным именем и ролью"""
+
+    def _create_user(username="user", role=UserRole.USER):
+        user = User(
+            email=f"{username}@example.com",
+            username=username,
+            hashed_password="hashed_password",
+            role=role,
+        )
+        db_session.add(user)
+        db_session.commit()
+        return user
+
+    return _create_user
+
+
+@pytest.fixture
+def admin_headers(create_user):
+    """Создаёт администратора и возвращает заголовки с его токеном"""
+    admin = create_user("admin", UserRole.ADMIN)
+    token = create_access_token(data={"sub": admin.username})
+    return {"Authorization": f"Bearer {token}"}
+
+
+@pytest.fixture
+def create_movie(db_session):
+    """Создаёт фильм"""
+
+    def _create_movie(title="Test Movie", genre="Action", duration_minutes=120):
+        movie = Movie(title=title, genre=genre, duration_minutes=duration_minutes)
+        db_session.add(movie)
+        db_session.commit()
+        return movie
+
+    return _create_movie
+
+
+@pytest.fixture
+def create_showtime(db_session, create_movie):
+    """Создаёт сеанс с местами, поровну в каждом ряду; возвращает сеанс и места"""
+
+    def _create_showtime(
+        movie=None,
+        start_time=None,
+        hall_number=1,
+        price="10.00",
+        seats=4,
+        rows="A",
+    ):
+        showtime = Showtime(
+            movie_id=(movie or create_movie()).id,
+            start_time=start_time or datetime.utcnow() + timedelta(days=1),
+            hall_number=hall_number,
+            price=Decimal(price),
+            total_seats=seats,
+        )
+        db_session.add(showtime)
+        db_session.commit()
+        showtime_seats = [
+            Seat(showtime_id=showtime.id, row=row, number=n, is_reserved=False)
+            for row in rows
+            for n in range(1, seats // len(rows) + 1)
+        ]
+        db_session.add_all(showtime_seats)
+        db_session.commit()
+        return showtime, showtime_seats
+
+    return _create_showtime
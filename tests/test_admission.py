@@ -0,0 +1,151 @@
+import asyncio
+import httpx
+import pytest
+from fastapi import FastAPI
+from app.admission import AdmissionController, AdmissionGroup, AdmissionMiddleware
+
+
+def make_controller(limit=1, queue_size=1, queue_timeout=1.0):
+    return AdmissionController(
+        {"writes": AdmissionGroup("writes", limit, queue_size, queue_timeout)},
+        retry_after=2,
+    )
+
+
+def make_app(controller, gate):
+    app = FastAPI()
+    app.add_middleware(AdmissionMiddleware, controller=controller)
+
+    @app.post("/reservations/")
+    async def reserve():
+        await gate.wait()
+        return {"ok": True}
+
+    @app.get("/health")
+    async def health():
+        return {"status": "healthy"}
+
+    return app
+
+
+class TestAdmissionGroup:
+    """Тесты для ограничения параллельных запросов группы"""
+
+    @pytest.mark.asyncio
+    async def test_waiter_takes_released_slot_in_order(self):
+        """Тест передачи освободившегося слота по очереди"""
+        group = AdmissionGroup("writes", limit=1, queue_size=2, queue_timeout=1)
+        assert await group.acquire()
+
+        first = asyncio.ensure_future(group.acquire())
+        second = asyncio.ensure_future(group.acquire())
+        await asyncio.sleep(0)
+        assert group.stats()["waiting"] == 2
+        assert not await group.acquire()
+
+        group.release()
+        assert await first
+        assert not second.done()
+        group.release()
+        assert await second
+        group.release()
+
+        stats = group.stats()
+        assert stats["active"] == 0
+        assert stats["admitted"] == 3
+        assert stats["rejected_queue_full"] == 1
+
+    @pytest.mark.asyncio
+    async def test_queue_timeout(self):
+        """Тест отказа по истечении ожидания в очереди"""
+        group = AdmissionGroup("writes", limit=1, queue_size=1, queue_timeout=0.01)
+        assert await group.acquire()
+
+        assert not await group.acquire()
+
+        group.release()
+        assert group.stats()["active"] == 0
+        assert group.stats()["rejected_timeout"] == 1
+
+    @pytest.mark.asyncio
+    async def test_cancelled_waiter_passes_slot_on(self):
+        """Тест отмены ожидающего запроса"""
+        group = AdmissionGroup("writes", limit=1, queue_size=2, queue_timeout=1)
+        assert await group.acquire()
+        cancelled = asyncio.ensure_future(group.acquire())
+        waiting = asyncio.ensure_future(group.acquire())
+        await asyncio.sleep(0)
+
+        cancelled.cancel()
+        await asyncio.sleep(0)
+        group.release()
+
+        assert await waiting
+        group.release()
+        assert group.stats()["active"] == 0
+
+
+class TestAdmissionMiddleware:
+    """Тесты для сброса нагрузки в middleware"""
+
+    def test_route_groups(self):
+        """Тест распределения путей по группам"""
+        controller = AdmissionController.from_settings()
+
+        assert controller.group_for("/reservations/my").name == "writes"
+        assert controller.group_for("/movies/").name == "reads"
+        assert controller.group_for("/showtimes/1/seat-map").name == "reads"
+        assert controller.group_for("/admin/report/reservations").name == "admin"
+        assert controller.group_for("/showtimes/1/seat-events") is None
+        assert controller.group_for("/health") is None
+        assert controller.group_for("/auth/login") is None
+        assert controller.group_for("/moviesx") is None
+
+    @pytest.mark.asyncio
+    async def test_overload_is_shed_and_health_served(self):
+        """Тест ответа 503 с Retry-After и доступности /health"""
+        gate = asyncio.Event()
+        controller = make_controller(limit=1, queue_size=1, queue_timeout=5)
+        transport = httpx.ASGITransport(app=make_app(controller, gate))
+
+        async with httpx.AsyncClient(transport=transport, base_url="http://t") as c:
+            running = asyncio.ensure_future(c.post("/reservations/"))
+            queued = asyncio.ensure_future(c.post("/reservations/"))
+            while controller.groups["writes"].stats()["waiting"] < 1:
+                await asyncio.sleep(0.001)
+
+            shed = await c.post("/reservations/")
+            health = await c.get("/health")
+            gate.set()
+            responses = await asyncio.gather(running, queued)
+
+        assert shed.status_code == 503
+        assert shed.headers["retry-after"] == "2"
+        assert "overloaded" in shed.json()["detail"]
+        assert health.status_code == 200
+        assert [r.status_code for r in responses] == [200, 200]
+        assert controller.stats()["writes"]["active"] == 0
+
+    def test_admission_metrics(self, client, db_session):
+        """Тест метрик контроля допуска"""
+        from app.models.user import User, UserRole
+        from app.utils import create_access_token
+
+        db_session.add(
+            User(
+                email="admin@example.com",
+                username="admin",
+                hashed_password="hashed_password",
+                role=UserRole.ADMIN,
+            )
+        )
+        db_session.commit()
+        token = create_access_token(data={"sub": "admin"})
+
+        response = client.get(
+            "/admin/metrics/admission", headers={"Authorization": f"Bearer {token}"}
+        )
+
+        assert response.status_code == 200
+        assert set(response.json()) == {"writes", "reads", "admin"}
+        assert response.json()["admin"]["active"] == 1
@@ -0,0 +1,170 @@
+from datetime import datetime
+import pytest
+from app.invalidation import invalidation_bus
+from app.schemas.analytics import AnalyticsDimension, AnalyticsSort
+from app.services.analytics_service import build_statements
+from app.services.reservation_service import ReservationService
+
+URL = "/admin/analytics/reservations"
+
+
+@pytest.fixture
+def schedule(db_session, create_user, create_movie, create_showtime):
+    """Понедельник 07.01.2030 и суббота 12.01.2030, два фильма, два зала."""
+    user = create_user()
+    action = create_movie("Action Movie", "Action")
+    drama = create_movie("Drama Movie", "Drama", 90)
+
+    monday, monday_seats = create_showtime(action, datetime(2030, 1, 7, 18), 1)
+    saturday, saturday_seats = create_showtime(action, datetime(2030, 1, 12, 21), 2)
+    create_showtime(drama, datetime(2030, 1, 7, 21), 1, "5.00")
+    ReservationService.reserve_seats(
+        db_session, user.id, monday.id, [s.id for s in monday_seats[:3]]
+    )
+    ReservationService.reserve_seats(
+        db_session, user.id, saturday.id, [saturday_seats[0].id]
+    )
+    return action, drama
+
+
+class TestAnalyticsAPI:
+    """Тесты для многомерной аналитики бронирований"""
+
+    def test_group_by_movie(
+        self, client, db_session, assert_max_queries, schedule, admin_headers
+    ):
+        """Тест группировки по фильмам с итогами"""
+        action, drama = schedule
+
+        with assert_max_queries(6):
+            response = client.get(URL, headers=admin_headers)
+
+        data = response.json()
+        assert response.status_code == 200
+        assert data["total_groups"] == 2
+        assert data["rows"] == [
+            {
+                "movie_id": action.id,
+                "movie_title": "Action Movie",
+                "showtimes": 2,
+                "capacity": 8,
+                "reserved_seats": 4,
+                "occupancy_percentage": 50.0,
+                "revenue": 40.0,
+            },
+            {
+                "movie_id": drama.id,
+                "movie_title": "Drama Movie",
+                "showtimes": 1,
+                "capacity": 4,
+                "reserved_seats": 0,
+                "occupancy_percentage": 0.0,
+                "revenue": 0.0,
+            },
+        ]
+        assert data["totals"] == {
+            "showtimes": 3,
+            "capacity": 12,
+            "reserved_seats": 4,
+            "occupancy_percentage": 33.33,
+            "revenue": 40.0,
+        }
+
+    def test_group_by_several_dimensions(
+        self, client, db_session, schedule, admin_headers
+    ):
+        """Тест группировки по жанру, залу, дню недели и часу"""
+
+        response = client.get(
+            URL,
+            params={
+                "group_by": ["genre", "hall", "weekday", "hour"],
+                "sort": "occupancy_percentage",
+            },
+            headers=admin_headers,
+        )
+
+        rows = response.json()["rows"]
+        assert [
+            (r["genre"], r["hall_number"], r["weekday"], r["hour"]) for r in rows
+        ] == [("Action", 1, 1, 18), ("Action", 2, 6, 21), ("Drama", 1, 1, 21)]
+        assert [r["occupancy_percentage"] for r in rows] == [75.0, 25.0, 0.0]
+        assert "movie_id" not in rows[0]
+
+    def test_pagination_and_date_range(
+        self, client, db_session, schedule, admin_headers
+    ):
+        """Тест постраничной выдачи и фильтра по датам"""
+
+        page = client.get(
+            URL,
+            params={"group_by": "hall", "limit": 1, "offset": 1},
+            headers=admin_headers,
+        ).json()
+        assert page["total_groups"] == 2
+        assert [(r["hall_number"], r["revenue"]) for r in page["rows"]] == [(2, 10.0)]
+
+        monday = client.get(
+            URL,
+            params={"group_by": "hall", "end_date": "2030-01-07"},
+            headers=admin_headers,
+        ).json()
+        assert monday["total_groups"] == 1
+        assert monday["totals"]["showtimes"] == 2
+        assert monday["totals"]["revenue"] == 30.0
+
+    def test_results_are_cached_until_catalog_changes(
+        self, client, db_session, schedule, admin_headers
+    ):
+        """Тест кэширования отчёта и его сброса при изменении каталога"""
+        action, _ = schedule
+        first = client.get(URL, headers=admin_headers).json()
+
+        action.title = "Renamed"
+        db_session.commit()
+        assert client.get(URL, headers=admin_headers).json() == first
+
+        invalidation_bus.publish(db_session, "movies", action.id)
+        db_session.commit()
+        assert client.get(URL, headers=admin_headers).json()["rows"][0][
+            "movie_title"
+        ] == ("Renamed")
+
+    def test_invalid_parameters(self, client, db_session, schedule, admin_headers):
+        """Тест проверки параметров и прав доступа"""
+
+        assert client.get(URL).status_code == 403
+        assert (
+            client.get(
+                URL, params={"group_by": "seat"}, headers=admin_headers
+            ).status_code
+            == 422
+        )
+        assert (
+            client.get(URL, params={"limit": 0}, headers=admin_headers).status_code
+            == 422
+        )
+
+    def test_range_scan_uses_covering_index(self, db_session):
+        """Тест использования покрывающего индекса по сеансам"""
+        stmt = build_statements(
+            (AnalyticsDimension.HALL, AnalyticsDimension.HOUR), AnalyticsSort.REVENUE
+        ).rows
+        compiled = stmt.compile(db_session.bind)
+        params = compiled.construct_params(
+            {"start": "2030-01-01", "end": "2030-02-01", "limit": 10, "offset": 0}
+        )
+        plan = (
+            db_session.connection()
+            .exec_driver_sql(
+                "EXPLAIN QUERY PLAN " + str(compiled),
+                tuple(params[name] for name in compiled.positiontup),
+            )
+            .all()
+        )
+
+        details = " ".join(row[-1] for row in plan)
+        assert (
+            "COVERING INDEX ix_showtimes_start_time_movie_id_hall_number_total_seats"
+            in details
+        )
@@ -0,0 +1,61 @@
+import subprocess
+import sys
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from app.main import create_app
+
+
+class TestAppFactory:
+    """Тесты для фабрики приложения"""
+
+    def test_create_app_returns_new_instance(self):
+        """Тест создания независимых экземпляров приложения"""
+        first = create_app()
+        second = create_app()
+
+        assert isinstance(first, FastAPI)
+        assert first is not second
+        assert "/reservations/my" in {route.path for route in first.routes}
+
+    def test_health_check(self):
+        """Тест эндпоинта проверки состояния"""
+        with TestClient(create_app()) as client:
+            response = client.get("/health")
+
+        assert response.json() == {"status": "healthy"}
+
+    def test_cors_exposes_response_headers(self):
+        """Тест доступности заголовков курсора и возраста ответа для CORS"""
+        with TestClient(create_app()) as client:
+            response = client.get("/health", headers={"Origin": "http://example.com"})
+
+        exposed = response.headers["access-control-expose-headers"]
+        assert {h.strip() for h in exposed.split(",")} == {
+            "X-Next-Cursor",
+            "X-Stale-Age",
+        }
+
+    def test_shutdown_stops_report_jobs(self, monkeypatch):
+        """Тест остановки фоновых заданий при завершении приложения"""
+        calls = []
+        monkeypatch.setattr(
+            "app.report_jobs.report_jobs.shutdown", lambda: calls.append(True)
+        )
+
+        with TestClient(create_app()):
+            assert calls == []
+
+        assert calls == [True]
+
+    def test_heavy_modules_are_imported_lazily(self):
+        """Тест отложенного импорта passlib и jose"""
+        code = (
+            "import sys; from app.main import create_app; create_app(); "
+            "print(sorted({m.split('.')[0] for m in sys.modules} "
+            "& {'passlib', 'bcrypt', 'jose', 'cryptography'}))"
+        )
+        result = subprocess.run(
+            [sys.executable, "-c", code], capture_output=True, text=True, check=True
+        )
+
+        assert result.stdout.strip() == "[]"
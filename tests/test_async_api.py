@@ -0,0 +1,159 @@
+import pytest
+import pytest_asyncio
+import httpx
+from datetime import datetime, timedelta
+from decimal import Decimal
+from fastapi import FastAPI, Request, status
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+from app.database import (
+    AsyncLazySession,
+    get_async_database_url,
+    get_async_db,
+    get_lazy_async_db,
+)
+from app.models.user import User, UserRole
+from app.models.movie import Movie
+from app.models.showtime import Showtime
+from app.models.seat import Seat
+from app.routes import async_movies, async_reservations, async_showtimes
+from app.services.reservation_service import AsyncReservationService
+from app.utils import get_password_hash, create_access_token
+from tests.conftest import SQLALCHEMY_DATABASE_URL
+
+
+@pytest_asyncio.fixture
+async def async_session_factory(db_session):
+    engine = create_async_engine(get_async_database_url(SQLALCHEMY_DATABASE_URL))
+    yield async_sessionmaker(bind=engine, autoflush=False, expire_on_commit=False)
+    await engine.dispose()
+
+
+@pytest_asyncio.fixture
+async def async_db(async_session_factory):
+    async with async_session_factory() as db:
+        yield db
+
+
+@pytest_asyncio.fixture
+async def async_client(async_db, async_session_factory):
+    app = FastAPI()
+    app.include_router(async_movies.router)
+    app.include_router(async_showtimes.router)
+    app.include_router(async_reservations.router)
+
+    async def override_get_async_db():
+        yield async_db
+
+    async def override_get_lazy_async_db(request: Request):
+        lazy = AsyncLazySession(async_session_factory, request)
+        try:
+            yield lazy
+        finally:
+            await lazy.close()
+
+    app.dependency_overrides[get_async_db] = override_get_async_db
+    app.dependency_overrides[get_lazy_async_db] = override_get_lazy_async_db
+    async with httpx.AsyncClient(app=app, base_url="http://test") as client:
+        yield client
+
+
+@pytest.fixture
+def showtime_with_seats(db_session):
+    user = User(
+        email="user@example.com",
+        username="user",
+        hashed_password=get_password_hash("password123"),
+        role=UserRole.USER,
+    )
+    movie = Movie(title="Test Movie", genre="Action", duration_minutes=120)
+    db_session.add_all([user, movie])
+    db_session.commit()
+
+    showtime = Showtime(
+        movie_id=movie.id,
+        start_time=datetime.utcnow() + timedelta(days=1),
+        hall_number=1,
+        price=Decimal("15.50"),
+        total_seats=3,
+    )
+    db_session.add(showtime)
+    db_session.commit()
+
+    seats = [
+        Seat(showtime_id=showtime.id, row="A", number=n, is_reserved=False)
+        for n in range(1, 4)
+    ]
+    db_session.add_all(seats)
+    db_session.commit()
+
+    return user, showtime, seats
+
+
+class TestAsyncAPI:
+    """Тесты для асинхронного стека базы данных"""
+
+    def test_async_database_url(self):
+        """Тест преобразования URL базы данных для aiosqlite"""
+        assert (
+            get_async_database_url("sqlite:///./movie_reservation.db")
+            == "sqlite+aiosqlite:///./movie_reservation.db"
+        )
+        assert get_async_database_url("postgresql+asyncpg://db") == (
+            "postgresql+asyncpg://db"
+        )
+
+    @pytest.mark.asyncio
+    async def test_reserve_seats_async_service(self, async_db, showtime_with_seats):
+        """Тест бронирования через асинхронный сервис"""
+        user, showtime, seats = showtime_with_seats
+
+        reservations = await AsyncReservationService.reserve_seats(
+            async_db, user.id, showtime.id, [seats[0].id, seats[1].id]
+        )
+
+        assert len(reservations) == 2
+        assert {r.seat_id for r in reservations} == {seats[0].id, seats[1].id}
+
+    @pytest.mark.asyncio
+    async def test_async_reservation_flow(self, async_client, showtime_with_seats):
+        """Тест бронирования и отмены через асинхронные маршруты"""
+        user, showtime, seats = showtime_with_seats
+        headers = {
+            "Authorization": f"Bearer {create_access_token(data={'sub': user.username})}"
+        }
+
+        response = await async_client.post(
+            "/reservations/",
+            json={"showtime_id": showtime.id, "seat_ids": [seats[0].id]},
+            headers=headers,
+        )
+        assert response.status_code == status.HTTP_201_CREATED
+        reservation_id = response.json()[0]["id"]
+
+        response = await async_client.get(f"/showtimes/{showtime.id}/available-seats")
+        assert len(response.json()) == 2
+
+        response = await async_client.get("/reservations/my", headers=headers)
+        assert response.status_code == status.HTTP_200_OK
+        assert response.json()[0]["movie_title"] == "Test Movie"
+
+        response = await async_client.delete(
+            f"/reservations/{reservation_id}", headers=headers
+        )
+        assert response.status_code == status.HTTP_204_NO_CONTENT
+
+        response = await async_client.get(f"/showtimes/{showtime.id}/seats")
+        assert all(not seat["is_reserved"] for seat in response.json())
+
+    @pytest.mark.asyncio
+    async def test_async_movies(self, async_client, showtime_with_seats):
+        """Тест чтения фильмов через асинхронные маршруты"""
+        response = await async_client.get("/movies/")
+        assert response.status_code == status.HTTP_200_OK
+        movie_id = response.json()[0]["id"]
+
+        response = await async_client.get(f"/movies/{movie_id}")
+        assert response.json()["title"] == "Test Movie"
+
+        response = await async_client.get("/movies/999")
+        assert response.status_code == status.HTTP_404_NOT_FOUND
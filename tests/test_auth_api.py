@@ -1,7 +1,10 @@
 import pytest
+from datetime import datetime, timedelta
 from fastapi import status
 from app.models.user import User, UserRole
-from app.utils import get_password_hash
+from app.models.refresh_token import RefreshToken
+from app.services.auth_service import AuthService
+from app.utils import get_password_hash, create_access_token
 
 
 class TestAuthAPI:
@@ -107,3 +110,173 @@ class TestAuthAPI:
         response = client.post("/auth/signup", json=invalid_data)
 
         assert response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
+
+    def _login(self, client, test_user_data, db_session):
+        user = User(
+            email=test_user_data["email"],
+            username=test_user_data["username"],
+            hashed_password=get_password_hash(test_user_data["password"]),
+        )
+        db_session.add(user)
+        db_session.commit()
+
+        response = client.post(
+            "/auth/login",
+            json={
+                "username": test_user_data["username"],
+                "password": test_user_data["password"],
+            },
+        )
+        assert response.status_code == status.HTTP_200_OK
+        return response.json()
+
+    def test_login_returns_refresh_token(self, client, test_user_data, db_session):
+        """Тест выдачи refresh-токена при входе"""
+        data = self._login(client, test_user_data, db_session)
+
+        assert data["refresh_token"]
+        stored = db_session.query(RefreshToken).one()
+        assert stored.token_hash != data["refresh_token"]
+        assert stored.revoked_at is None
+
+    def test_refresh_rotates_token(self, client, test_user_data, db_session):
+        """Тест ротации refresh-токена"""
+        tokens = self._login(client, test_user_data, db_session)
+
+        response = client.post(
+            "/auth/refresh", json={"refresh_token": tokens["refresh_token"]}
+        )
+
+        assert response.status_code == status.HTTP_200_OK
+        data = response.json()
+        assert data["access_token"]
+        assert data["refresh_token"] != tokens["refresh_token"]
+        assert db_session.query(RefreshToken).count() == 2
+
+        response = client.get(
+            "/reservations/my",
+            headers={"Authorization": f"Bearer {data['access_token']}"},
+        )
+        assert response.status_code == status.HTTP_200_OK
+
+    def test_refresh_reuse_revokes_all_tokens(self, client, test_user_data, db_session):
+        """Тест повторного использования refresh-токена"""
+        tokens = self._login(client, test_user_data, db_session)
+        rotated = client.post(
+            "/auth/refresh", json={"refresh_token": tokens["refresh_token"]}
+        ).json()
+
+        response = client.post(
+            "/auth/refresh", json={"refresh_token": tokens["refresh_token"]}
+        )
+        assert response.status_code == status.HTTP_401_UNAUTHORIZED
+
+        response = client.post(
+            "/auth/refresh", json={"refresh_token": rotated["refresh_token"]}
+        )
+        assert response.status_code == status.HTTP_401_UNAUTHORIZED
+
+    def test_refresh_expired_token(self, client, test_user_data, db_session):
+        """Тест обновления по истёкшему refresh-токену"""
+        tokens = self._login(client, test_user_data, db_session)
+        stored = db_session.query(RefreshToken).one()
+        stored.expires_at = datetime.utcnow() - timedelta(minutes=1)
+        db_session.commit()
+
+        response = client.post(
+            "/auth/refresh", json={"refresh_token": tokens["refresh_token"]}
+        )
+
+        assert response.status_code == status.HTTP_401_UNAUTHORIZED
+        assert "expired" in response.json()["detail"]
+
+    def test_prune_expired_refresh_tokens(self, client, test_user_data, db_session):
+        """Тест удаления истёкших refresh-токенов"""
+        tokens = self._login(client, test_user_data, db_session)
+        client.post("/auth/refresh", json={"refresh_token": tokens["refresh_token"]})
+        rotated = db_session.query(RefreshToken).filter(
+            RefreshToken.revoked_at.isnot(None)
+        )
+        rotated.update({RefreshToken.expires_at: datetime.utcnow()})
+        db_session.commit()
+
+        assert AuthService.prune_refresh_tokens(db_session) == 1
+        stored = db_session.query(RefreshToken).one()
+        assert stored.revoked_at is None
+
+    def test_refresh_invalid_token(self, client):
+        """Тест обновления по неизвестному refresh-токену"""
+        response = client.post("/auth/refresh", json={"refresh_token": "unknown"})
+
+        assert response.status_code == status.HTTP_401_UNAUTHORIZED
+        assert "Invalid refresh token" in response.json()["detail"]
+
+    def test_logout_revokes_tokens(self, client, test_user_data, db_session):
+        """Тест выхода из системы"""
+        tokens = self._login(client, test_user_data, db_session)
+        headers = {"Authorization": f"Bearer {tokens['access_token']}"}
+
+        response = client.post(
+            "/auth/logout",
+            json={"refresh_token": tokens["refresh_token"]},
+            headers=headers,
+        )
+        assert response.status_code == status.HTTP_204_NO_CONTENT
+
+        response = client.get("/reservations/my", headers=headers)
+        assert response.status_code == status.HTTP_401_UNAUTHORIZED
+        assert "Token has been revoked" in response.json()["detail"]
+
+        response = client.post(
+            "/auth/refresh", json={"refresh_token": tokens["refresh_token"]}
+        )
+        assert response.status_code == status.HTTP_401_UNAUTHORIZED
+
+    def test_admin_revokes_user_sessions(self, client, test_user_data, db_session):
+        """Тест принудительного отзыва сессий пользователя"""
+        tokens = self._login(client, test_user_data, db_session)
+        user = db_session.query(User).filter_by(username="testuser").one()
+
+        admin = User(
+            email="admin@example.com",
+            username="admin",
+            hashed_password=get_password_hash("password123"),
+            role=UserRole.ADMIN,
+        )
+        db_session.add(admin)
+        db_session.commit()
+        admin_token = create_access_token(data={"sub": admin.username})
+
+        response = client.post(
+            f"/admin/users/{user.id}/revoke-tokens",
+            headers={"Authorization": f"Bearer {admin_token}"},
+        )
+        assert response.status_code == status.HTTP_200_OK
+
+        response = client.get(
+            "/reservations/my",
+            headers={"Authorization": f"Bearer {tokens['access_token']}"},
+        )
+        assert response.status_code == status.HTTP_401_UNAUTHORIZED
+
+        response = client.post(
+            "/auth/refresh", json={"refresh_token": tokens["refresh_token"]}
+        )
+        assert response.status_code == status.HTTP_401_UNAUTHORIZED
+
+    def test_revoke_user_sessions_is_one_transaction(
+        self, client, test_user_data, db_session, revocation_store, monkeypatch
+    ):
+        """Тест отзыва сессий одной транзакцией"""
+        self._login(client, test_user_data, db_session)
+        user = db_session.query(User).filter_by(username="testuser").one()
+
+        def fail(*args, **kwargs):
+            raise RuntimeError("boom")
+
+        monkeypatch.setattr(revocation_store, "revoke", fail)
+        with pytest.raises(RuntimeError):
+            AuthService.revoke_user_sessions(db_session, user)
+        db_session.rollback()
+
+        assert db_session.query(RefreshToken).one().revoked_at is None
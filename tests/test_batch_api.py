@@ -0,0 +1,145 @@
+from datetime import datetime, timedelta
+from fastapi import status
+from sqlalchemy import create_engine, text
+from sqlalchemy.orm import Session, sessionmaker
+from app.database import begin_snapshot, configure_engine, get_read_db
+from app.main import app
+from app.revocation import RevocationStore
+from app.services.reservation_service import ReservationService
+from app.utils import create_access_token
+
+
+class TestBatchAPI:
+    """Тесты для пакетного выполнения GET-запросов"""
+
+    def test_batch_returns_each_result(
+        self, client, db_session, assert_max_queries, create_user, create_showtime
+    ):
+        """Тест выполнения нескольких запросов в одном вызове"""
+        user = create_user()
+        showtime, seats = create_showtime(price="15.50", seats=2)
+        ReservationService.reserve_seats(
+            db_session, user.id, showtime.id, [seats[0].id]
+        )
+        token = create_access_token(data={"sub": user.username})
+
+        with assert_max_queries(11):
+            response = client.post(
+                "/batch/",
+                json={
+                    "requests": [
+                        {"path": "/movies"},
+                        {"path": f"/movies/{showtime.movie_id}"},
+                        {"path": f"/showtimes/{showtime.id}/available-seats"},
+                        {"path": f"/showtimes/{showtime.id}/seat-map"},
+                        {"path": "/reservations/my?limit=1"},
+                    ]
+                },
+                headers={"Authorization": f"Bearer {token}"},
+            )
+
+        assert response.status_code == status.HTTP_200_OK
+        results = response.json()["responses"]
+        assert [r["status"] for r in results] == [200] * 5
+        assert results[0]["body"][0]["title"] == "Test Movie"
+        assert results[1]["body"]["id"] == showtime.movie_id
+        assert [s["number"] for s in results[2]["body"]] == [2]
+        assert results[3]["body"]["seats"] == "A:x."
+        assert results[4]["body"][0]["seat_row"] == "A"
+        assert results[4]["headers"] == {}
+
+    def test_sub_request_errors_are_isolated(self, client, db_session):
+        """Тест независимых ошибок внутри пакета"""
+        response = client.post(
+            "/batch/",
+            json={
+                "requests": [
+                    {"path": "/movies/999"},
+                    {"path": "/reservations/my"},
+                    {"path": "/showtimes/1/seat-map/delta?since=-1"},
+                    {"path": "/admin/users"},
+                    {"path": "/movies/"},
+                ]
+            },
+        )
+
+        results = response.json()["responses"]
+        assert [r["status"] for r in results] == [404, 401, 422, 404, 200]
+        assert results[0]["body"] == {"detail": "Movie not found"}
+        assert results[4]["body"] == []
+
+    def test_batch_size_is_limited(self, client, db_session):
+        """Тест ограничения размера пакета"""
+        too_many = {"requests": [{"path": "/movies/"}] * 21}
+
+        assert client.post("/batch/", json=too_many).status_code == 422
+        assert client.post("/batch/", json={"requests": []}).status_code == 422
+        assert (
+            client.post(
+                "/batch/", json={"requests": [{"method": "POST", "path": "/movies/"}]}
+            ).status_code
+            == 422
+        )
+
+    def test_begin_snapshot_pins_reads(self, tmp_path):
+        """Тест чтения одного снимка базы в пределах пакета"""
+        engine = configure_engine(create_engine(f"sqlite:///{tmp_path}/snapshot.db"))
+        with engine.begin() as conn:
+            conn.execute(text("CREATE TABLE items (id INTEGER PRIMARY KEY)"))
+        Session = sessionmaker(bind=engine)
+
+        with Session() as reader, Session() as writer:
+            begin_snapshot(reader)
+            count = text("SELECT count(*) FROM items")
+            assert reader.execute(count).scalar() == 0
+
+            writer.execute(text("INSERT INTO items DEFAULT VALUES"))
+            writer.commit()
+
+            assert reader.execute(count).scalar() == 0
+            reader.rollback()
+            assert reader.execute(count).scalar() == 1
+
+        engine.dispose()
+
+    def test_authenticated_batch_on_read_only_database(
+        self, client, db_session, monkeypatch, create_user, create_showtime
+    ):
+        """Тест аутентификации в пакете на базе только для чтения"""
+        user = create_user()
+        showtime, seats = create_showtime(seats=2)
+        ReservationService.reserve_seats(
+            db_session, user.id, showtime.id, [seats[0].id]
+        )
+        # Reloads the revocation filter on every check, the path that used to
+        # prune expired rows and commit on the batch's session.
+        store = RevocationStore(capacity=100, sync_seconds=0, reload_seconds=0)
+        store.revoke(db_session, "expired", datetime.utcnow() - timedelta(seconds=1))
+        monkeypatch.setattr("app.dependencies.revocation_store", store)
+        read_engine = create_engine(
+            "sqlite:///file:./test_movie_reservation.db?mode=ro&uri=true",
+            connect_args={"check_same_thread": False},
+        )
+
+        def read_only_db():
+            with Session(read_engine) as db:
+                yield db
+
+        app.dependency_overrides[get_read_db] = read_only_db
+        token = create_access_token(data={"sub": user.username})
+        try:
+            response = client.post(
+                "/batch/",
+                json={
+                    "requests": [
+                        {"path": "/reservations/my"},
+                        {"path": f"/showtimes/{showtime.id}/seat-map"},
+                    ]
+                },
+                headers={"Authorization": f"Bearer {token}"},
+            )
+        finally:
+            read_engine.dispose()
+
+        assert response.status_code == status.HTTP_200_OK
+        assert [r["status"] for r in response.json()["responses"]] == [200, 200]
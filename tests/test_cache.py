@@ -0,0 +1,204 @@
+import time
+import fakeredis
+import pytest
+from app.cache import MemoryCache, RedisCache, cache
+from app.invalidation import InvalidationEvent, invalidation_bus
+from app.models.movie import Movie
+from app.services.movie_service import MovieService
+
+
+@pytest.fixture(params=["memory", "redis"])
+def backend(request):
+    if request.param == "memory":
+        return MemoryCache(max_entries=100)
+    return RedisCache(fakeredis.FakeRedis(), prefix="test:")
+
+
+class TestCacheBackends:
+    """Тесты для бэкендов кэша"""
+
+    def test_get_set_and_get_many(self, backend):
+        """Тест чтения одиночных и пакетных значений"""
+        backend.set("a", {"value": 1})
+        backend.set("b", [1, 2])
+
+        assert backend.get("a") == {"value": 1}
+        assert backend.get("missing") is None
+        assert backend.get_many(["a", "b", "missing"]) == {
+            "a": {"value": 1},
+            "b": [1, 2],
+        }
+
+        stats = backend.stats()
+        assert stats["hits"] == 3
+        assert stats["misses"] == 2
+        assert stats["sets"] == 2
+
+    def test_invalidate_tags(self, backend):
+        """Тест инвалидации по тегам"""
+        backend.set("movies:list", [1], tags=("movies",))
+        backend.set("movies:1", 1, tags=("movies:1",))
+        backend.set("movies:2", 2, tags=("movies:2",))
+
+        assert backend.invalidate_tags("movies", "movies:1") == 2
+
+        assert backend.get_many(["movies:list", "movies:1", "movies:2"]) == {
+            "movies:2": 2
+        }
+        assert backend.invalidate_tags("movies") == 0
+        assert backend.stats()["invalidations"] == 2
+
+    def test_get_or_load(self, backend):
+        """Тест загрузки при промахе"""
+        calls = []
+
+        def loader():
+            calls.append(1)
+            return "loaded"
+
+        assert backend.get_or_load("key", loader) == "loaded"
+        assert backend.get_or_load("key", loader) == "loaded"
+        assert len(calls) == 1
+
+        assert backend.get_or_load("none", lambda: None) is None
+        assert backend.get("none") is None
+
+    def test_load_overtaken_by_invalidation_is_not_cached(self, backend):
+        """Тест отбрасывания значения, загруженного до инвалидации"""
+
+        def loader():
+            backend.invalidate_tags("seats:1")
+            return "stale"
+
+        assert backend.get_or_load("seats", loader, tags=("seats:1",)) == "stale"
+        assert backend.get("seats") is None
+        assert backend.stats()["discarded_sets"] == 1
+
+        assert backend.get_or_load("seats", lambda: "fresh", tags=("seats:1",)) == (
+            "fresh"
+        )
+        assert backend.get("seats") == "fresh"
+
+    def test_load_overtaken_by_clear_is_not_cached(self, backend):
+        """Тест отбрасывания значения, загруженного до полной очистки"""
+
+        def loader():
+            backend.clear()
+            return "stale"
+
+        backend.get_or_load("key", loader)
+
+        assert backend.get("key") is None
+
+    def test_clear(self, backend):
+        """Тест полной очистки"""
+        backend.set("a", 1, tags=("t",))
+        backend.clear()
+
+        assert backend.get("a") is None
+        assert backend.invalidate_tags("t") == 0
+
+
+class TestMemoryCache:
+    """Тесты для LRU-кэша в памяти процесса"""
+
+    def test_lru_eviction(self):
+        """Тест вытеснения давно не использованных ключей"""
+        memory = MemoryCache(max_entries=2)
+        memory.set("a", 1, tags=("t",))
+        memory.set("b", 2)
+        memory.get("a")
+        memory.set("c", 3)
+
+        assert memory.get_many(["a", "b", "c"]) == {"a": 1, "c": 3}
+        assert memory.stats()["evictions"] == 1
+        assert memory.stats()["size"] == 2
+
+        memory.set("d", 4)
+        assert memory.get("a") is None
+        assert memory._tags == {}
+
+    def test_ttl_expiry(self):
+        """Тест истечения срока жизни"""
+        memory = MemoryCache(max_entries=10, default_ttl=0.05)
+        memory.set("short", 1)
+        memory.set("long", 2, ttl=60)
+
+        time.sleep(0.06)
+
+        assert memory.get("short") is None
+        assert memory.get("long") == 2
+        assert memory.size() == 1
+
+
+class TestRedisCache:
+    """Тесты для общего кэша в Redis"""
+
+    def test_ttl_and_tag_sets_expire(self):
+        """Тест сроков жизни значений и множеств тегов"""
+        client = fakeredis.FakeRedis()
+        shared = RedisCache(client, prefix="test:", default_ttl=30)
+
+        shared.set("a", 1, tags=("t",))
+        shared.set("b", 2, ttl=120, tags=("t",))
+        shared.set("c", 3, ttl=5, tags=("t",))
+
+        assert client.ttl("test:a") == 30
+        assert client.ttl("test:tag:t") == 120
+        assert client.smembers("test:tag:t") == {b"a", b"b", b"c"}
+
+    def test_workers_share_entries(self):
+        """Тест общего кэша для нескольких воркеров"""
+        client = fakeredis.FakeRedis()
+        first = RedisCache(client, prefix="test:")
+        second = RedisCache(client, prefix="test:")
+
+        first.set("movies:list", ["x"], tags=("movies",))
+        assert second.get("movies:list") == ["x"]
+
+        second.invalidate_tags("movies")
+        assert first.get("movies:list") is None
+
+
+class TestServiceCaching:
+    """Тесты для кэширования чтений в сервисах"""
+
+    def test_list_movies_is_cached_until_change_event(
+        self, db_session, assert_max_queries
+    ):
+        """Тест кэширования списка фильмов и его инвалидации"""
+        db_session.add(Movie(title="First", genre="Drama", duration_minutes=90))
+        db_session.commit()
+
+        assert [m.title for m in MovieService.list_movies(db_session)] == ["First"]
+        with assert_max_queries(0):
+            MovieService.list_movies(db_session)
+
+        movie = Movie(title="Second", genre="Drama", duration_minutes=90)
+        db_session.add(movie)
+        db_session.flush()
+        invalidation_bus.publish(db_session, "movies", movie.id)
+        db_session.commit()
+
+        assert len(MovieService.list_movies(db_session)) == 2
+
+    def test_get_movie(self, client, db_session, assert_max_queries):
+        """Тест кэширования отдельного фильма"""
+        movie = Movie(title="Cached", genre="Drama", duration_minutes=90)
+        db_session.add(movie)
+        db_session.commit()
+
+        assert client.get(f"/movies/{movie.id}").json()["title"] == "Cached"
+        with assert_max_queries(0):
+            assert client.get(f"/movies/{movie.id}").json()["title"] == "Cached"
+        assert client.get(f"/movies/{movie.id + 1}").status_code == 404
+
+    def test_remote_event_invalidates_local_cache(self, db_session):
+        """Тест инвалидации по событию другого воркера"""
+        cache.set("showtimes:5:seat-map", {"version": 1}, tags=("seats:5",))
+
+        invalidation_bus.dispatch(
+            InvalidationEvent("seats", "5", None, "other-worker", time.time())
+        )
+
+        assert cache.get("showtimes:5:seat-map") is None
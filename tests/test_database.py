@@ -0,0 +1,168 @@
+import pytest
+from fastapi import HTTPException, status
+from sqlalchemy import create_engine, text
+from sqlalchemy.exc import OperationalError
+from sqlalchemy.orm import sessionmaker
+from starlette.requests import Request
+from app import database
+from app.config import settings
+from app.database import configure_engine, get_pool_options, get_read_database_url
+from app.pool_metrics import pool_metrics
+from app.models.user import User, UserRole
+from app.utils import create_access_token
+
+
+class TestSQLiteProfile:
+    """Тесты для профиля производительности SQLite"""
+
+    def test_pragmas_applied_on_connect(self, tmp_path):
+        """Тест применения PRAGMA при каждом новом подключении"""
+        engine = configure_engine(create_engine(f"sqlite:///{tmp_path}/profile.db"))
+
+        with engine.connect() as conn:
+            assert conn.execute(text("PRAGMA journal_mode")).scalar() == "wal"
+            assert conn.execute(text("PRAGMA synchronous")).scalar() == 1
+            assert conn.execute(text("PRAGMA busy_timeout")).scalar() == (
+                settings.SQLITE_BUSY_TIMEOUT_MS
+            )
+            assert conn.execute(text("PRAGMA cache_size")).scalar() == (
+                settings.SQLITE_CACHE_SIZE
+            )
+            assert conn.execute(text("PRAGMA temp_store")).scalar() == 2
+        engine.dispose()
+
+    def test_profile_can_be_disabled(self, tmp_path, monkeypatch):
+        """Тест отключения профиля через настройки"""
+        monkeypatch.setattr(settings, "SQLITE_PRAGMAS_ENABLED", False)
+        engine = configure_engine(create_engine(f"sqlite:///{tmp_path}/plain.db"))
+
+        with engine.connect() as conn:
+            assert conn.execute(text("PRAGMA journal_mode")).scalar() == "delete"
+        engine.dispose()
+
+
+def make_request(path="/movies/"):
+    return Request({"type": "http", "method": "GET", "path": path, "headers": []})
+
+
+class TestConnectionPool:
+    """Тесты для настроек и метрик пула соединений"""
+
+    def setup_method(self):
+        pool_metrics.reset()
+
+    def test_pool_options_for_file_database(self):
+        """Тест параметров пула для файловой базы данных"""
+        options = get_pool_options("sqlite:///./movie_reservation.db")
+
+        assert options["pool_size"] == settings.DB_POOL_SIZE
+        assert options["max_overflow"] == settings.DB_MAX_OVERFLOW
+        assert options["pool_timeout"] == settings.DB_POOL_TIMEOUT
+        assert options["pool_pre_ping"] == settings.DB_POOL_PRE_PING
+
+    def test_pool_options_for_memory_database(self):
+        """Тест параметров пула для базы данных в памяти"""
+        options = get_pool_options("sqlite://")
+
+        assert "pool_size" not in options
+        assert "pool_recycle" in options
+
+    def test_get_db_records_wait_time(self, tmp_path, monkeypatch):
+        """Тест учёта времени ожидания соединения"""
+        engine = create_engine(f"sqlite:///{tmp_path}/pool.db")
+        monkeypatch.setattr(database, "SessionLocal", sessionmaker(bind=engine))
+
+        dependency = database.get_db(make_request())
+        db = next(dependency)
+        assert db.in_transaction()
+        dependency.close()
+
+        stats = pool_metrics.route_stats()["GET /movies/"]
+        assert stats["checkouts"] == 1
+        assert stats["timeouts"] == 0
+        engine.dispose()
+
+    def test_get_db_pool_timeout(self, tmp_path, monkeypatch):
+        """Тест ответа 503 при исчерпании пула"""
+        engine = create_engine(
+            f"sqlite:///{tmp_path}/pool.db",
+            pool_size=1,
+            max_overflow=0,
+            pool_timeout=0.01,
+        )
+        monkeypatch.setattr(database, "SessionLocal", sessionmaker(bind=engine))
+        held = engine.connect()
+
+        with pytest.raises(HTTPException) as exc_info:
+            next(database.get_db(make_request()))
+
+        assert exc_info.value.status_code == status.HTTP_503_SERVICE_UNAVAILABLE
+        assert exc_info.value.headers["Retry-After"] == "1"
+        assert pool_metrics.route_stats()["GET /movies/"]["timeouts"] == 1
+        held.close()
+        engine.dispose()
+
+    def test_pool_status(self):
+        """Тест снимка состояния пула"""
+        engine = create_engine("sqlite:///:memory:", pool_size=3)
+        snapshot = pool_metrics.pool_status(engine.pool)
+
+        assert snapshot["class"] == "SingletonThreadPool"
+        engine.dispose()
+
+    def test_pool_metrics_endpoint(self, client, db_session):
+        """Тест эндпоинта метрик пула для администратора"""
+        admin = User(
+            email="admin@example.com",
+            username="admin",
+            hashed_password="hashed_password",
+            role=UserRole.ADMIN,
+        )
+        db_session.add(admin)
+        db_session.commit()
+        pool_metrics.record_wait("GET /movies/", 0.002)
+        token = create_access_token(data={"sub": admin.username})
+
+        response = client.get(
+            "/admin/metrics/pool", headers={"Authorization": f"Bearer {token}"}
+        )
+
+        assert response.status_code == status.HTTP_200_OK
+        data = response.json()
+        assert "checkedout" in data["pools"]["primary"]
+        assert data["routes"]["GET /movies/"]["max_wait_ms"] == 2.0
+
+
+class TestReadRouting:
+    """Тесты для маршрутизации чтения на read-only подключение"""
+
+    def test_read_database_url_for_sqlite_file(self):
+        """Тест построения read-only URI для файла SQLite"""
+        assert (
+            get_read_database_url("sqlite:///./movie_reservation.db")
+            == "sqlite:///file:./movie_reservation.db?mode=ro&uri=true"
+        )
+
+    def test_no_read_database_url_for_memory_or_server(self):
+        """Тест отсутствия отдельного read-only движка"""
+        assert get_read_database_url("sqlite://") is None
+        assert get_read_database_url("postgresql://user:pw@host/db") is None
+
+    def test_read_engine_rejects_writes(self, tmp_path):
+        """Тест запрета записи через read-only движок"""
+        url = f"sqlite:///{tmp_path}/routing.db"
+        writer = configure_engine(create_engine(url))
+        with writer.begin() as conn:
+            conn.execute(text("CREATE TABLE items (id INTEGER PRIMARY KEY)"))
+            conn.execute(text("INSERT INTO items DEFAULT VALUES"))
+
+        reader = configure_engine(
+            create_engine(get_read_database_url(url)), readonly=True
+        )
+        with reader.connect() as conn:
+            assert conn.execute(text("SELECT count(*) FROM items")).scalar() == 1
+            with pytest.raises(OperationalError):
+                conn.execute(text("INSERT INTO items DEFAULT VALUES"))
+
+        reader.dispose()
+        writer.dispose()
@@ -1,7 +1,10 @@
 import pytest
 from fastapi import HTTPException, status
 from app.models.user import User, UserRole
+from app.database import get_db
 from app.dependencies import get_current_user, require_admin
+from app.main import app
+from app.read_models import CurrentUserRecord
 from app.utils import create_access_token
 
 
@@ -28,6 +31,7 @@ class TestDependencies:
 
         current_user = get_current_user(credentials, db_session)
 
+        assert isinstance(current_user, CurrentUserRecord)
         assert current_user.id == user.id
         assert current_user.username == user.username
         assert current_user.email == user.email
@@ -123,3 +127,27 @@ class TestDependencies:
 
         assert exc_info.value.status_code == status.HTTP_403_FORBIDDEN
         assert "Admin access required" in exc_info.value.detail
+
+    def test_admin_get_routes_authenticate_on_read_session(self, client, db_session):
+        """Тест аутентификации GET-запросов администратора без пула записи"""
+        admin = User(
+            email="admin@example.com",
+            username="admin",
+            hashed_password="hashed_password",
+            role=UserRole.ADMIN,
+        )
+        db_session.add(admin)
+        db_session.commit()
+
+        def write_session_not_allowed():
+            raise AssertionError("write session checked out by a GET route")
+
+        app.dependency_overrides[get_db] = write_session_not_allowed
+        headers = {
+            "Authorization": f"Bearer {create_access_token(data={'sub': 'admin'})}"
+        }
+
+        for url in ("/admin/report/reservations", "/admin/metrics/cache"):
+            assert client.get(url, headers=headers).status_code == 200
+        for url in ("/admin/jobs/999", "/admin/jobs/999/result"):
+            assert client.get(url, headers=headers).status_code == 404
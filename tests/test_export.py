@@ -0,0 +1,123 @@
+import csv
+import io
+from datetime import datetime
+from decimal import Decimal
+import pyarrow.parquet as pq
+import pytest
+from app.config import settings
+from app.schemas.export import ExportFormat
+from app.services.export_service import ExportService
+from app.services.reservation_service import ReservationService
+from app.utils import create_access_token
+
+URL = "/admin/export/reservations"
+
+
+@pytest.fixture
+def reservations(db_session, create_user, create_movie, create_showtime):
+    """Три места на первом сеансе (одно отменено) и одно на втором."""
+    user = create_user()
+    movie = create_movie()
+    first, first_seats = create_showtime(
+        movie, datetime(2030, 1, 7, 18, 30), 1, "12.50", seats=3, rows="B"
+    )
+    second, second_seats = create_showtime(
+        movie, datetime(2030, 1, 8, 18, 30), 2, "12.50", seats=3, rows="B"
+    )
+    booked = ReservationService.reserve_seats(
+        db_session, user.id, first.id, [s.id for s in first_seats]
+    )
+    ReservationService.cancel_reservation(db_session, booked[0].id, user.id)
+    ReservationService.reserve_seats(
+        db_session, user.id, second.id, [second_seats[0].id]
+    )
+    return movie
+
+
+class TestExportAPI:
+    """Тесты для потоковой выгрузки бронирований"""
+
+    def test_csv_export(self, client, reservations, admin_headers):
+        """Тест выгрузки фактов бронирований в CSV"""
+        movie = reservations
+
+        response = client.get(URL, headers=admin_headers)
+
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("text/csv")
+        assert 'filename="reservations.csv"' in response.headers["content-disposition"]
+        rows = list(csv.DictReader(io.StringIO(response.text)))
+        assert len(rows) == 4
+        assert sorted(r["status"] for r in rows) == [
+            "cancelled",
+            "confirmed",
+            "confirmed",
+            "confirmed",
+        ]
+        row = next(r for r in rows if r["seat_number"] == "2")
+        assert row["seat_row"] == "B"
+        assert row["movie_title"] == "Test Movie"
+        assert row["movie_id"] == str(movie.id)
+        assert row["price"] == "12.50"
+        assert row["start_time"].startswith("2030-01-07 18:30:00")
+        assert row["reserved_at"]
+
+    def test_csv_is_streamed_in_chunks(self, db_session, monkeypatch, reservations):
+        """Тест выдачи CSV частями по размеру пакета курсора"""
+        monkeypatch.setattr(settings, "EXPORT_CHUNK_ROWS", 1)
+
+        chunks = list(ExportService.stream_reservations(db_session, ExportFormat.CSV))
+
+        assert len(chunks) == 4
+        assert chunks[0].startswith(b"reservation_id,status,")
+        assert all(chunk.count(b"\n") == 1 for chunk in chunks[1:])
+
+    def test_nothing_is_queried_before_first_chunk(
+        self, db_session, assert_max_queries
+    ):
+        """Тест ленивого выполнения запроса выгрузки"""
+        with assert_max_queries(0):
+            chunks = ExportService.stream_reservations(db_session, ExportFormat.CSV)
+
+        assert next(chunks).startswith(b"reservation_id,")
+        chunks.close()
+
+    def test_date_range_filter(self, client, reservations, admin_headers):
+        """Тест фильтрации выгрузки по датам сеансов"""
+
+        response = client.get(
+            URL, params={"start_date": "2030-01-08"}, headers=admin_headers
+        )
+        rows = list(csv.DictReader(io.StringIO(response.text)))
+        assert [r["hall_number"] for r in rows] == ["2"]
+
+        response = client.get(
+            URL, params={"end_date": "2030-01-01"}, headers=admin_headers
+        )
+        assert response.text.strip() == ",".join(
+            next(csv.reader(io.StringIO(response.text)))
+        )
+
+    def test_parquet_export(self, client, monkeypatch, reservations, admin_headers):
+        """Тест выгрузки в Parquet с группами строк по размеру пакета"""
+        monkeypatch.setattr(settings, "EXPORT_CHUNK_ROWS", 3)
+
+        response = client.get(URL, params={"format": "parquet"}, headers=admin_headers)
+
+        assert response.status_code == 200
+        parquet = pq.ParquetFile(io.BytesIO(response.content))
+        assert parquet.metadata.num_rows == 4
+        assert parquet.metadata.num_row_groups == 2
+        table = parquet.read()
+        assert str(table.schema.field("start_time").type) == "timestamp[us]"
+        assert table.column("price").to_pylist() == [Decimal("12.50")] * 4
+        assert table.column("start_time").to_pylist()[0] == datetime(2030, 1, 7, 18, 30)
+
+    def test_export_requires_admin(self, client, reservations):
+        """Тест доступа к выгрузке только для администраторов"""
+        token = create_access_token(data={"sub": "user"})
+
+        response = client.get(URL, headers={"Authorization": f"Bearer {token}"})
+
+        assert response.status_code == 403
+        assert client.get(URL, params={"format": "xlsx"}).status_code in (403, 422)
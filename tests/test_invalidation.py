@@ -0,0 +1,156 @@
+import pytest
+from sqlalchemy import delete
+from app.invalidation import RESET_TOPIC, InvalidationBus, invalidation_bus
+from app.models.change_log import ChangeLog
+from app.models.movie import Movie
+from tests.conftest import engine
+
+
+@pytest.fixture
+def other_worker(db_session):
+    bus = InvalidationBus(poll_interval=60, retention=300)
+    bus.start(engine)
+    yield bus
+    bus.stop()
+
+
+class TestInvalidationBus:
+    """Тесты для шины инвалидации между воркерами"""
+
+    def test_local_handlers_run_after_commit(self, db_session):
+        """Тест локальной доставки только после коммита"""
+        received = []
+        invalidation_bus.subscribe("movies", received.append)
+        try:
+            invalidation_bus.publish(db_session, "movies", 1)
+            assert received == []
+            db_session.commit()
+            assert [(e.topic, e.key) for e in received] == [("movies", "1")]
+
+            invalidation_bus.publish(db_session, "movies", 2)
+            db_session.rollback()
+            db_session.commit()
+            assert len(received) == 1
+        finally:
+            invalidation_bus.unsubscribe("movies", received.append)
+
+        assert db_session.query(ChangeLog).count() == 1
+
+    def test_other_worker_receives_committed_events(self, db_session, other_worker):
+        """Тест доставки события другому воркеру"""
+        received = []
+        other_worker.subscribe("seats", received.append)
+
+        invalidation_bus.publish(
+            db_session, "seats", 5, {"version": 2, "seats": [["A", 1, True]]}
+        )
+        assert other_worker.poll() == 0
+        db_session.commit()
+
+        assert other_worker.poll() == 1
+        assert received[0].key == "5"
+        assert received[0].payload == {"version": 2, "seats": [["A", 1, True]]}
+        assert received[0].origin == invalidation_bus.origin
+
+        stats = other_worker.stats()
+        assert stats["delivered"] == 1
+        assert stats["dropped"] == 0
+        assert stats["latency_ms"]["max"] is not None
+
+    def test_own_events_are_not_redelivered(self, db_session, other_worker):
+        """Тест пропуска собственных событий при чтении журнала"""
+        received = []
+        other_worker.subscribe("movies", received.append)
+
+        other_worker.publish(db_session, "movies", 1)
+        db_session.commit()
+        received.clear()
+
+        assert other_worker.poll() == 0
+        assert received == []
+        assert other_worker.stats()["last_id"] > 0
+
+    def test_pruned_events_are_counted_as_dropped(self, db_session, other_worker):
+        """Тест учёта потерянных событий и сброса кэшей"""
+        received = []
+        other_worker.subscribe("movies", received.append)
+
+        for movie_id in range(1, 4):
+            invalidation_bus.publish(db_session, "movies", movie_id)
+        db_session.commit()
+        db_session.execute(delete(ChangeLog).where(ChangeLog.key.in_(["1", "2"])))
+        db_session.commit()
+
+        other_worker.poll()
+
+        assert other_worker.dropped == 2
+        assert [(e.topic, e.key) for e in received] == [
+            (RESET_TOPIC, None),
+            ("movies", "3"),
+        ]
+
+    def test_publish_prunes_old_events(self, db_session):
+        """Тест очистки журнала без фонового потока чтения"""
+        bus = InvalidationBus(poll_interval=60, retention=300)
+        db_session.add(
+            ChangeLog(topic="movies", key="old", origin="gone", created_at=0.0)
+        )
+        db_session.commit()
+
+        bus.publish(db_session, "movies", 1)
+        bus.publish(db_session, "movies", 2)
+        db_session.commit()
+
+        assert [row.key for row in db_session.query(ChangeLog)] == ["1", "2"]
+
+    def test_handler_errors_are_isolated(self, db_session):
+        """Тест изоляции ошибок обработчиков"""
+        received = []
+
+        def broken(event):
+            raise RuntimeError("boom")
+
+        invalidation_bus.subscribe("movies", broken)
+        invalidation_bus.subscribe("movies", received.append)
+        errors = invalidation_bus.handler_errors
+        try:
+            invalidation_bus.publish(db_session, "movies", 1)
+            db_session.commit()
+        finally:
+            invalidation_bus.unsubscribe("movies", broken)
+            invalidation_bus.unsubscribe("movies", received.append)
+
+        assert invalidation_bus.handler_errors == errors + 1
+        assert len(received) == 1
+
+    def test_movie_routes_publish(self, client, db_session, other_worker):
+        """Тест публикации изменений фильмов из маршрутов"""
+        from app.models.user import User, UserRole
+        from app.utils import create_access_token
+
+        admin = User(
+            email="admin@example.com",
+            username="admin",
+            hashed_password="hashed_password",
+            role=UserRole.ADMIN,
+        )
+        db_session.add(admin)
+        db_session.commit()
+        headers = {
+            "Authorization": f"Bearer {create_access_token(data={'sub': 'admin'})}"
+        }
+
+        received = []
+        other_worker.subscribe("movies", received.append)
+
+        response = client.post(
+            "/movies/",
+            json={"title": "New", "genre": "Drama", "duration_minutes": 90},
+            headers=headers,
+        )
+        movie_id = response.json()["id"]
+        client.delete(f"/movies/{movie_id}", headers=headers)
+        other_worker.poll()
+
+        assert [e.key for e in received] == [str(movie_id), str(movie_id)]
+        assert db_session.query(Movie).count() == 0
@@ -0,0 +1,104 @@
+import pytest
+from sqlalchemy import create_engine, inspect
+from app.database import Base
+from app.migrations import (
+    LATEST_VERSION,
+    SchemaOutdatedError,
+    check_schema,
+    get_current_version,
+    migrate,
+)
+
+
+@pytest.fixture
+def empty_engine(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path}/migrations.db")
+    yield engine
+    engine.dispose()
+
+
+class TestMigrations:
+    """Тесты для версионированных миграций схемы"""
+
+    def test_migrate_fresh_database(self, empty_engine):
+        """Тест применения всех миграций к пустой базе"""
+        applied = migrate(empty_engine)
+
+        assert applied == list(range(1, LATEST_VERSION + 1))
+        with empty_engine.connect() as conn:
+            assert get_current_version(conn) == LATEST_VERSION
+
+    def test_migrate_is_idempotent(self, empty_engine):
+        """Тест повторного запуска миграций"""
+        migrate(empty_engine)
+
+        assert migrate(empty_engine) == []
+
+    def test_hot_path_indexes_created(self, empty_engine):
+        """Тест создания составных индексов"""
+        migrate(empty_engine)
+        inspector = inspect(empty_engine)
+
+        seat_indexes = {
+            i["name"]: i["column_names"] for i in inspector.get_indexes("seats")
+        }
+        reservation_indexes = {
+            i["name"]: i["column_names"] for i in inspector.get_indexes("reservations")
+        }
+        assert seat_indexes["ix_seats_showtime_id_is_reserved"] == [
+            "showtime_id",
+            "is_reserved",
+        ]
+        assert reservation_indexes["ix_reservations_user_id_status_created_at"] == [
+            "user_id",
+            "status",
+            "created_at",
+        ]
+        assert "ix_reservations_user_id_status" not in reservation_indexes
+        assert reservation_indexes["ix_reservations_showtime_id_status"] == [
+            "showtime_id",
+            "status",
+        ]
+
+    def test_migrations_match_models(self, empty_engine, tmp_path):
+        """Тест соответствия схемы после миграций моделям"""
+        migrate(empty_engine)
+        models_engine = create_engine(f"sqlite:///{tmp_path}/models.db")
+        Base.metadata.create_all(bind=models_engine)
+
+        migrated = inspect(empty_engine)
+        expected = inspect(models_engine)
+        for table in expected.get_table_names():
+            assert {c["name"] for c in migrated.get_columns(table)} == {
+                c["name"] for c in expected.get_columns(table)
+            }, table
+            assert {i["name"] for i in migrated.get_indexes(table)} == {
+                i["name"] for i in expected.get_indexes(table)
+            }, table
+        models_engine.dispose()
+
+    def test_migrate_adopts_create_all_database(self, empty_engine):
+        """Тест перевода базы, созданной через create_all, на миграции"""
+        legacy_tables = ["users", "movies", "showtimes", "seats", "reservations"]
+        Base.metadata.create_all(
+            bind=empty_engine,
+            tables=[Base.metadata.tables[name] for name in legacy_tables],
+        )
+
+        migrate(empty_engine)
+
+        with empty_engine.connect() as conn:
+            assert get_current_version(conn) == LATEST_VERSION
+
+    def test_check_schema_fails_when_behind(self, empty_engine):
+        """Тест отказа запуска при устаревшей схеме"""
+        with pytest.raises(SchemaOutdatedError):
+            check_schema(empty_engine)
+
+        migrate(empty_engine, target=1)
+        with pytest.raises(SchemaOutdatedError) as exc_info:
+            check_schema(empty_engine)
+        assert "version 1" in str(exc_info.value)
+
+        migrate(empty_engine)
+        check_schema(empty_engine)
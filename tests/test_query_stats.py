@@ -0,0 +1,89 @@
+import logging
+from datetime import datetime, timedelta
+import pytest
+from fastapi import status
+from app.config import settings
+from app.query_stats import QueryStats, statement_shape
+
+
+@pytest.fixture
+def create_schedule(create_movie, create_showtime):
+    """Сеансы одного фильма сегодня, ежечасно с 10:00"""
+
+    def _create_schedule(showtimes=6):
+        movie = create_movie()
+        start = datetime.combine(datetime.utcnow().date(), datetime.min.time())
+        for i in range(showtimes):
+            create_showtime(movie, start + timedelta(hours=10 + i))
+        return movie
+
+    return _create_schedule
+
+
+class TestQueryStats:
+    """Тесты для счётчика SQL-запросов и детектора N+1"""
+
+    def test_statement_shape_collapses_in_lists(self):
+        """Тест нормализации IN-списков и пробелов"""
+        assert statement_shape("SELECT * FROM seats\n WHERE id IN (?, ?, ?)") == (
+            "SELECT * FROM seats WHERE id IN (?...)"
+        )
+        assert statement_shape("SELECT 1 WHERE id IN (?, ?)") == statement_shape(
+            "SELECT 1 WHERE id IN (?, ?, ?, ?)"
+        )
+
+    def test_suspected_n_plus_one(self):
+        """Тест выявления повторяющихся запросов"""
+        stats = QueryStats()
+        for _ in range(5):
+            stats.record("SELECT * FROM seats WHERE showtime_id = ?", 0.001)
+        stats.record("SELECT * FROM movies", 0.001)
+
+        assert stats.count == 6
+        assert stats.suspected_n_plus_one(5) == [
+            ("SELECT * FROM seats WHERE showtime_id = ?", 5)
+        ]
+
+    def test_debug_headers(self, client, db_session, monkeypatch, create_schedule):
+        """Тест заголовков со статистикой в режиме отладки"""
+        monkeypatch.setattr(settings, "DEBUG", True)
+        create_schedule(showtimes=1)
+
+        response = client.get("/movies/")
+
+        assert response.status_code == status.HTTP_200_OK
+        assert int(response.headers["X-DB-Query-Count"]) >= 1
+        assert float(response.headers["X-DB-Time-Ms"]) >= 0
+        assert "X-DB-N-Plus-One" not in response.headers
+
+    def test_no_headers_outside_debug(self, client):
+        """Тест отсутствия заголовков вне режима отладки"""
+        response = client.get("/movies/")
+
+        assert "X-DB-Query-Count" not in response.headers
+
+    def test_n_plus_one_logged(
+        self, client, db_session, caplog, monkeypatch, create_schedule
+    ):
+        """Тест предупреждения о подозрении на N+1"""
+        monkeypatch.setattr(settings, "N_PLUS_ONE_THRESHOLD", 3)
+        create_schedule()
+        target_date = datetime.utcnow().date().isoformat()
+
+        with caplog.at_level(logging.WARNING, logger="app.query_stats"):
+            client.get(f"/movies/schedule?target_date={target_date}")
+
+        assert any(
+            "Suspected N+1 on GET /movies/schedule" in r.message for r in caplog.records
+        )
+
+    def test_assert_max_queries_fixture(
+        self, client, db_session, assert_max_queries, create_schedule
+    ):
+        """Тест ограничения числа запросов к эндпоинту"""
+        create_schedule(showtimes=1)
+
+        with assert_max_queries(1) as stats:
+            client.get("/movies/")
+
+        assert stats.count == 1
@@ -0,0 +1,296 @@
+import csv
+import io
+import threading
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+import pytest
+from sqlalchemy import text
+from app import report_jobs as report_jobs_module
+from app.report_jobs import JOB_KINDS, JobKind, ReportJobRunner
+from app.schemas.report_job import DateRangeParams, ReportJobKind
+from app.services.reservation_service import ReservationService
+from tests.conftest import TestingSessionLocal
+
+
+@pytest.fixture
+def runner(monkeypatch, tmp_path):
+    runner = ReportJobRunner(
+        TestingSessionLocal,
+        TestingSessionLocal,
+        workers=1,
+        max_pending=2,
+        results_dir=str(tmp_path / "results"),
+    )
+    monkeypatch.setattr(report_jobs_module, "report_jobs", runner)
+    monkeypatch.setattr("app.routes.admin.report_jobs", runner)
+    yield runner
+    runner.shutdown()
+
+
+@pytest.fixture
+def blocked_kind(monkeypatch):
+    """Вид отчёта, который ждёт сигнала перед завершением."""
+    release = threading.Event()
+
+    def run(db, params):
+        release.wait(5)
+        return [b"{}"], "application/json"
+
+    monkeypatch.setitem(
+        JOB_KINDS, ReportJobKind.RESERVATIONS_REPORT, JobKind(DateRangeParams, run)
+    )
+    yield release
+    release.set()
+
+
+@pytest.fixture
+def reservation(db_session, create_user, create_showtime):
+    user = create_user()
+    showtime, seats = create_showtime(
+        start_time=datetime(2030, 1, 7, 19), price="10.00", seats=1
+    )
+    ReservationService.reserve_seats(db_session, user.id, showtime.id, [seats[0].id])
+
+
+def wait_for(client, headers, job_id, timeout=5.0):
+    deadline = time.monotonic() + timeout
+    while True:
+        job = client.get(f"/admin/jobs/{job_id}", headers=headers).json()
+        if job["status"] in ("succeeded", "failed") or time.monotonic() > deadline:
+            return job
+        time.sleep(0.02)
+
+
+class TestReportJobs:
+    """Тесты для фоновых заданий тяжёлых отчётов"""
+
+    def test_job_result_can_be_polled_and_downloaded(
+        self, client, runner, admin_headers, reservation
+    ):
+        """Тест выполнения задания и скачивания результата"""
+        headers = admin_headers
+
+        response = client.post(
+            "/admin/jobs",
+            json={"kind": "analytics", "params": {"group_by": ["hall"]}},
+            headers=headers,
+        )
+
+        assert response.status_code == 202
+        job = wait_for(client, headers, response.json()["id"])
+        assert job["status"] == "succeeded"
+        assert job["params"]["group_by"] == ["hall"]
+        assert job["params"]["limit"] == 100
+        assert job["started_at"] is not None
+        result = client.get(job["result_url"], headers=headers)
+        assert result.headers["content-type"] == "application/json"
+        assert result.json()["rows"][0]["hall_number"] == 1
+        assert result.json()["totals"]["revenue"] == 10.0
+
+    def test_export_job_result(
+        self, client, db_session, runner, admin_headers, reservation
+    ):
+        """Тест выгрузки CSV через фоновое задание"""
+        headers = admin_headers
+
+        job_id = client.post(
+            "/admin/jobs",
+            json={"kind": "reservations_export", "params": {"format": "csv"}},
+            headers=headers,
+        ).json()["id"]
+
+        assert wait_for(client, headers, job_id)["status"] == "succeeded"
+        result = client.get(f"/admin/jobs/{job_id}/result", headers=headers)
+        assert result.headers["content-type"].startswith("text/csv")
+        assert (
+            f'filename="reservations_export-{job_id}.csv"'
+            in result.headers["content-disposition"]
+        )
+        rows = list(csv.DictReader(io.StringIO(result.text)))
+        assert [r["movie_title"] for r in rows] == ["Test Movie"]
+        result_path = db_session.execute(
+            text("SELECT result_path FROM report_jobs WHERE id = :id"), {"id": job_id}
+        ).scalar()
+        assert (Path(runner.results_dir) / result_path).read_bytes() == result.content
+
+    def test_identical_in_flight_jobs_are_deduplicated(
+        self, client, runner, blocked_kind, admin_headers
+    ):
+        """Тест объединения одинаковых незавершённых заданий"""
+        headers = admin_headers
+        job = {"kind": "reservations_report", "params": {"end_date": "2030-01-31"}}
+
+        first = client.post("/admin/jobs", json=job, headers=headers).json()
+        second = client.post("/admin/jobs", json=job, headers=headers).json()
+        other = client.post(
+            "/admin/jobs", json={"kind": "reservations_report"}, headers=headers
+        ).json()
+
+        assert second["id"] == first["id"]
+        assert other["id"] != first["id"]
+        assert runner.stats()["deduplicated"] == 1
+        pending = client.get(f"/admin/jobs/{first['id']}/result", headers=headers)
+        assert pending.status_code == 409
+        blocked_kind.set()
+        assert wait_for(client, headers, first["id"])["status"] == "succeeded"
+        assert wait_for(client, headers, other["id"])["status"] == "succeeded"
+
+        third = client.post("/admin/jobs", json=job, headers=headers).json()
+        assert third["id"] != first["id"]
+        wait_for(client, headers, third["id"])
+
+    def test_pending_jobs_are_bounded(
+        self, client, runner, blocked_kind, admin_headers
+    ):
+        """Тест отказа при переполнении очереди заданий"""
+        headers = admin_headers
+        for end_date in ("2030-01-01", "2030-01-02"):
+            client.post(
+                "/admin/jobs",
+                json={"kind": "reservations_report", "params": {"end_date": end_date}},
+                headers=headers,
+            )
+
+        response = client.post(
+            "/admin/jobs", json={"kind": "reservations_report"}, headers=headers
+        )
+
+        assert response.status_code == 503
+        assert response.headers["retry-after"] == "5"
+        assert runner.stats()["rejected"] == 1
+
+    def test_failed_job(self, client, runner, monkeypatch, admin_headers):
+        """Тест ошибок задания и недоступного результата"""
+        headers = admin_headers
+
+        def fail(db, params):
+            raise ValueError("boom")
+
+        monkeypatch.setitem(
+            JOB_KINDS, ReportJobKind.SEAT_HEATMAP, JobKind(DateRangeParams, fail)
+        )
+        job_id = client.post(
+            "/admin/jobs", json={"kind": "seat_heatmap"}, headers=headers
+        ).json()["id"]
+
+        job = wait_for(client, headers, job_id)
+        assert job["status"] == "failed"
+        assert job["error"] == "boom"
+        assert job["result_url"] is None
+        response = client.get(f"/admin/jobs/{job_id}/result", headers=headers)
+        assert response.status_code == 409
+        assert client.get("/admin/jobs/999", headers=headers).status_code == 404
+
+    def test_invalid_jobs_are_rejected(self, client, runner, admin_headers):
+        """Тест проверки вида и параметров задания"""
+        headers = admin_headers
+
+        for job in (
+            {"kind": "everything"},
+            {"kind": "analytics", "params": {"group_by": ["seat"]}},
+            {"kind": "reservations_report", "params": {"hall": 1}},
+        ):
+            response = client.post("/admin/jobs", json=job, headers=headers)
+            assert response.status_code == 422
+        assert runner.stats()["submitted"] == 0
+
+    def test_stale_in_flight_job_is_abandoned(
+        self, client, db_session, runner, admin_headers
+    ):
+        """Тест замены задания, оставшегося от упавшего процесса"""
+        headers = admin_headers
+        job = {"kind": "reservations_report"}
+        first = client.post("/admin/jobs", json=job, headers=headers).json()
+        wait_for(client, headers, first["id"])
+        db_session.execute(
+            text(
+                "UPDATE report_jobs SET status = 'RUNNING', finished_at = NULL, "
+                "owner = 'dead-worker', heartbeat_at = :heartbeat_at"
+            ),
+            {"heartbeat_at": datetime.utcnow() - timedelta(minutes=2)},
+        )
+        db_session.commit()
+
+        second = client.post("/admin/jobs", json=job, headers=headers).json()
+
+        assert second["id"] != first["id"]
+        abandoned = client.get(f"/admin/jobs/{first['id']}", headers=headers).json()
+        assert abandoned["status"] == "failed"
+        assert abandoned["error"] == "Abandoned"
+        wait_for(client, headers, second["id"])
+
+    def test_shutdown_waits_for_running_jobs(
+        self, client, runner, blocked_kind, admin_headers
+    ):
+        """Тест ожидания выполняемых и отмены ожидающих заданий при остановке"""
+        job = {"kind": "reservations_report"}
+        job_id = client.post("/admin/jobs", json=job, headers=admin_headers).json()[
+            "id"
+        ]
+        while (
+            client.get(f"/admin/jobs/{job_id}", headers=admin_headers).json()["status"]
+            == "queued"
+        ):
+            time.sleep(0.01)
+        queued = {"kind": "reservations_report", "params": {"end_date": "2030-01-31"}}
+        queued_id = client.post(
+            "/admin/jobs", json=queued, headers=admin_headers
+        ).json()["id"]
+        threading.Timer(0.05, blocked_kind.set).start()
+
+        runner.shutdown()
+
+        job = client.get(f"/admin/jobs/{job_id}", headers=admin_headers).json()
+        assert job["status"] == "succeeded"
+        dropped = client.get(f"/admin/jobs/{queued_id}", headers=admin_headers).json()
+        assert dropped["status"] == "failed"
+        assert dropped["error"] == "Abandoned"
+        assert runner.stats()["pending"] == 0
+        assert runner._executor is None
+        resubmitted = client.post("/admin/jobs", json=queued, headers=admin_headers)
+        assert resubmitted.json()["id"] != queued_id
+
+    def test_heartbeat_keeps_running_job_alive(
+        self, client, db_session, runner, blocked_kind, admin_headers
+    ):
+        """Тест обновления отметки жизни выполняемого задания"""
+        runner.heartbeat_interval = 0.01
+        job_id = client.post(
+            "/admin/jobs", json={"kind": "reservations_report"}, headers=admin_headers
+        ).json()["id"]
+        query = text(
+            "SELECT owner, created_at, heartbeat_at FROM report_jobs WHERE id = :id"
+        )
+        deadline = time.monotonic() + 5
+        while time.monotonic() < deadline:
+            row = db_session.execute(query, {"id": job_id}).one()
+            db_session.commit()
+            if row.heartbeat_at > row.created_at:
+                break
+            time.sleep(0.01)
+
+        assert row.owner == runner.owner
+        assert row.heartbeat_at > row.created_at
+        blocked_kind.set()
+        assert wait_for(client, admin_headers, job_id)["status"] == "succeeded"
+
+    def test_expired_results_are_removed(self, client, runner, admin_headers):
+        """Тест удаления файлов результатов вместе с истёкшими заданиями"""
+        runner.retention = 0
+        results = Path(runner.results_dir)
+        first = client.post(
+            "/admin/jobs", json={"kind": "reservations_report"}, headers=admin_headers
+        ).json()
+        assert wait_for(client, admin_headers, first["id"])["status"] == "succeeded"
+        [first_result] = results.iterdir()
+
+        second = client.post(
+            "/admin/jobs",
+            json={"kind": "reservations_report", "params": {"end_date": "2030-01-31"}},
+            headers=admin_headers,
+        ).json()
+        wait_for(client, admin_headers, second["id"])
+
+        assert not first_result.exists()
+        assert len(list(results.iterdir())) == 1
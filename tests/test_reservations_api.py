@@ -236,6 +236,177 @@ class TestReservationsAPI:
         assert data[0]["seat_number"] == 1
         assert data[0]["status"] == ReservationStatus.CONFIRMED.value
 
+    def test_get_my_reservations_single_query(
+        self, client, db_session, assert_max_queries
+    ):
+        """Тест: детали бронирований читаются без N+1"""
+        user = User(
+            email="user@example.com",
+            username="user",
+            hashed_password=get_password_hash("password123"),
+            role=UserRole.USER,
+        )
+        movie = Movie(title="Test Movie", genre="Action", duration_minutes=120)
+        db_session.add_all([user, movie])
+        db_session.commit()
+
+        showtime = Showtime(
+            movie_id=movie.id,
+            start_time=datetime.utcnow() + timedelta(days=1),
+            hall_number=1,
+            price=Decimal("15.50"),
+            total_seats=100,
+        )
+        db_session.add(showtime)
+        db_session.commit()
+
+        seats = [
+            Seat(showtime_id=showtime.id, row="A", number=n, is_reserved=True)
+            for n in range(1, 6)
+        ]
+        db_session.add_all(seats)
+        db_session.commit()
+
+        db_session.add_all(
+            [
+                Reservation(
+                    user_id=user.id,
+                    showtime_id=showtime.id,
+                    seat_id=seat.id,
+                    status=ReservationStatus.CONFIRMED,
+                )
+                for seat in seats
+            ]
+        )
+        db_session.commit()
+
+        headers = {
+            "Authorization": f"Bearer {create_access_token(data={'sub': user.username})}"
+        }
+        with assert_max_queries(3):
+            response = client.get("/reservations/my", headers=headers)
+
+        assert response.status_code == status.HTTP_200_OK
+        assert [
+            r["seat_number"]
+            for r in sorted(response.json(), key=lambda r: r["seat_number"])
+        ] == [1, 2, 3, 4, 5]
+
+    def test_get_my_reservations_keyset_pages(self, client, db_session):
+        """Тест постраничного чтения бронирований по курсору"""
+        user = User(
+            email="user@example.com",
+            username="user",
+            hashed_password=get_password_hash("password123"),
+            role=UserRole.USER,
+        )
+        movie = Movie(title="Test Movie", genre="Action", duration_minutes=120)
+        db_session.add_all([user, movie])
+        db_session.commit()
+
+        showtime = Showtime(
+            movie_id=movie.id,
+            start_time=datetime.utcnow() + timedelta(days=1),
+            hall_number=1,
+            price=Decimal("15.50"),
+            total_seats=100,
+        )
+        db_session.add(showtime)
+        db_session.commit()
+
+        seats = [
+            Seat(showtime_id=showtime.id, row="A", number=n, is_reserved=True)
+            for n in range(1, 6)
+        ]
+        db_session.add_all(seats)
+        db_session.commit()
+
+        # Two reservations share a timestamp to exercise the id tie-breaker.
+        base = datetime.utcnow() - timedelta(hours=1)
+        created = [base, base, base + timedelta(minutes=1), base + timedelta(2), base]
+        db_session.add_all(
+            [
+                Reservation(
+                    user_id=user.id,
+                    showtime_id=showtime.id,
+                    seat_id=seat.id,
+                    status=ReservationStatus.CONFIRMED,
+                    created_at=created_at,
+                )
+                for seat, created_at in zip(seats, created)
+            ]
+        )
+        db_session.commit()
+
+        headers = {
+            "Authorization": f"Bearer {create_access_token(data={'sub': user.username})}"
+        }
+        pages = []
+        params = {"limit": 2}
+        while True:
+            response = client.get("/reservations/my", params=params, headers=headers)
+            assert response.status_code == status.HTTP_200_OK
+            pages.append([r["seat_number"] for r in response.json()])
+            if "X-Next-Cursor" not in response.headers:
+                break
+            params["cursor"] = response.headers["X-Next-Cursor"]
+
+        assert pages == [[4, 3], [5, 2], [1]]
+
+    def test_get_my_reservations_keyset_pages_whole_seconds(
+        self, client, db_session, create_user, create_showtime
+    ):
+        """Тест курсора по бронированиям с одинаковым временем без долей секунды"""
+        user = create_user()
+        showtime, seats = create_showtime(seats=3)
+        db_session.add_all(
+            [
+                Reservation(
+                    user_id=user.id,
+                    showtime_id=showtime.id,
+                    seat_id=seat.id,
+                    status=ReservationStatus.CONFIRMED,
+                    created_at=datetime(2024, 1, 1, 10),
+                )
+                for seat in seats
+            ]
+        )
+        db_session.commit()
+
+        headers = {
+            "Authorization": f"Bearer {create_access_token(data={'sub': user.username})}"
+        }
+        pages = []
+        params = {"limit": 1}
+        while True:
+            response = client.get("/reservations/my", params=params, headers=headers)
+            pages.append([r["id"] for r in response.json()])
+            if "X-Next-Cursor" not in response.headers:
+                break
+            params["cursor"] = response.headers["X-Next-Cursor"]
+
+        assert pages == [[3], [2], [1]]
+
+    def test_get_my_reservations_invalid_cursor(self, client, db_session):
+        """Тест некорректного курсора"""
+        user = User(
+            email="user@example.com",
+            username="user",
+            hashed_password=get_password_hash("password123"),
+            role=UserRole.USER,
+        )
+        db_session.add(user)
+        db_session.commit()
+
+        headers = {
+            "Authorization": f"Bearer {create_access_token(data={'sub': user.username})}"
+        }
+        response = client.get(
+            "/reservations/my", params={"cursor": "not-a-cursor"}, headers=headers
+        )
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        assert response.json()["detail"] == "Invalid cursor"
+
     def test_cancel_reservation_unauthorized(self, client):
         """Тест отмены бронирования без авторизации"""
         response = client.delete("/reservations/1")
@@ -0,0 +1,160 @@
+from datetime import datetime, timedelta
+from sqlalchemy import create_engine
+from sqlalchemy.orm import Session
+from app.models.revoked_token import RevokedToken
+from app.invalidation import invalidation_bus
+from app.revocation import (
+    EPOCH,
+    REVOKED_TOPIC,
+    BloomFilter,
+    RevocationStore,
+    subject_key,
+)
+
+
+class TestBloomFilter:
+    """Тесты для фильтра Блума"""
+
+    def test_added_keys_are_found(self):
+        """Тест отсутствия ложноотрицательных срабатываний"""
+        bloom = BloomFilter(capacity=1000, error_rate=0.01)
+        keys = [f"jti-{i}" for i in range(1000)]
+        for key in keys:
+            bloom.add(key)
+
+        assert all(key in bloom for key in keys)
+
+    def test_false_positive_rate(self):
+        """Тест доли ложноположительных срабатываний"""
+        bloom = BloomFilter(capacity=1000, error_rate=0.01)
+        for i in range(1000):
+            bloom.add(f"jti-{i}")
+
+        false_positives = sum(f"other-{i}" in bloom for i in range(10000))
+        assert false_positives < 300
+
+
+class TestRevocationStore:
+    """Тесты для хранилища отозванных токенов"""
+
+    def test_revoke_token(self, db_session):
+        """Тест отзыва токена по jti"""
+        store = RevocationStore(capacity=100)
+        assert store.is_revoked(db_session, "abc") is False
+
+        store.revoke(db_session, "abc", datetime.utcnow() + timedelta(minutes=5))
+
+        assert store.is_revoked(db_session, "abc") is True
+        assert store.is_revoked(db_session, "def") is False
+
+    def test_revoke_subject_only_affects_older_tokens(self, db_session):
+        """Тест отзыва всех токенов пользователя"""
+        store = RevocationStore(capacity=100)
+        store.revoke(
+            db_session,
+            subject_key("user"),
+            datetime.utcnow() + timedelta(minutes=5),
+        )
+        now = int((datetime.utcnow() - datetime(1970, 1, 1)).total_seconds())
+
+        assert store.is_revoked(db_session, "abc", "user", now - 60) is True
+        assert store.is_revoked(db_session, "abc", "user", now + 60) is False
+        assert store.is_revoked(db_session, "abc", "other", now - 60) is False
+
+    def test_token_issued_in_revocation_second_is_valid(self, db_session):
+        """Тест токена, выданного в ту же секунду, что и отзыв"""
+        store = RevocationStore(capacity=100)
+        store.revoke(
+            db_session,
+            subject_key("user"),
+            datetime.utcnow() + timedelta(minutes=5),
+        )
+        revoked_at = db_session.get(RevokedToken, subject_key("user")).revoked_at
+        revoked_second = int((revoked_at - EPOCH).total_seconds())
+
+        issued_at = store.issued_at(db_session, "user")
+
+        assert revoked_at.microsecond == 0
+        assert issued_at == revoked_at + timedelta(seconds=1)
+        assert store.is_revoked(db_session, None, "user", revoked_second) is True
+        assert (
+            store.is_revoked(
+                db_session, None, "user", int((issued_at - EPOCH).total_seconds())
+            )
+            is False
+        )
+        assert store.issued_at(db_session, "other") <= datetime.utcnow()
+
+    def test_expired_entries_are_ignored_and_pruned(self, db_session):
+        """Тест очистки истёкших записей"""
+        store = RevocationStore(capacity=100, reload_seconds=0)
+        store.revoke(db_session, "old", datetime.utcnow() - timedelta(seconds=1))
+        store.revoke(db_session, "new", datetime.utcnow() + timedelta(minutes=5))
+
+        assert store.is_revoked(db_session, "old") is False
+        assert store.is_revoked(db_session, "new") is True
+        assert db_session.query(RevokedToken).count() == 2
+
+        assert store.prune(db_session) == 1
+        assert [r.key for r in db_session.query(RevokedToken)] == ["new"]
+
+    def test_sync_does_not_write(self, db_session):
+        """Тест синхронизации на сессии только для чтения"""
+        store = RevocationStore(capacity=100, sync_seconds=0, reload_seconds=0)
+        store.revoke(db_session, "old", datetime.utcnow() - timedelta(seconds=1))
+        read_engine = create_engine(
+            "sqlite:///file:./test_movie_reservation.db?mode=ro&uri=true"
+        )
+        try:
+            with Session(read_engine) as read_db:
+                assert store.is_revoked(read_db, "old") is False
+                assert store.is_revoked(read_db, "new") is False
+                assert "old" not in store._bloom
+        finally:
+            read_engine.dispose()
+
+    def test_sync_picks_up_revocations_from_other_workers(self, db_session):
+        """Тест синхронизации отзывов между воркерами"""
+        store = RevocationStore(capacity=100, sync_seconds=0)
+        assert store.is_revoked(db_session, "abc") is False
+
+        other_worker = RevocationStore(capacity=100)
+        other_worker.revoke(db_session, "abc", datetime.utcnow() + timedelta(minutes=5))
+
+        assert store.is_revoked(db_session, "abc") is True
+
+    def test_sync_follows_commit_order_not_revocation_time(self, db_session):
+        """Тест синхронизации отзыва с более ранней отметкой, записанного позже"""
+        store = RevocationStore(capacity=100, sync_seconds=0)
+        other_worker = RevocationStore(capacity=100)
+        other_worker.revoke(
+            db_session, "late", datetime.utcnow() + timedelta(minutes=5)
+        )
+        assert store.is_revoked(db_session, "late") is True
+
+        db_session.add(
+            RevokedToken(
+                key="early",
+                expires_at=datetime.utcnow() + timedelta(minutes=5),
+                revoked_at=datetime.utcnow() - timedelta(minutes=1),
+            )
+        )
+        invalidation_bus.publish(db_session, REVOKED_TOPIC, "early")
+        db_session.commit()
+
+        assert store.is_revoked(db_session, "early") is True
+
+    def test_lagging_worker_reloads_live_keys(self, db_session):
+        """Тест полной перезагрузки после долгого отставания"""
+        store = RevocationStore(capacity=100, sync_seconds=0, replay_window=0)
+        assert store.is_revoked(db_session, "abc") is False
+        db_session.add(
+            RevokedToken(
+                key="abc",
+                expires_at=datetime.utcnow() + timedelta(minutes=5),
+                revoked_at=datetime.utcnow(),
+            )
+        )
+        db_session.commit()
+
+        assert store.is_revoked(db_session, "abc") is True
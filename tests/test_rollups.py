@@ -0,0 +1,146 @@
+from datetime import datetime, timedelta
+from sqlalchemy import create_engine, text
+from app.migrations import migrate
+from app.models.rollup import DailyRollup, ShowtimeRollup
+from app.services.reservation_service import ReservationService
+from app.services.rollup_service import RollupService
+
+
+class TestRollups:
+    """Тесты для инкрементальных агрегатов выручки и заполняемости"""
+
+    def test_reserve_and_cancel_update_rollups(
+        self, db_session, create_user, create_showtime
+    ):
+        """Тест обновления агрегатов при бронировании и отмене"""
+        user = create_user()
+        start = datetime.utcnow() + timedelta(days=1)
+        showtime, seats = create_showtime(start_time=start, price="12.50")
+
+        reservations = ReservationService.reserve_seats(
+            db_session, user.id, showtime.id, [seats[0].id, seats[1].id, seats[2].id]
+        )
+        ReservationService.cancel_reservation(db_session, reservations[0].id, user.id)
+
+        rollup = db_session.get(ShowtimeRollup, showtime.id)
+        day = db_session.get(DailyRollup, start.date())
+        assert (rollup.reserved_seats, rollup.revenue_cents) == (2, 2500)
+        assert (day.reserved_seats, day.revenue_cents) == (2, 2500)
+
+    def test_failed_reservation_leaves_rollups(
+        self, db_session, create_user, create_showtime
+    ):
+        """Тест отката агрегатов вместе с бронированием"""
+        user = create_user()
+        showtime, seats = create_showtime()
+        seats[0].is_reserved = True
+        db_session.commit()
+
+        try:
+            ReservationService.reserve_seats(
+                db_session, user.id, showtime.id, [seats[0].id]
+            )
+        except Exception:
+            db_session.rollback()
+
+        assert db_session.get(ShowtimeRollup, showtime.id) is None
+
+    def test_rebuild_repairs_drift(self, db_session, create_user, create_showtime):
+        """Тест пересчёта агрегатов после расхождения"""
+        user = create_user()
+        start = datetime.utcnow() + timedelta(days=2)
+        showtime, seats = create_showtime(start_time=start)
+        ReservationService.reserve_seats(
+            db_session, user.id, showtime.id, [seats[0].id, seats[1].id]
+        )
+        db_session.execute(
+            text("UPDATE showtime_rollups SET reserved_seats = 7, revenue_cents = 1")
+        )
+        db_session.execute(text("DELETE FROM daily_rollups"))
+        db_session.commit()
+
+        result = RollupService.rebuild(db_session)
+
+        assert result == {"showtimes": 1, "days": 1, "drifted_showtimes": 1}
+        db_session.expire_all()
+        assert db_session.get(ShowtimeRollup, showtime.id).revenue_cents == 2000
+        assert db_session.get(DailyRollup, start.date()).reserved_seats == 2
+        assert RollupService.rebuild(db_session)["drifted_showtimes"] == 0
+
+    def test_report_reads_rollups(
+        self,
+        client,
+        db_session,
+        assert_max_queries,
+        create_user,
+        create_showtime,
+        admin_headers,
+    ):
+        """Тест отчёта по агрегатам с фильтром по датам"""
+        user = create_user()
+        near = datetime.utcnow() + timedelta(days=1)
+        far = near + timedelta(days=10)
+        first, first_seats = create_showtime(start_time=near, price="12.50")
+        second, second_seats = create_showtime(start_time=far, price="8.00")
+        create_showtime(start_time=near, price="12.50")
+        ReservationService.reserve_seats(
+            db_session, user.id, first.id, [s.id for s in first_seats[:3]]
+        )
+        ReservationService.reserve_seats(
+            db_session, user.id, second.id, [second_seats[0].id]
+        )
+        with assert_max_queries(6):
+            response = client.get("/admin/report/reservations", headers=admin_headers)
+
+        data = response.json()
+        assert data["total_showtimes"] == 2
+        assert data["total_revenue"] == 45.5
+        assert data["report"][0]["showtime_id"] == first.id
+        assert data["report"][0]["reserved_seats"] == 3
+        assert data["report"][0]["capacity_percentage"] == 75.0
+        assert data["report"][0]["revenue"] == 37.5
+
+        response = client.get(
+            "/admin/report/reservations",
+            params={"end_date": near.date().isoformat()},
+            headers=admin_headers,
+        )
+        assert response.json()["total_showtimes"] == 1
+        assert response.json()["total_revenue"] == 37.5
+
+    def test_migration_backfills_rollups(self, tmp_path):
+        """Тест заполнения агрегатов при миграции"""
+        engine = create_engine(f"sqlite:///{tmp_path}/rollups.db")
+        migrate(engine, target=5)
+        with engine.begin() as conn:
+            conn.execute(
+                text(
+                    "INSERT INTO movies (id, title, genre, duration_minutes) "
+                    "VALUES (1, 'M', 'Drama', 90)"
+                )
+            )
+            conn.execute(
+                text(
+                    "INSERT INTO showtimes (id, movie_id, start_time, hall_number, "
+                    "price, total_seats) VALUES "
+                    "(1, 1, '2030-01-02 18:00:00.000000', 1, 9.99, 10)"
+                )
+            )
+            conn.execute(
+                text(
+                    "INSERT INTO reservations (user_id, showtime_id, seat_id, status) "
+                    "VALUES (1, 1, 1, 'CONFIRMED'), (1, 1, 2, 'CONFIRMED'), "
+                    "(1, 1, 3, 'CANCELLED')"
+                )
+            )
+
+        migrate(engine)
+
+        with engine.connect() as conn:
+            assert conn.execute(text("SELECT * FROM showtime_rollups")).all() == [
+                (1, 2, 1998)
+            ]
+            assert conn.execute(text("SELECT * FROM daily_rollups")).all() == [
+                ("2030-01-02", 2, 1998)
+            ]
+        engine.dispose()
@@ -0,0 +1,153 @@
+import asyncio
+import pytest
+from datetime import datetime, timedelta
+from decimal import Decimal
+from fastapi import status
+from app.models.user import User, UserRole
+from app.models.movie import Movie
+from app.models.showtime import Showtime
+from app.models.seat import Seat
+from app.seat_events import SeatBroadcaster, seat_broadcaster, seat_event_stream
+from app.services.reservation_service import ReservationService
+
+
+@pytest.fixture
+def showtime_with_seats(db_session):
+    user = User(
+        email="user@example.com",
+        username="user",
+        hashed_password="hashed_password",
+        role=UserRole.USER,
+    )
+    movie = Movie(title="Test Movie", genre="Action", duration_minutes=120)
+    db_session.add_all([user, movie])
+    db_session.commit()
+
+    showtime = Showtime(
+        movie_id=movie.id,
+        start_time=datetime.utcnow() + timedelta(days=1),
+        hall_number=1,
+        price=Decimal("15.50"),
+        total_seats=3,
+    )
+    db_session.add(showtime)
+    db_session.commit()
+
+    seats = [
+        Seat(showtime_id=showtime.id, row="A", number=n, is_reserved=False)
+        for n in range(1, 4)
+    ]
+    db_session.add_all(seats)
+    db_session.commit()
+
+    return user, showtime, seats
+
+
+class TestSeatBroadcaster:
+    """Тесты для рассылки изменений мест подписчикам"""
+
+    @pytest.mark.asyncio
+    async def test_burst_is_coalesced(self):
+        """Тест объединения пачки изменений в одно сообщение"""
+        broadcaster = SeatBroadcaster(interval=60, queue_size=4)
+        first = broadcaster.subscribe(1)
+        second = broadcaster.subscribe(1)
+        other = broadcaster.subscribe(2)
+
+        broadcaster.publish(1, 3, [("A", 1, True), ("A", 2, True)])
+        broadcaster.publish(1, 4, [("A", 1, False)])
+
+        assert broadcaster.flush() == 2
+        for subscription in (first, second):
+            assert subscription.queue.get_nowait() == (
+                "seats",
+                {"version": 4, "changes": "A:1.,A:2x"},
+            )
+            assert subscription.queue.empty()
+        assert other.queue.empty()
+        assert broadcaster.flush() == 0
+
+        for subscription in (first, second, other):
+            broadcaster.unsubscribe(subscription)
+        assert broadcaster.subscriber_count() == 0
+
+    @pytest.mark.asyncio
+    async def test_publish_without_subscribers_is_dropped(self):
+        """Тест публикации без подписчиков"""
+        broadcaster = SeatBroadcaster(interval=60, queue_size=4)
+
+        broadcaster.publish(1, 1, [("A", 1, True)])
+
+        assert broadcaster.published == 0
+        assert broadcaster.flush() == 0
+
+    @pytest.mark.asyncio
+    async def test_slow_subscriber_gets_resync(self):
+        """Тест переполнения очереди медленного подписчика"""
+        broadcaster = SeatBroadcaster(interval=60, queue_size=2)
+        subscription = broadcaster.subscribe(1)
+
+        for version in range(1, 5):
+            broadcaster.publish(1, version, [("A", version, True)])
+            broadcaster.flush()
+
+        assert subscription.lagged
+        assert subscription.queue.get_nowait() == ("resync", {})
+        assert subscription.queue.empty()
+        broadcaster.unsubscribe(subscription)
+
+    @pytest.mark.asyncio
+    async def test_flusher_delivers_within_interval(self):
+        """Тест фоновой отправки изменений"""
+        broadcaster = SeatBroadcaster(interval=0.01, queue_size=4)
+        subscription = broadcaster.subscribe(1)
+
+        broadcaster.publish(1, 1, [("B", 2, True)])
+        event, data = await asyncio.wait_for(subscription.queue.get(), timeout=1)
+
+        assert (event, data) == ("seats", {"version": 1, "changes": "B:2x"})
+        broadcaster.unsubscribe(subscription)
+
+    @pytest.mark.asyncio
+    async def test_event_stream(self):
+        """Тест формата потока событий"""
+        subscription = seat_broadcaster.subscribe(7)
+        stream = seat_event_stream(
+            subscription, {"showtime_id": 7, "version": 0, "seats": "A:3."}, 60
+        )
+
+        assert await stream.__anext__() == (
+            'event: snapshot\ndata: {"showtime_id":7,"version":0,"seats":"A:3."}\n\n'
+        )
+        subscription.offer(("seats", {"version": 1, "changes": "A:1x"}))
+        assert await stream.__anext__() == (
+            'event: seats\ndata: {"version":1,"changes":"A:1x"}\n\n'
+        )
+
+        await stream.aclose()
+        assert seat_broadcaster.subscriber_count(7) == 0
+
+    @pytest.mark.asyncio
+    async def test_reservation_commit_publishes(self, db_session, showtime_with_seats):
+        """Тест публикации изменений после бронирования и отмены"""
+        user, showtime, seats = showtime_with_seats
+        subscription = seat_broadcaster.subscribe(showtime.id)
+
+        reservations = ReservationService.reserve_seats(
+            db_session, user.id, showtime.id, [seats[0].id, seats[2].id]
+        )
+        ReservationService.cancel_reservation(db_session, reservations[0].id, user.id)
+        seat_broadcaster.flush()
+
+        assert subscription.queue.get_nowait() == (
+            "seats",
+            {"version": 2, "changes": "A:1.,A:3x"},
+        )
+        seat_broadcaster.unsubscribe(subscription)
+
+    def test_seat_events_unknown_showtime(self, client):
+        """Тест подписки на несуществующий сеанс"""
+        response = client.get("/showtimes/999/seat-events")
+
+        assert response.status_code == status.HTTP_404_NOT_FOUND
+        assert seat_broadcaster.subscriber_count(999) == 0
@@ -0,0 +1,109 @@
+from datetime import datetime
+import numpy as np
+from app.seat_heatmap import fill_positions, hall_heatmaps, load_seats
+from app.services.reservation_service import ReservationService
+
+URL = "/admin/analytics/seat-heatmap"
+
+
+class TestSeatHeatmap:
+    """Тесты для векторизованного расчёта тепловых карт мест"""
+
+    def test_fill_positions(self):
+        """Тест доли проданных мест на момент продажи каждого места"""
+        showtime = np.array([10, 10, 10, 10, 11, 11])
+        reservation = np.array([5, 3, 0, 9, 0, 1])
+
+        positions = fill_positions(showtime, reservation)
+
+        np.testing.assert_array_equal(positions, [0.25, 0.0, np.nan, 0.5, np.nan, 0.0])
+
+    def test_hall_heatmaps(self):
+        """Тест матриц заполняемости и порядка продажи по залам"""
+        seats = load_seats(
+            [
+                (1, 10, "A", 1, 5),
+                (1, 10, "A", 2, 3),
+                (1, 10, "B", 1, 0),
+                (1, 10, "B", 2, 0),
+                (1, 11, "A", 1, 7),
+                (1, 11, "A", 2, 0),
+                (1, 11, "B", 1, 0),
+                (1, 11, "B", 2, 8),
+                (2, 12, "A", 1, 0),
+                (2, 12, "A", 3, 1),
+            ]
+        )
+
+        first, second = hall_heatmaps(seats)
+
+        assert first == {
+            "hall_number": 1,
+            "showtimes": 2,
+            "rows": ["A", "B"],
+            "first_number": 1,
+            "seat_numbers": 2,
+            "occupancy": [[1.0, 0.5], [0.0, 0.5]],
+            "fill_order": [[0.125, 0.0], [None, 0.25]],
+        }
+        assert second["occupancy"] == [[0.0, None, 1.0]]
+        assert second["fill_order"] == [[None, None, 0.0]]
+
+    def test_empty_range(self):
+        """Тест пустого набора мест"""
+        assert hall_heatmaps(load_seats([])) == []
+
+
+class TestSeatHeatmapAPI:
+    """Тесты для эндпоинта тепловых карт мест"""
+
+    def test_heatmap_endpoint(
+        self,
+        client,
+        db_session,
+        create_user,
+        create_movie,
+        create_showtime,
+        admin_headers,
+    ):
+        """Тест тепловой карты по реальным бронированиям"""
+        user = create_user()
+        movie = create_movie()
+        seats_by_showtime = []
+        for day, hall in ((7, 3), (8, 3), (9, 4)):
+            showtime, seats = create_showtime(
+                movie, datetime(2030, 1, day, 19), hall, rows="AB"
+            )
+            seats = {(seat.row, seat.number): seat for seat in seats}
+            seats_by_showtime.append((showtime, seats))
+
+        for showtime, seats in seats_by_showtime[:2]:
+            for key in (("B", 2), ("A", 1)):
+                ReservationService.reserve_seats(
+                    db_session, user.id, showtime.id, [seats[key].id]
+                )
+        showtime, seats = seats_by_showtime[0]
+        reservations = ReservationService.reserve_seats(
+            db_session, user.id, showtime.id, [seats[("A", 2)].id]
+        )
+        ReservationService.cancel_reservation(db_session, reservations[0].id, user.id)
+
+        response = client.get(
+            URL,
+            params={"end_date": "2030-01-08", "hall_number": 3},
+            headers=admin_headers,
+        )
+
+        assert response.status_code == 200
+        data = response.json()
+        assert data["end_date"] == "2030-01-08"
+        assert len(data["halls"]) == 1
+        hall = data["halls"][0]
+        assert hall["hall_number"] == 3
+        assert hall["showtimes"] == 2
+        assert hall["occupancy"] == [[1.0, 0.0], [0.0, 1.0]]
+        assert hall["fill_order"] == [[0.25, None], [None, 0.0]]
+
+        response = client.get(URL, headers=admin_headers)
+        assert [h["hall_number"] for h in response.json()["halls"]] == [3, 4]
+        assert response.json()["halls"][1]["occupancy"] == [[0.0, 0.0], [0.0, 0.0]]
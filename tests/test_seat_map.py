@@ -0,0 +1,37 @@
+from app.seat_map import (
+    decode_seat_map,
+    encode_runs,
+    encode_seat_changes,
+    encode_seat_map,
+)
+
+
+class TestSeatMapEncoding:
+    """Тесты для компактной кодировки схемы зала"""
+
+    def test_encode_runs(self):
+        """Тест кодирования серий одинаковых мест"""
+        assert encode_runs("...xx.....") == "3.2x5."
+        assert encode_runs(".x.") == ".x."
+        assert encode_runs("") == ""
+
+    def test_encode_seat_map_round_trip(self):
+        """Тест кодирования и декодирования схемы зала"""
+        seats = [("A", n, n in (4, 5)) for n in range(1, 11)]
+        seats += [("B", n, False) for n in range(1, 11)]
+
+        encoded = encode_seat_map(seats)
+
+        assert encoded == "A:3.2x5./B:10."
+        assert decode_seat_map(encoded) == {"A": "...xx.....", "B": ".........."}
+
+    def test_encode_seat_map_keeps_gaps_aligned(self):
+        """Тест пропусков в нумерации мест"""
+        seats = [("A", 1, False), ("A", 2, False), ("A", 5, True)]
+
+        assert encode_seat_map(seats) == "A:2.2_x"
+        assert decode_seat_map(encode_seat_map([])) == {}
+
+    def test_encode_seat_changes(self):
+        """Тест кодирования изменённых мест"""
+        assert encode_seat_changes([("A", 3, True), ("B", 7, False)]) == "A:3x,B:7."
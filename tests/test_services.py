@@ -9,6 +9,7 @@ from app.models.seat import Seat
 from app.models.reservation import Reservation, ReservationStatus
 from app.services.movie_service import MovieService
 from app.services.reservation_service import ReservationService
+from app.read_models import SeatRecord
 
 
 class TestMovieService:
@@ -119,6 +120,63 @@ class TestMovieService:
         for seat in available_seats:
             assert seat.is_reserved is False
 
+    def test_get_showtime_seats_returns_records(self, db_session):
+        """Тест чтения мест сеанса в компактные записи"""
+        movie = Movie(title="Test Movie", genre="Action", duration_minutes=120)
+        db_session.add(movie)
+        db_session.commit()
+
+        showtime = Showtime(
+            movie_id=movie.id,
+            start_time=datetime.utcnow() + timedelta(days=1),
+            hall_number=1,
+            price=Decimal("15.50"),
+            total_seats=100,
+        )
+        db_session.add(showtime)
+        db_session.commit()
+        showtime_id = showtime.id
+
+        db_session.add_all(
+            [
+                Seat(showtime_id=showtime_id, row="A", number=1, is_reserved=False),
+                Seat(showtime_id=showtime_id, row="A", number=2, is_reserved=True),
+            ]
+        )
+        db_session.commit()
+        db_session.expunge_all()
+
+        seats = MovieService.get_showtime_seats(db_session, showtime_id)
+
+        assert all(isinstance(seat, SeatRecord) for seat in seats)
+        assert sorted((s.row, s.number, s.is_reserved) for s in seats) == [
+            ("A", 1, False),
+            ("A", 2, True),
+        ]
+        assert len(db_session.identity_map) == 0
+
+    def test_get_showtime_seats_empty_showtime(self, db_session):
+        """Тест сеанса без мест и несуществующего сеанса"""
+        movie = Movie(title="Test Movie", genre="Action", duration_minutes=120)
+        db_session.add(movie)
+        db_session.commit()
+
+        showtime = Showtime(
+            movie_id=movie.id,
+            start_time=datetime.utcnow() + timedelta(days=1),
+            hall_number=1,
+            price=Decimal("15.50"),
+            total_seats=0,
+        )
+        db_session.add(showtime)
+        db_session.commit()
+
+        assert MovieService.get_showtime_seats(db_session, showtime.id) == []
+
+        with pytest.raises(HTTPException) as exc_info:
+            MovieService.get_showtime_seats(db_session, showtime.id + 1)
+        assert exc_info.value.status_code == status.HTTP_404_NOT_FOUND
+
 
 class TestReservationService:
     """Тесты для сервиса бронирований"""
@@ -285,6 +343,58 @@ class TestReservationService:
         assert exc_info.value.status_code == status.HTTP_400_BAD_REQUEST
         assert "Seats already reserved" in exc_info.value.detail
 
+    def test_reserve_seats_rejects_seat_taken_after_lookup(
+        self, db_session, monkeypatch
+    ):
+        """Тест повторной проверки места при записи бронирования"""
+        from sqlalchemy import bindparam, false, select
+        from app.services import reservation_service
+
+        user = User(
+            email="user@example.com",
+            username="user",
+            hashed_password="hashed_password",
+            role=UserRole.USER,
+        )
+        movie = Movie(title="Test Movie", genre="Action", duration_minutes=120)
+        db_session.add_all([user, movie])
+        db_session.commit()
+
+        showtime = Showtime(
+            movie_id=movie.id,
+            start_time=datetime.utcnow() + timedelta(days=1),
+            hall_number=1,
+            price=Decimal("15.50"),
+            total_seats=100,
+        )
+        db_session.add(showtime)
+        db_session.commit()
+
+        seat = Seat(showtime_id=showtime.id, row="A", number=1, is_reserved=True)
+        db_session.add(seat)
+        db_session.commit()
+
+        # Simulate a stale lookup that still sees the seat as free.
+        seats_table = Seat.__table__
+        stale_lookup = select(
+            seats_table.c.id,
+            seats_table.c.row,
+            seats_table.c.number,
+            false().label("is_reserved"),
+        ).where(seats_table.c.id.in_(bindparam("seat_ids", expanding=True)))
+        monkeypatch.setattr(reservation_service, "SEAT_LOOKUP_STMT", stale_lookup)
+
+        with pytest.raises(HTTPException) as exc_info:
+            ReservationService.reserve_seats(
+                db=db_session,
+                user_id=user.id,
+                showtime_id=showtime.id,
+                seat_ids=[seat.id],
+            )
+
+        assert exc_info.value.status_code == status.HTTP_400_BAD_REQUEST
+        assert db_session.query(Reservation).count() == 0
+
     def test_cancel_reservation_success(self, db_session):
         """Тест успешной отмены бронирования"""
         user = User(
@@ -164,3 +164,93 @@ class TestShowtimesAPI:
         response = client.get("/showtimes/999/available-seats")
         assert response.status_code == status.HTTP_200_OK
         assert response.json() == []
+
+    def test_seat_map_and_delta(self, client, db_session):
+        """Тест компактной схемы зала и дельты по версии"""
+        movie = Movie(title="Test Movie", genre="Action", duration_minutes=120)
+        user = User(
+            email="user@example.com",
+            username="user",
+            hashed_password=get_password_hash("password123"),
+            role=UserRole.USER,
+        )
+        db_session.add_all([movie, user])
+        db_session.commit()
+
+        showtime = Showtime(
+            movie_id=movie.id,
+            start_time=datetime.utcnow() + timedelta(days=1),
+            hall_number=1,
+            price=Decimal("15.50"),
+            total_seats=6,
+        )
+        db_session.add(showtime)
+        db_session.commit()
+
+        seats = [
+            Seat(showtime_id=showtime.id, row=row, number=n, is_reserved=False)
+            for row in "AB"
+            for n in range(1, 4)
+        ]
+        db_session.add_all(seats)
+        db_session.commit()
+
+        response = client.get(f"/showtimes/{showtime.id}/seat-map")
+        assert response.status_code == status.HTTP_200_OK
+        assert response.json() == {
+            "showtime_id": showtime.id,
+            "version": 0,
+            "seats": "A:3./B:3.",
+        }
+
+        headers = {
+            "Authorization": f"Bearer {create_access_token(data={'sub': user.username})}"
+        }
+        response = client.post(
+            "/reservations/",
+            json={"showtime_id": showtime.id, "seat_ids": [seats[1].id, seats[4].id]},
+            headers=headers,
+        )
+        assert response.status_code == status.HTTP_201_CREATED
+        reservation_id = response.json()[0]["id"]
+
+        response = client.get(f"/showtimes/{showtime.id}/seat-map/delta?since=0")
+        assert response.json() == {
+            "showtime_id": showtime.id,
+            "version": 1,
+            "since": 0,
+            "changes": "A:2x,B:2x",
+        }
+
+        client.delete(f"/reservations/{reservation_id}", headers=headers)
+
+        response = client.get(f"/showtimes/{showtime.id}/seat-map/delta?since=1")
+        assert response.json()["version"] == 2
+        assert response.json()["changes"] == "A:2."
+
+        response = client.get(f"/showtimes/{showtime.id}/seat-map/delta?since=2")
+        assert response.json()["changes"] == ""
+
+        response = client.get(f"/showtimes/{showtime.id}/seat-map")
+        assert response.json()["seats"] == "A:3./B:.x."
+
+    def test_seat_map_delta_errors(self, client, db_session):
+        """Тест ошибок схемы зала"""
+        response = client.get("/showtimes/999/seat-map")
+        assert response.status_code == status.HTTP_404_NOT_FOUND
+
+        movie = Movie(title="Test Movie", genre="Action", duration_minutes=120)
+        db_session.add(movie)
+        db_session.commit()
+        showtime = Showtime(
+            movie_id=movie.id,
+            start_time=datetime.utcnow() + timedelta(days=1),
+            hall_number=1,
+            price=Decimal("15.50"),
+            total_seats=0,
+        )
+        db_session.add(showtime)
+        db_session.commit()
+
+        response = client.get(f"/showtimes/{showtime.id}/seat-map/delta?since=5")
+        assert response.status_code == status.HTTP_409_CONFLICT
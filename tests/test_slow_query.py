@@ -0,0 +1,92 @@
+import logging
+from datetime import datetime, timedelta
+from decimal import Decimal
+from app.config import settings
+from app.models.movie import Movie
+from app.models.showtime import Showtime
+from app.models.seat import Seat
+from app.slow_query import full_table_scans, parameter_shape
+
+
+class TestSlowQueryLog:
+    """Тесты для журнала медленных запросов"""
+
+    def _seed(self, db_session):
+        movie = Movie(title="Test Movie", genre="Action", duration_minutes=120)
+        db_session.add(movie)
+        db_session.commit()
+        showtime = Showtime(
+            movie_id=movie.id,
+            start_time=datetime.utcnow() + timedelta(days=1),
+            hall_number=1,
+            price=Decimal("10.00"),
+        )
+        db_session.add(showtime)
+        db_session.commit()
+        db_session.add(Seat(showtime_id=showtime.id, row="A", number=1))
+        db_session.commit()
+
+    def test_parameter_shape(self):
+        """Тест описания параметров без их значений"""
+        assert parameter_shape((1, "A", None)) == "(int, str, NoneType)"
+        assert parameter_shape({"id": 5}) == "{id: int}"
+        assert parameter_shape([(1, "a"), (2, "b")], executemany=True) == (
+            "2 x (int, str)"
+        )
+
+    def test_full_table_scans(self):
+        """Тест распознавания полного сканирования таблиц"""
+        assert full_table_scans(["SCAN seats"]) == ["seats"]
+        assert full_table_scans(["SCAN TABLE reservations"]) == ["reservations"]
+        assert full_table_scans(["SCAN seats USING COVERING INDEX ix"]) == []
+        assert full_table_scans(["SEARCH seats USING INDEX ix (showtime_id=?)"]) == []
+        assert full_table_scans(["SCAN movies"]) == []
+
+    def test_slow_query_logged_with_plan(self, db_session, caplog, monkeypatch):
+        """Тест записи медленного запроса с планом выполнения"""
+        self._seed(db_session)
+        monkeypatch.setattr(settings, "SLOW_QUERY_THRESHOLD_MS", 0)
+
+        with caplog.at_level(logging.WARNING, logger="app.slow_query"):
+            db_session.query(Seat).filter(Seat.row == "A").all()
+
+        record = next(r for r in caplog.records if "FROM seats" in r.getMessage())
+        assert record.full_scans == ["seats"]
+        assert "FULL SCAN: seats" in record.getMessage()
+        assert "(str)" in record.getMessage()
+
+    def test_indexed_query_not_flagged(self, db_session, caplog, monkeypatch):
+        """Тест отсутствия пометки для индексного поиска"""
+        self._seed(db_session)
+        monkeypatch.setattr(settings, "SLOW_QUERY_THRESHOLD_MS", 0)
+
+        with caplog.at_level(logging.WARNING, logger="app.slow_query"):
+            db_session.query(Seat).filter(
+                Seat.showtime_id == 1, Seat.is_reserved == False
+            ).all()
+
+        record = next(r for r in caplog.records if "FROM seats" in r.getMessage())
+        assert record.full_scans == []
+        assert any("ix_seats_showtime_id_is_reserved" in d for d in record.query_plan)
+
+    def test_fast_queries_not_logged(self, db_session, caplog, monkeypatch):
+        """Тест отсутствия записей для быстрых запросов"""
+        monkeypatch.setattr(settings, "SLOW_QUERY_THRESHOLD_MS", 10_000)
+
+        with caplog.at_level(logging.WARNING, logger="app.slow_query"):
+            db_session.query(Seat).all()
+
+        assert caplog.records == []
+
+    def test_route_recorded(self, client, db_session, caplog, monkeypatch):
+        """Тест указания маршрута, выполнившего запрос"""
+        self._seed(db_session)
+        monkeypatch.setattr(settings, "SLOW_QUERY_THRESHOLD_MS", 0)
+
+        with caplog.at_level(logging.WARNING, logger="app.slow_query"):
+            client.get("/showtimes/1/available-seats")
+
+        assert any(
+            r.route == "GET /showtimes/{showtime_id}/available-seats"
+            for r in caplog.records
+        )
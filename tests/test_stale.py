@@ -0,0 +1,136 @@
+import time
+from types import SimpleNamespace
+import pytest
+from fastapi import Response
+from sqlalchemy.exc import OperationalError
+from app.cache import cache
+from app.database import LazySession, pool_exhausted
+from app.invalidation import invalidation_bus
+from app.services.movie_service import MovieService
+from app.stale import STALE_HEADER, public_reads
+
+
+@pytest.fixture
+def short_fresh_ttl(monkeypatch):
+    monkeypatch.setattr(public_reads, "fresh_ttl", 0.05)
+
+
+def wait_for_refresh():
+    deadline = time.monotonic() + 5
+    while public_reads.stats()["refreshing"] and time.monotonic() < deadline:
+        time.sleep(0.01)
+
+
+def pool_exhausted_session(self):
+    raise pool_exhausted()
+
+
+class TestStaleWhileRevalidate:
+    """Тесты для выдачи устаревших ответов при обновлении и перегрузке БД"""
+
+    def test_expired_response_is_served_stale_and_refreshed(
+        self, client, db_session, short_fresh_ttl, create_movie
+    ):
+        """Тест фонового обновления после истечения свежести"""
+        create_movie("First", "Drama", 90)
+        fresh = client.get("/movies/")
+        assert STALE_HEADER not in fresh.headers
+
+        time.sleep(0.06)
+        create_movie("Second", "Drama", 90)
+        refreshes = public_reads.refreshes
+
+        stale = client.get("/movies/")
+        assert stale.headers[STALE_HEADER] == "0"
+        assert [m["title"] for m in stale.json()] == ["First"]
+
+        wait_for_refresh()
+        assert public_reads.refreshes == refreshes + 1
+        refreshed = client.get("/movies/")
+        assert STALE_HEADER not in refreshed.headers
+        assert len(refreshed.json()) == 2
+
+    def test_fresh_hit_skips_the_pool(
+        self, client, db_session, monkeypatch, create_movie
+    ):
+        """Тест ответа из кэша без получения соединения"""
+        movie = create_movie("Cached", "Drama", 90)
+        client.get(f"/movies/{movie.id}")
+
+        monkeypatch.setattr(LazySession, "get", pool_exhausted_session)
+        response = client.get(f"/movies/{movie.id}")
+
+        assert response.status_code == 200
+        assert STALE_HEADER not in response.headers
+
+    def test_changed_data_is_reloaded_inline(self, client, db_session, create_movie):
+        """Тест перезагрузки после события изменения"""
+        movie = create_movie("Before", "Drama", 90)
+        client.get(f"/movies/{movie.id}")
+
+        movie.title = "After"
+        invalidation_bus.publish(db_session, "movies", movie.id)
+        db_session.commit()
+
+        response = client.get(f"/movies/{movie.id}")
+        assert response.json()["title"] == "After"
+        assert STALE_HEADER not in response.headers
+
+    def test_unavailable_database_serves_last_good_response(
+        self, client, db_session, monkeypatch, create_movie
+    ):
+        """Тест деградированного режима при исчерпании пула"""
+        create_movie("First", "Drama", 90)
+        client.get("/movies/")
+        invalidation_bus.publish(db_session, "movies", None)
+        db_session.commit()
+        degraded = public_reads.degraded
+
+        monkeypatch.setattr(LazySession, "get", pool_exhausted_session)
+        response = client.get("/movies/")
+
+        assert response.status_code == 200
+        assert STALE_HEADER in response.headers
+        assert public_reads.degraded == degraded + 1
+
+        uncached = client.get("/movies/schedule")
+        assert uncached.status_code == 503
+
+    def test_locked_database_serves_last_good_response(
+        self, client, db_session, monkeypatch, create_movie
+    ):
+        """Тест деградированного режима при блокировке базы"""
+        movie = create_movie("Locked", "Drama", 90)
+        client.get(f"/movies/{movie.id}")
+        invalidation_bus.publish(db_session, "movies", movie.id)
+        db_session.commit()
+
+        def locked(db, movie_id):
+            raise OperationalError("SELECT", {}, Exception("database is locked"))
+
+        monkeypatch.setattr(MovieService, "load_movie", locked)
+        response = client.get(f"/movies/{movie.id}")
+
+        assert response.json()["title"] == "Locked"
+        assert STALE_HEADER in response.headers
+
+    def test_not_found_is_not_masked(self, client, db_session):
+        """Тест передачи ошибок запроса без подмены"""
+        assert client.get("/movies/999").status_code == 404
+
+    def test_load_overtaken_by_change_event_is_not_kept(self):
+        """Тест отбрасывания ответа, загруженного до события изменения"""
+        calls = []
+
+        def loader(db):
+            calls.append(1)
+            if len(calls) == 1:
+                cache.invalidate_tags("movies")
+            return len(calls)
+
+        db = SimpleNamespace(get=lambda: None, factory=None)
+
+        assert public_reads.get(db, Response(), "race", loader, ("movies",)) == 1
+        assert public_reads.get(db, Response(), "race", loader, ("movies",)) == 2
+        assert public_reads.get(db, Response(), "race", loader, ("movies",)) == 2
+        assert len(calls) == 2